@@ -2,18 +2,28 @@
 Functions to analyze ticker data with indicators and produce buy and sell signals
 """
 import logging
+from collections import OrderedDict
 from datetime import timedelta
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Tuple
 
 import arrow
-from pandas import DataFrame, to_datetime
+import numpy as np
+from pandas import DataFrame, concat, to_datetime
 
 from freqtrade.exchange import get_ticker_history
 from freqtrade.strategy.strategy import Strategy
 
 logger = logging.getLogger(__name__)
 
+# Last analyzed candle time and dataframe per pair, used by analyze_ticker_incremental()
+_ANALYZED_TICKERS: Dict[str, Tuple[str, DataFrame]] = {}
+
+
+# Keys of a candle returned by the exchange and their column in the parsed DataFrame
+TICKER_COLUMNS = {'C': 'close', 'V': 'volume', 'O': 'open', 'H': 'high', 'L': 'low', 'T': 'date'}
+_TICKER_KEYS = set(TICKER_COLUMNS) | {'BV'}
+
 
 class SignalType(Enum):
     """ Enum to distinguish between buy and sell signals """
@@ -23,13 +33,59 @@ class SignalType(Enum):
 
 def parse_ticker_dataframe(ticker: list) -> DataFrame:
     """
-    Analyses the trend for the given ticker history
+    Analyses the trend for the given ticker history.
+    Candle lists as returned by the exchange are read straight into typed column arrays,
+    other inputs are parsed by parse_ticker_dataframe_legacy()
+    :param ticker: See exchange.get_ticker_history
+    :return: DataFrame
+    """
+    if isinstance(ticker, list) and ticker and set(ticker[0]) <= _TICKER_KEYS:
+        try:
+            return _parse_ticker_columns(ticker)
+        except (TypeError, ValueError, KeyError):
+            pass
+    return parse_ticker_dataframe_legacy(ticker)
+
+
+def _parse_ticker_columns(ticker: List[Dict]) -> DataFrame:
+    """
+    Fast path of parse_ticker_dataframe()
+    :param ticker: list of candles with the keys of TICKER_COLUMNS
+    :return: DataFrame
+    """
+    first_date = ticker[0]['T']
+    if first_date.endswith('Z') or '+' in first_date:
+        raise ValueError('Timezone aware timestamps are not supported')
+    # Timestamps are ISO 8601 strings in UTC, parsed by numpy without format inference
+    dates = np.array([row['T'] for row in ticker], dtype='datetime64[ms]')
+
+    # Sorting is only needed if the candles are not in chronological order
+    index = None
+    if (dates[1:] < dates[:-1]).any():
+        index = np.argsort(dates, kind='mergesort')
+        dates = dates[index]
+        ticker = [ticker[position] for position in index]
+
+    # Same column order as the legacy parser
+    columns = OrderedDict()
+    for key in sorted(set(ticker[0]) - {'BV'}):
+        if key == 'T':
+            columns['date'] = to_datetime(dates.astype('datetime64[ns]'), utc=True)
+        else:
+            columns[TICKER_COLUMNS[key]] = np.fromiter((row[key] for row in ticker),
+                                                       dtype=np.float64, count=len(ticker))
+    return DataFrame(columns, index=index)
+
+
+def parse_ticker_dataframe_legacy(ticker: list) -> DataFrame:
+    """
+    Parses any ticker history accepted by DataFrame(), inferring its date format.
+    Kept as reference implementation for parse_ticker_dataframe()
     :param ticker: See exchange.get_ticker_history
     :return: DataFrame
     """
-    columns = {'C': 'close', 'V': 'volume', 'O': 'open', 'H': 'high', 'L': 'low', 'T': 'date'}
     frame = DataFrame(ticker) \
-        .rename(columns=columns)
+        .rename(columns=TICKER_COLUMNS)
     if 'BV' in frame:
         frame.drop('BV', 1, inplace=True)
     frame['date'] = to_datetime(frame['date'], utc=True, infer_datetime_format=True)
@@ -82,6 +138,41 @@ def analyze_ticker(ticker_history: List[Dict]) -> DataFrame:
     return dataframe
 
 
+def analyze_ticker_incremental(pair: str, ticker_history: List[Dict]) -> DataFrame:
+    """
+    Same as analyze_ticker(), but reuses the dataframe analyzed for the pair during the
+    previous call. Only the new candles, preceded by the warm-up window declared by the
+    strategy (warmup_candles), are parsed and populated again.
+    Falls back to a full analysis when the strategy does not declare warmup_candles or when
+    the ticker history does not overlap the previous dataframe.
+    :param pair: pair in format BTC_ANT or BTC-ANT
+    :param ticker_history: See exchange.get_ticker_history
+    :return DataFrame with ticker data and indicator data
+    """
+    warmup = Strategy().warmup_candles
+    if not warmup:
+        return analyze_ticker(ticker_history)
+
+    start = -1
+    if pair in _ANALYZED_TICKERS:
+        # The last analyzed candle may have been updated since, so it is analyzed again
+        last_tick, previous = _ANALYZED_TICKERS[pair]
+        start = next((index for index in range(len(ticker_history) - 1, -1, -1)
+                      if ticker_history[index]['T'] == last_tick), -1)
+
+    if start < warmup:
+        logger.debug('Full analysis of the ticker history for pair %s', pair)
+        dataframe = analyze_ticker(ticker_history).reset_index(drop=True)
+    else:
+        logger.debug('Analyzing %s new candle(s) for pair %s', len(ticker_history) - start, pair)
+        window = analyze_ticker(ticker_history[start - warmup:]).reset_index(drop=True)
+        dataframe = concat([previous.iloc[:-1], window.iloc[warmup:]], ignore_index=True)
+        dataframe = dataframe.iloc[-len(ticker_history):].reset_index(drop=True)
+
+    _ANALYZED_TICKERS[pair] = (ticker_history[-1]['T'], dataframe)
+    return dataframe
+
+
 # FIX: Maybe return False, if an error has occured,
 #      Otherwise we might mask an error as an non-signal-scenario
 def get_signal(pair: str, interval: int) -> (bool, bool):
@@ -96,7 +187,7 @@ def get_signal(pair: str, interval: int) -> (bool, bool):
         return (False, False)  # return False ?
 
     try:
-        dataframe = analyze_ticker(ticker_hist)
+        dataframe = analyze_ticker_incremental(pair, ticker_hist)
     except ValueError as ex:
         logger.warning('Unable to analyze ticker for pair %s: %s', pair, str(ex))
         return (False, False)  # return False ?
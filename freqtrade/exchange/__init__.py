@@ -2,12 +2,12 @@
 """ Cryptocurrency Exchanges support """
 import enum
 import logging
+import time
 from random import randint
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 import arrow
 import requests
-from cachetools import cached, TTLCache
 
 from freqtrade import OperationalException
 from freqtrade.exchange.bittrex import Bittrex
@@ -22,6 +22,17 @@ _CONF: dict = {}
 # Holds all open sell orders for dry_run
 _DRY_RUN_OPEN_ORDERS: Dict[str, Any] = {}
 
+# Holds the candle history per (pair, tick_interval) and its maximum length,
+# new candles are appended on every refresh
+_TICKER_HISTORY: Dict[Tuple[str, int], List[Dict]] = {}
+_TICKER_HISTORY_SIZE: Dict[Tuple[str, int], int] = {}
+
+# Tickers of all markets, taken once per loop iteration by refresh_tickers()
+_TICKER_SNAPSHOT: Dict[str, Any] = {'time': 0.0, 'tickers': {}}
+
+# Default maximum age in seconds of the ticker snapshot
+_TICKER_SNAPSHOT_MAX_AGE = 10
+
 
 class Exchanges(enum.Enum):
     """
@@ -135,12 +146,89 @@ def get_balances():
 
 
 def get_ticker(pair: str, refresh: Optional[bool] = True) -> dict:
+    """
+    Returns the ticker of the given pair from the snapshot taken by refresh_tickers().
+    The pair is queried on its own if it is missing from the snapshot or if the
+    snapshot is older than internals.max_ticker_age seconds.
+    :param pair: Pair as str, format: BTC_ETC
+    :param refresh: Shall we query a new value or a cached value is enough
+    :return: dict, see Exchange.get_ticker
+    """
+    snapshot = _TICKER_SNAPSHOT
+    max_age = _CONF.get('internals', {}).get('max_ticker_age', _TICKER_SNAPSHOT_MAX_AGE)
+    ticker = snapshot['tickers'].get(pair)
+    if ticker and time.time() - snapshot['time'] <= max_age:
+        return ticker
     return _API.get_ticker(pair, refresh)
 
 
-@cached(TTLCache(maxsize=100, ttl=30))
+def refresh_tickers() -> None:
+    """
+    Takes a snapshot of the tickers of all markets with a single request.
+    get_ticker() serves the snapshot until the next refresh.
+    :return: None
+    """
+    global _TICKER_SNAPSHOT
+    try:
+        tickers = _API.get_tickers()
+    except (requests.exceptions.RequestException, OperationalException) as error:
+        logger.warning('Unable to refresh tickers, querying them per pair. Reason: %s', error)
+        tickers = {}
+    _TICKER_SNAPSHOT = {'time': time.time(), 'tickers': tickers}
+
+
 def get_ticker_history(pair: str, tick_interval) -> List[Dict]:
-    return _API.get_ticker_history(pair, tick_interval)
+    """
+    Returns the candle history for the given pair.
+    The full history is only downloaded on the first call, or once the last stored
+    candle has closed: it may have been fetched while still open, and its final values
+    are only in the full history. While it is open, only the latest candles are fetched
+    and merged into the stored history. On Bittrex, which only returns the open candle,
+    the incremental path thus serves the refreshes within a candle (sell signals and
+    open trade checks), the buy evaluation after each candle close downloads the history.
+    Candles older than internals.max_ticker_history (default: the size of the
+    last full download) are evicted.
+    :param pair: Pair as str, format: BTC_ETC
+    :param tick_interval: ticker interval in minutes
+    :return: list, see Exchange.get_ticker_history
+    """
+    key = (pair, tick_interval)
+    history = _TICKER_HISTORY.get(key)
+
+    latest = None
+    if history and arrow.get(history[-1]['T']).shift(minutes=tick_interval) > arrow.utcnow():
+        latest = _API.get_latest_ticker_history(pair, tick_interval)
+        if latest and latest[0]['T'] > history[-1]['T']:
+            # The exchange closed the last stored candle earlier than the clock
+            latest = None
+
+    if latest is not None:
+        history = merge_ticker_history(history, latest)
+    else:
+        history = _API.get_ticker_history(pair, tick_interval)
+        _TICKER_HISTORY_SIZE[key] = len(history)
+
+    max_size = _CONF.get('internals', {}).get('max_ticker_history') or _TICKER_HISTORY_SIZE[key]
+    _TICKER_HISTORY[key] = history[-max_size:]
+    return list(_TICKER_HISTORY[key])
+
+
+def merge_ticker_history(history: List[Dict], new_ticks: List[Dict]) -> List[Dict]:
+    """
+    Appends new candles to a sorted candle history.
+    Stored candles with a timestamp equal to or newer than the first new candle
+    are replaced, so the still open candle gets updated.
+    :param history: sorted list of candles
+    :param new_ticks: sorted list of candles
+    :return: merged list of candles
+    """
+    if not new_ticks:
+        return history
+    first = new_ticks[0]['T']
+    index = len(history)
+    while index > 0 and history[index - 1]['T'] >= first:
+        index -= 1
+    return history[:index] + new_ticks
 
 
 def cancel_order(order_id: str) -> None:
@@ -161,6 +249,18 @@ def get_order(order_id: str) -> Dict:
     return _API.get_order(order_id)
 
 
+def get_open_orders() -> Dict[str, Dict]:
+    """
+    Returns all open orders, fetched with a single request
+    :return: dict with the order id as key and the order as value, see get_order()
+    """
+    if _CONF['dry_run']:
+        # Dry run orders are filled immediately
+        return {}
+
+    return {str(order['id']): order for order in _API.get_open_orders()}
+
+
 def get_pair_detail_url(pair: str) -> str:
     return _API.get_pair_detail_url(pair)
 
@@ -3,10 +3,13 @@ from typing import Dict, List, Optional
 
 from bittrex.bittrex import Bittrex as _Bittrex
 from bittrex.bittrex import API_V1_1, API_V2_0
+from requests.compat import urlparse
 from requests.exceptions import ContentDecodingError
 
 from freqtrade import OperationalException
 from freqtrade.exchange.interface import Exchange
+from freqtrade.exchange.rate_limiter import RateLimiter
+from freqtrade.exchange.session import PooledSession, create_session
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +17,23 @@ _API: _Bittrex = None
 _API_V2: _Bittrex = None
 _EXCHANGE_CONF: dict = {}
 
+# Shared by the v1.1 and v2.0 clients, public and private endpoints alike
+_RATE_LIMITER: RateLimiter = None
+_SESSION: PooledSession = None
+
+
+def _dispatch(request_url: str, apisign: str) -> Dict:
+    """
+    Waits for the shared rate limiter before sending the request
+    through the shared HTTP session
+    :param request_url: fully-formed URL to request
+    :param apisign: signature of the request
+    :return: JSON response from Bittrex
+    """
+    endpoint = urlparse(request_url).path.rstrip('/').rsplit('/', 1)[-1]
+    _RATE_LIMITER.acquire(endpoint)
+    return _SESSION.get(request_url, headers={'apisign': apisign}).json()
+
 
 class Bittrex(Exchange):
     """
@@ -23,20 +43,35 @@ class Bittrex(Exchange):
     BASE_URL: str = 'https://www.bittrex.com'
     PAIR_DETAIL_METHOD: str = BASE_URL + '/Market/Index'
 
+    # Default rate limit, shared by all endpoints
+    CALLS_PER_SECOND: float = 2
+    BURST: float = 4
+
     def __init__(self, config: dict) -> None:
-        global _API, _API_V2, _EXCHANGE_CONF
+        global _API, _API_V2, _EXCHANGE_CONF, _RATE_LIMITER, _SESSION
 
         _EXCHANGE_CONF.update(config)
+        _SESSION = create_session(_EXCHANGE_CONF)
+        rate_limit = _EXCHANGE_CONF.get('rate_limit', {})
+        _RATE_LIMITER = RateLimiter(
+            rate=rate_limit.get('calls_per_second', self.CALLS_PER_SECOND),
+            capacity=rate_limit.get('burst', self.BURST),
+            weights=rate_limit.get('weights'),
+        )
+        # Requests are throttled by _RATE_LIMITER in _dispatch(),
+        # the clients must not wait on their own
         _API = _Bittrex(
             api_key=_EXCHANGE_CONF['key'],
             api_secret=_EXCHANGE_CONF['secret'],
-            calls_per_second=1,
+            calls_per_second=float('inf'),
+            dispatch=_dispatch,
             api_version=API_V1_1,
         )
         _API_V2 = _Bittrex(
             api_key=_EXCHANGE_CONF['key'],
             api_secret=_EXCHANGE_CONF['secret'],
-            calls_per_second=1,
+            calls_per_second=float('inf'),
+            dispatch=_dispatch,
             api_version=API_V2_0,
         )
         self.cached_ticker = {}
@@ -120,22 +155,39 @@ class Bittrex(Exchange):
             }
         return self.cached_ticker[pair]
 
-    def get_ticker_history(self, pair: str, tick_interval: int) -> List[Dict]:
+    def get_tickers(self) -> Dict[str, Dict]:
+        return {
+            summary['MarketName'].replace('-', '_'): {
+                'bid': float(summary['Bid']),
+                'ask': float(summary['Ask']),
+                'last': float(summary['Last']),
+            }
+            for summary in self.get_market_summaries()
+            if all(summary.get(key) is not None for key in ['Bid', 'Ask', 'Last'])
+        }
+
+    @staticmethod
+    def _get_interval_name(tick_interval: int) -> str:
+        """
+        Converts the ticker interval in minutes into the bittrex notation
+        """
         if tick_interval == 1:
-            interval = 'oneMin'
+            return 'oneMin'
         elif tick_interval == 5:
-            interval = 'fiveMin'
+            return 'fiveMin'
         elif tick_interval == 30:
-            interval = 'thirtyMin'
+            return 'thirtyMin'
         elif tick_interval == 60:
-            interval = 'hour'
+            return 'hour'
         elif tick_interval == 1440:
-            interval = 'Day'
-        else:
-            raise ValueError('Cannot parse tick_interval: {}'.format(tick_interval))
-
-        data = _API_V2.get_candles(pair.replace('_', '-'), interval)
+            return 'Day'
+        raise ValueError('Cannot parse tick_interval: {}'.format(tick_interval))
 
+    @staticmethod
+    def _validate_candles(data: Dict, pair: str) -> List[Dict]:
+        """
+        Validates a candle response and returns the candles
+        """
         # These sanity check are necessary because bittrex cannot keep their API stable.
         if not data.get('result'):
             raise ContentDecodingError('{message} params=({pair})'.format(
@@ -157,6 +209,16 @@ class Bittrex(Exchange):
 
         return data['result']
 
+    def get_ticker_history(self, pair: str, tick_interval: int) -> List[Dict]:
+        interval = Bittrex._get_interval_name(tick_interval)
+        data = _API_V2.get_candles(pair.replace('_', '-'), interval)
+        return Bittrex._validate_candles(data, pair)
+
+    def get_latest_ticker_history(self, pair: str, tick_interval: int) -> List[Dict]:
+        interval = Bittrex._get_interval_name(tick_interval)
+        data = _API_V2.get_latest_candle(pair.replace('_', '-'), interval)
+        return Bittrex._validate_candles(data, pair)
+
     def get_order(self, order_id: str) -> Dict:
         data = _API.get_order(order_id)
         if not data['success']:
@@ -176,6 +238,22 @@ class Bittrex(Exchange):
             'closed': data['Closed'],
         }
 
+    def get_open_orders(self) -> List[Dict]:
+        data = _API.get_open_orders()
+        if not data['success']:
+            Bittrex._validate_response(data)
+            raise OperationalException('{message}'.format(message=data['message']))
+        return [{
+            'id': order['OrderUuid'],
+            'type': order['OrderType'],
+            'pair': order['Exchange'].replace('-', '_'),
+            'opened': order['Opened'],
+            'rate': order['PricePerUnit'],
+            'amount': order['Quantity'],
+            'remaining': order['QuantityRemaining'],
+            'closed': order['Closed'],
+        } for order in data['result']]
+
     def cancel_order(self, order_id: str) -> None:
         data = _API.cancel(order_id)
         if not data['success']:
@@ -7,6 +7,8 @@ from requests.exceptions import ContentDecodingError
 
 from freqtrade import OperationalException
 from freqtrade.exchange.interface import Exchange
+from freqtrade.exchange.rate_limiter import RateLimiter
+from freqtrade.exchange.session import create_session
 
 import time
 
@@ -15,6 +17,9 @@ logger = logging.getLogger(__name__)
 _API: _Cryptopia = None
 _EXCHANGE_CONF: dict = {}
 
+# Order types of Cryptopia, as named by the other exchanges
+_ORDER_TYPES = {'Buy': 'LIMIT_BUY', 'Sell': 'LIMIT_SELL'}
+
 class Cryptopia(Exchange):
     """
     Cryptopia API wrapper.
@@ -24,15 +29,40 @@ class Cryptopia(Exchange):
     def __init__(self, config: dict) -> None:
         global _API, _API_V2, _EXCHANGE_CONF
         _EXCHANGE_CONF.update(config)
+        rate_limit = _EXCHANGE_CONF.get('rate_limit', {})
+        # Shared by the public and private endpoints
+        rate_limiter = RateLimiter(
+            rate=rate_limit.get('calls_per_second', 1),
+            capacity=rate_limit.get('burst', 1),
+            weights=rate_limit.get('weights'),
+        )
         _API = _Cryptopia(
-            api_key = _EXCHANGE_CONF['key'],
-            api_secret = _EXCHANGE_CONF['secret'],
-            calls_per_second = 1
-            )
+            api_key=_EXCHANGE_CONF['key'],
+            api_secret=_EXCHANGE_CONF['secret'],
+            calls_per_second=1,
+            rate_limiter=rate_limiter,
+            session=create_session(_EXCHANGE_CONF)
+        )
         self.cached_ticker = {}
         self.cached_pair_id = {}
         self.open_order = {}
     @staticmethod
+    def _parse_open_order(order: Dict) -> Dict:
+        """
+        Formats an order of the OpenOrders endpoint, see Exchange.get_order
+        """
+        return {
+            'id': order['OrderId'],
+            'type': _ORDER_TYPES.get(order['Type'], order['Type']),
+            'pair': order['Market'],
+            'opened': order['TimeStamp'],
+            'rate': order['Rate'],
+            'amount': order['Amount'],
+            'remaining': order['Remaining'],
+            'closed': False
+        }
+
+    @staticmethod
     def _validate_response(response) -> None:
         """
         Validates the given cryptopia response
@@ -173,16 +203,7 @@ class Cryptopia(Exchange):
         oid = int(order_id)
         for order in open_order['Data']:
             if order['OrderId'] == oid:
-                return {
-                    'id': order['OrderId'],
-                    'type': order['Type'],
-                    'pair': order['Market'],
-                    'opened': True,
-                    'rate': order['Rate'],
-                    'amount': order['Amount'],
-                    'remaining': order['Remaining'],
-                    'closed': False
-                }
+                return Cryptopia._parse_open_order(order)
         for order in hist_order['Data']:
             if order['TradeId'] == oid:
                 return {
@@ -196,6 +217,13 @@ class Cryptopia(Exchange):
                     'closed': True
                 }
 
+    def get_open_orders(self) -> List[Dict]:
+        data = _API.get_openorders('')
+        if not data['Success']:
+            Cryptopia._validate_response(data)
+            raise OperationalException('{message}'.format(message=data['Error']))
+        return [Cryptopia._parse_open_order(order) for order in data['Data']]
+
     def query_currency_id(self, currency):
         if currency in self.cached_pair_id:
             return self.cached_pair_id[currency]
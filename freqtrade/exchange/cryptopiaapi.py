@@ -11,13 +11,17 @@ import requests
 # using requests.compat to wrap urlparse (python cross compatibility over 9000!!!)
 from requests.compat import quote_plus
 
+from freqtrade.exchange.rate_limiter import RateLimiter
+from freqtrade.exchange.session import PooledSession
+
 class Api(object):
     """ Represents a wrapper for cryptopia API """
 
-    def __init__(self, api_key, api_secret, calls_per_second):
+    def __init__(self, api_key, api_secret, calls_per_second, rate_limiter=None, session=None):
         self.key = api_key
         self.secret = api_secret
-        self.interval_call_secs = 1.0 / calls_per_second
+        self.rate_limiter = rate_limiter or RateLimiter(rate=calls_per_second, capacity=1)
+        self.session = session or PooledSession()
         self.public = ['GetCurrencies', 'GetTradePairs', 'GetMarkets',
                        'GetMarket', 'GetMarketHistory', 'GetMarketOrders', 'GetMarketOrderGroups']
         self.private = ['GetBalance', 'GetDepositAddress', 'GetOpenOrders',
@@ -27,12 +31,12 @@ class Api(object):
 
     def api_query(self, feature_requested, get_parameters=None, post_parameters=None):
         """ Performs a generic api request """
-        time.sleep(self.interval_call_secs)
+        self.rate_limiter.acquire(feature_requested)
         if feature_requested in self.private:
             url = "https://www.cryptopia.co.nz/Api/" + feature_requested
             post_data = json.dumps(post_parameters)
             headers = self.secure_headers(url=url, post_data=post_data)
-            req = requests.post(url, data=post_data, headers=headers)
+            req = self.session.post(url, data=post_data, headers=headers)
             if req.status_code != 200:
                 try:
                     req.raise_for_status()
@@ -44,7 +48,7 @@ class Api(object):
             url = "https://www.cryptopia.co.nz/Api/" + feature_requested + "/" + \
                   ('/'.join(i for i in get_parameters.values()
                            ) if get_parameters is not None else "")
-            req = requests.get(url, params=get_parameters)
+            req = self.session.get(url, params=get_parameters)
             if req.status_code != 200:
                 try:
                     req.raise_for_status()
@@ -56,7 +60,7 @@ class Api(object):
             url = "https://www.cryptopia.co.nz/Exchange/{}?tradePairId={}&dataRange={}&dataGroup={}&_={}".format(
                 feature_requested, get_parameters['tradePairId'], get_parameters['dataRange'],\
                 get_parameters['dataGroup'], get_parameters['_'])
-            req = requests.get(url)
+            req = self.session.get(url)
             if req.status_code != 200:
                 try:
                     req.raise_for_status()
@@ -74,6 +74,22 @@ class Exchange(ABC):
         }
         """
 
+    def get_tickers(self) -> Dict[str, Dict]:
+        """
+        Gets the tickers of all markets with a single request.
+        Exchanges without a bulk endpoint return an empty dict,
+        tickers are then queried per pair with get_ticker().
+        :return: dict, format: {
+            'BTC_ETC': {
+                'bid': float,
+                'ask': float,
+                'last': float
+            },
+            ...
+        }
+        """
+        return {}
+
     @abstractmethod
     def get_ticker_history(self, pair: str, tick_interval: int) -> List[Dict]:
         """
@@ -94,6 +110,16 @@ class Exchange(ABC):
         ]
         """
 
+    def get_latest_ticker_history(self, pair: str, tick_interval: int) -> List[Dict]:
+        """
+        Gets the most recent candles for given pair.
+        Exchanges without a dedicated endpoint return the whole ticker history.
+        :param pair: Pair as str, format: BTC_ETC
+        :param tick_interval: ticker interval in minutes
+        :return: list, see get_ticker_history()
+        """
+        return self.get_ticker_history(pair, tick_interval)
+
     def get_order(self, order_id: str) -> Dict:
         """
         Get order details for the given order_id.
@@ -110,6 +136,15 @@ class Exchange(ABC):
         }
         """
 
+    def get_open_orders(self) -> List[Dict]:
+        """
+        Gets all open orders with a single request.
+        Exchanges without a bulk endpoint return an empty list,
+        orders are then queried one by one with get_order().
+        :return: list of orders, see get_order()
+        """
+        return []
+
     @abstractmethod
     def cancel_order(self, order_id: str) -> None:
         """
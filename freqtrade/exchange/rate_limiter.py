@@ -0,0 +1,65 @@
+"""
+Token bucket rate limiter shared by the API clients of an exchange
+"""
+import logging
+import threading
+import time
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class RateLimiter(object):
+    """
+    Thread-safe token bucket.
+    Tokens are refilled at `rate` per second, up to `capacity` tokens (the burst).
+    Each request consumes the weight of its endpoint (default 1), endpoint names are
+    case-insensitive. When the bucket
+    does not hold enough tokens the caller sleeps until they are refilled; the
+    tokens are reserved beforehand, so concurrent callers are served in turn.
+    """
+
+    def __init__(self, rate: float, capacity: float,
+                 weights: Optional[Dict[str, float]] = None) -> None:
+        """
+        :param rate: tokens refilled per second
+        :param capacity: maximum number of tokens the bucket holds
+        :param weights: number of tokens consumed per endpoint (optional)
+        """
+        if rate <= 0 or capacity <= 0:
+            raise ValueError('rate and capacity must be greater than 0')
+        self.rate = rate
+        self.capacity = capacity
+        self.weights = {endpoint.lower(): weight for endpoint, weight in (weights or {}).items()}
+        self._tokens = capacity
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, weight: float) -> float:
+        """
+        Refills the bucket and reserves the given number of tokens
+        :param weight: number of tokens to reserve
+        :return: seconds to wait before the tokens are available
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity,
+                               self._tokens + (now - self._last_refill) * self.rate)
+            self._last_refill = now
+            self._tokens -= weight
+            return max(-self._tokens / self.rate, 0.0)
+
+    def acquire(self, endpoint: Optional[str] = None, weight: Optional[float] = None) -> float:
+        """
+        Blocks until a request to the given endpoint is allowed
+        :param endpoint: name of the endpoint, used to look up its weight (optional)
+        :param weight: number of tokens to consume, overrides the endpoint weight (optional)
+        :return: seconds spent waiting
+        """
+        if weight is None:
+            weight = self.weights.get((endpoint or '').lower(), 1.0)
+        wait = self._reserve(weight)
+        if wait > 0:
+            logger.debug('Rate limit reached, waiting %.2f seconds for %s', wait, endpoint)
+            time.sleep(wait)
+        return wait
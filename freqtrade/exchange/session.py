@@ -0,0 +1,47 @@
+"""
+HTTP connection pool shared by the API clients of an exchange
+"""
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+
+# Defaults used when the exchange config does not contain an 'http' section
+DEFAULT_POOL_SIZE = 10
+DEFAULT_TIMEOUT = 10
+
+
+class PooledSession(requests.Session):
+    """
+    requests.Session keeping up to `pool_size` connections open per host,
+    so consecutive and concurrent requests reuse them instead of paying a new
+    TCP and TLS handshake. Requests without an explicit timeout use `timeout`.
+    """
+
+    def __init__(self, pool_size: int = DEFAULT_POOL_SIZE, timeout: float = DEFAULT_TIMEOUT,
+                 keep_alive: bool = True) -> None:
+        super().__init__()
+        self.timeout = timeout
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        if not keep_alive:
+            self.headers['Connection'] = 'close'
+
+    def request(self, method: str, url: str, *args, **kwargs) -> Any:
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, *args, **kwargs)
+
+
+def create_session(exchange_config: dict) -> PooledSession:
+    """
+    Creates the HTTP session of an exchange from its config
+    :param exchange_config: exchange section of the config, see exchange.http
+    :return: PooledSession
+    """
+    http_config = exchange_config.get('http', {})
+    return PooledSession(
+        pool_size=http_config.get('pool_size', DEFAULT_POOL_SIZE),
+        timeout=http_config.get('timeout', DEFAULT_TIMEOUT),
+        keep_alive=http_config.get('keep_alive', True),
+    )
@@ -5,6 +5,7 @@ import logging
 import sys
 import time
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 
@@ -17,8 +18,9 @@ from freqtrade import (DependencyException, OperationalException, __version__,
 from freqtrade.analyze import get_signal
 from freqtrade.fiat_convert import CryptoToFiatConverter
 from freqtrade.misc import (State, get_state, load_config, parse_args,
-                            throttle, update_state)
+                            update_state)
 from freqtrade.persistence import Trade
+from freqtrade.scheduler import Scheduler
 from freqtrade.strategy.strategy import Strategy
 
 logger = logging.getLogger('freqtrade')
@@ -75,16 +77,48 @@ def process_maybe_execute_buy(interval: int) -> bool:
         return False
 
 
-def process_maybe_execute_sell(trade: Trade, interval: int) -> bool:
+def reconcile_orders() -> Dict[str, Dict]:
+    """
+    Fetches all open orders with a single request and returns the order of each trade
+    with an open_order_id. Orders missing from the result have been filled or cancelled
+    in the meantime, only those are queried one by one.
+    :return: dict with the order id as key and the order as value
+    """
+    trades = Trade.query.filter(Trade.open_order_id.isnot(None)).all()
+    if not trades:
+        return {}
+
+    open_orders = exchange.get_open_orders()
+    orders = {}
+    for trade in trades:
+        order = open_orders.get(trade.open_order_id)
+        if order is None:
+            try:
+                order = exchange.get_order(trade.open_order_id)
+            except requests.exceptions.RequestException:
+                logger.info('Cannot query order for %s due to %s', trade, traceback.format_exc())
+                continue
+        orders[trade.open_order_id] = order
+    return orders
+
+
+def process_maybe_execute_sell(trade: Trade, interval: int,
+                               orders: Optional[Dict[str, Dict]] = None) -> bool:
     """
     Tries to execute a sell trade
+    :param orders: orders returned by reconcile_orders() (optional).
+    If not set, the open order of the trade is queried
     :return: True if executed
     """
     # Get order details for actual price per unit
     if trade.open_order_id:
         # Update trade with order values
         logger.info('Got open order for %s', trade)
-        trade.update(exchange.get_order(trade.open_order_id))
+        if orders is not None and trade.open_order_id in orders:
+            order = orders[trade.open_order_id]
+        else:
+            order = exchange.get_order(trade.open_order_id)
+        trade.update(order)
 
     if trade.is_open and trade.open_order_id is None:
         # Check if we can sell our current pair
@@ -92,40 +126,51 @@ def process_maybe_execute_sell(trade: Trade, interval: int) -> bool:
     return False
 
 
-def _process(interval: int, nb_assets: Optional[int] = 0) -> bool:
+def _process(interval: int, nb_assets: Optional[int] = 0, buy: bool = True,
+             sell: bool = True) -> bool:
     """
     Queries the persistence layer for open trades and handles them,
     otherwise a new trade is created.
     :param: nb_assets: the maximum number of pairs to be traded at the same time
+    :param buy: look for buy opportunities
+    :param sell: handle the open trades and their timed out orders
     :return: True if one or more trades has been created or closed, False otherwise
     """
     state_changed = False
     try:
-        # Refresh whitelist based on wallet maintenance
-        sanitized_list = refresh_whitelist(
-            gen_pair_whitelist(
-                _CONF['stake_currency']
-            ) if nb_assets else _CONF['exchange']['pair_whitelist']
-        )
+        # Take the tickers of all markets with a single request
+        exchange.refresh_tickers()
+
+        if buy:
+            # Refresh whitelist based on wallet maintenance
+            sanitized_list = refresh_whitelist(
+                gen_pair_whitelist(
+                    _CONF['stake_currency']
+                ) if nb_assets else _CONF['exchange']['pair_whitelist']
+            )
 
-        # Keep only the subsets of pairs wanted (up to nb_assets)
-        final_list = sanitized_list[:nb_assets] if nb_assets else sanitized_list
-        _CONF['exchange']['pair_whitelist'] = final_list
+            # Keep only the subsets of pairs wanted (up to nb_assets)
+            final_list = sanitized_list[:nb_assets] if nb_assets else sanitized_list
+            _CONF['exchange']['pair_whitelist'] = final_list
 
         # Query trades from persistence layer
         trades = Trade.query.filter(Trade.is_open.is_(True)).all()
 
-        # First process current opened trades
-        for trade in trades:
-            state_changed |= process_maybe_execute_sell(trade, interval)
+        if sell:
+            # Fetch the open orders of all trades at once
+            orders = reconcile_orders()
+
+            # First process current opened trades
+            for trade in trades:
+                state_changed |= process_maybe_execute_sell(trade, interval, orders)
 
         # Then looking for buy opportunities
-        if len(trades) < _CONF['max_open_trades']:
+        if buy and len(trades) < _CONF['max_open_trades']:
             state_changed = process_maybe_execute_buy(interval)
 
-        if 'unfilledtimeout' in _CONF:
+        if sell and 'unfilledtimeout' in _CONF:
             # Check and handle any timed out open orders
-            check_handle_timedout(_CONF['unfilledtimeout'])
+            check_handle_timedout(_CONF['unfilledtimeout'], orders)
             Trade.session.flush()
 
     except (requests.exceptions.RequestException, json.JSONDecodeError) as error:
@@ -197,20 +242,30 @@ def handle_timedout_limit_sell(trade: Trade, order: Dict) -> bool:
     return False
 
 
-def check_handle_timedout(timeoutvalue: int) -> None:
+def check_handle_timedout(timeoutvalue: int, orders: Optional[Dict[str, Dict]] = None) -> None:
     """
     Check if any orders are timed out and cancel if neccessary
     :param timeoutvalue: Number of minutes until order is considered timed out
+    :param orders: orders returned by reconcile_orders() (optional).
+    If not set, the open order of each trade is queried
     :return: None
     """
     timeoutthreashold = arrow.utcnow().shift(minutes=-timeoutvalue).datetime
 
     for trade in Trade.query.filter(Trade.open_order_id.isnot(None)).all():
-        try:
-            order = exchange.get_order(trade.open_order_id)
-        except requests.exceptions.RequestException:
-            logger.info('Cannot query order for %s due to %s', trade, traceback.format_exc())
-            continue
+        if orders is not None:
+            # Orders missing from the reconciled orders were placed during
+            # this iteration and cannot be timed out yet
+            if trade.open_order_id not in orders:
+                continue
+            order = orders[trade.open_order_id]
+        else:
+            try:
+                order = exchange.get_order(trade.open_order_id)
+            except requests.exceptions.RequestException:
+                logger.info('Cannot query order for %s due to %s', trade,
+                            traceback.format_exc())
+                continue
         ordertime = arrow.get(order['opened'])
 
         # Check if trade is still actually open
@@ -365,6 +420,34 @@ def get_target_bid(ticker: Dict[str, float]) -> float:
     return ticker['ask'] + balance * (ticker['last'] - ticker['ask'])
 
 
+def get_buy_pair(whitelist: List[str], interval: int) -> Optional[str]:
+    """
+    Evaluates the signals of the whitelisted pairs concurrently, using at most
+    internals.signal_workers threads to respect the exchange rate limit
+    :param whitelist: pairs sorted by priority
+    :param interval: ticker interval used to compute the signals
+    :return: the first pair of the whitelist which triggers a buy signal, None otherwise
+    """
+    max_workers = min(_CONF.get('internals', {}).get('signal_workers', 1), len(whitelist))
+    if max_workers <= 1:
+        for pair in whitelist:
+            (buy, sell) = get_signal(pair, interval)
+            if buy and not sell:
+                return pair
+        return None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(get_signal, pair, interval) for pair in whitelist]
+        for index, future in enumerate(futures):
+            (buy, sell) = future.result()
+            if buy and not sell:
+                # Lower priority pairs are not evaluated anymore
+                for pending in futures[index + 1:]:
+                    pending.cancel()
+                return whitelist[index]
+    return None
+
+
 def create_trade(stake_amount: float, interval: int) -> bool:
     """
     Checks the implemented trading indicator(s) for a randomly picked pair,
@@ -392,12 +475,8 @@ def create_trade(stake_amount: float, interval: int) -> bool:
         raise DependencyException('No pair in whitelist')
 
     # Pick pair based on StochRSI buy signals
-    for _pair in whitelist:
-        (buy, sell) = get_signal(_pair, interval)
-        if buy and not sell:
-            pair = _pair
-            break
-    else:
+    pair = get_buy_pair(whitelist, interval)
+    if not pair:
         return False
 
     # Calculate amount
@@ -490,6 +569,37 @@ def cleanup() -> None:
     exit(0)
 
 
+def get_scheduler(nb_assets: Optional[int] = 0) -> Scheduler:
+    """
+    Creates the scheduler of the main loop:
+    - buy signals are evaluated right after each candle close, plus a settle delay
+    - open trades are checked every process_throttle_secs
+    Each open trade is only handled by the second task, even when both are due
+    :param nb_assets: the maximum number of pairs to be traded at the same time
+    :return: Scheduler
+    """
+    interval = int(_CONF.get('ticker_interval', 5))
+    scheduler = Scheduler()
+    scheduler.add_task(
+        'process',
+        _process,
+        period=interval * 60,
+        align=True,
+        delay=_CONF['internals'].get('candle_settle_secs', 5),
+        interval=interval,
+        nb_assets=nb_assets,
+        sell=False
+    )
+    scheduler.add_task(
+        'open_trades',
+        _process,
+        period=_CONF['internals'].get('process_throttle_secs', 10),
+        interval=interval,
+        buy=False
+    )
+    return scheduler
+
+
 def main(sysargv=sys.argv[1:]) -> int:
     """
     Loads and validates the config and handles the main loop
@@ -538,6 +648,7 @@ def main(sysargv=sys.argv[1:]) -> int:
 
     try:
         init(_CONF)
+        scheduler = get_scheduler(args.dynamic_whitelist)
         old_state = None
 
         while True:
@@ -550,12 +661,9 @@ def main(sysargv=sys.argv[1:]) -> int:
             if new_state == State.STOPPED:
                 time.sleep(1)
             elif new_state == State.RUNNING:
-                throttle(
-                    _process,
-                    min_secs=_CONF['internals'].get('process_throttle_secs', 10),
-                    nb_assets=args.dynamic_whitelist,
-                    interval=int(_CONF.get('ticker_interval', 5))
-                )
+                scheduler.run_pending()
+                # Sleep at most one second to react quickly to state changes
+                scheduler.sleep(max_secs=1)
             old_state = new_state
     except KeyboardInterrupt:
         logger.info('Got SIGINT, aborting ...')
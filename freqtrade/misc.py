@@ -65,6 +65,38 @@ def file_dump_json(filename, data) -> None:
         json.dump(data, fp)
 
 
+def file_append_json(filename, data: list) -> None:
+    """
+    Appends the given items to the JSON list stored in filename,
+    without reading or rewriting the items already stored
+    :param filename: JSON file containing a list
+    :param data: items to append
+    :return: None
+    """
+    if not data:
+        return
+    with open(filename, 'rb+') as fp:
+        # Look for the closing bracket of the list, and for its last item
+        fp.seek(0, os.SEEK_END)
+        position = fp.tell()
+        char = b''
+        while position > 0 and not char.strip():
+            position -= 1
+            fp.seek(position)
+            char = fp.read(1)
+        if char != b']':
+            raise ValueError('{} does not contain a JSON list'.format(filename))
+        previous = b''
+        while position > 0 and not previous.strip():
+            position -= 1
+            fp.seek(position)
+            previous = fp.read(1)
+
+        items = json.dumps(data)[1:-1].encode()
+        fp.write(items + b']' if previous == b'[' else b', ' + items + b']')
+        fp.truncate()
+
+
 @synchronized
 def update_state(state: State) -> None:
     """
@@ -228,6 +260,39 @@ def optimizer_shared_options(parser: argparse.ArgumentParser) -> None:
         type=str,
         dest='timerange',
     )
+    parser.add_argument(
+        '--indicator-cache',
+        help='cache the computed indicators in user_data/indicator_cache, \
+              and reuse them while the data and the strategy are unchanged',
+        action='store_true',
+        dest='indicator_cache',
+    )
+    parser.add_argument(
+        '--indicator-cache-size',
+        help='maximum size of the indicator cache in MB (default: %(default)d)',
+        dest='indicator_cache_size',
+        default=1024,
+        type=int,
+        metavar='INT',
+    )
+
+
+def preprocess_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '-j', '--jobs',
+        help='number of processes computing the indicators of the pairs, \
+              and evaluating the hyperopt epochs, in parallel (default: %(default)d)',
+        dest='jobs',
+        default=1,
+        type=int,
+        metavar='INT',
+    )
+    parser.add_argument(
+        '--compact',
+        help='store the candles and indicators as float32 to halve their memory usage',
+        action='store_true',
+        dest='compact',
+    )
 
 
 def backtesting_options(parser: argparse.ArgumentParser) -> None:
@@ -252,6 +317,21 @@ def backtesting_options(parser: argparse.ArgumentParser) -> None:
         default=None,
         dest='export',
     )
+    parser.add_argument(
+        '--engine',
+        help='backtesting engine to use, legacy is the slower reference implementation \
+              (default: %(default)s)',
+        choices=['vectorized', 'legacy'],
+        default='vectorized',
+        dest='engine',
+    )
+    parser.add_argument(
+        '--streaming',
+        help='load, analyze and backtest the pairs one at a time to bound the memory usage. \
+              Requires max_open_trades to be disabled (no --realistic-simulation)',
+        action='store_true',
+        dest='streaming',
+    )
 
 
 def hyperopt_options(parser: argparse.ArgumentParser) -> None:
@@ -278,6 +358,23 @@ def hyperopt_options(parser: argparse.ArgumentParser) -> None:
         nargs='+',
         dest='spaces',
     )
+    parser.add_argument(
+        '--subset',
+        help='backtest each epoch on the first FRACTION of the timeframe first, and on the \
+              whole timeframe only if it ranks among the best half (e.g. 0.2)',
+        dest='subset',
+        default=None,
+        type=fraction,
+        metavar='FRACTION',
+    )
+
+
+def fraction(text: str) -> float:
+    """argparse type of the values between 0 and 1 (excluded)"""
+    value = float(text)
+    if not 0 < value < 1:
+        raise argparse.ArgumentTypeError('{} is not between 0 and 1'.format(text))
+    return value
 
 
 def parse_timerange(text):
@@ -310,9 +407,18 @@ def parse_timerange(text):
     raise Exception('Incorrect syntax for timerange "%s"' % text)
 
 
+def convert_data_options(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        '--force',
+        help='convert the ticker data files even if their binary file is up to date',
+        dest='force',
+        action='store_true',
+    )
+
+
 def build_subcommands(parser: argparse.ArgumentParser) -> None:
     """ Builds and attaches all subcommands """
-    from freqtrade.optimize import backtesting, hyperopt
+    from freqtrade.optimize import backtesting, convert, hyperopt
 
     subparsers = parser.add_subparsers(dest='subparser')
 
@@ -320,14 +426,24 @@ def build_subcommands(parser: argparse.ArgumentParser) -> None:
     backtesting_cmd = subparsers.add_parser('backtesting', help='backtesting module')
     backtesting_cmd.set_defaults(func=backtesting.start)
     optimizer_shared_options(backtesting_cmd)
+    preprocess_options(backtesting_cmd)
     backtesting_options(backtesting_cmd)
 
     # Add hyperopt subcommand
     hyperopt_cmd = subparsers.add_parser('hyperopt', help='hyperopt module')
     hyperopt_cmd.set_defaults(func=hyperopt.start)
     optimizer_shared_options(hyperopt_cmd)
+    preprocess_options(hyperopt_cmd)
     hyperopt_options(hyperopt_cmd)
 
+    # Add convert-data subcommand
+    convert_cmd = subparsers.add_parser(
+        'convert-data',
+        help='convert the ticker data files of --datadir into binary files'
+    )
+    convert_cmd.set_defaults(func=convert.start)
+    convert_data_options(convert_cmd)
+
 
 # Required json-schema for user specified config
 CONF_SCHEMA = {
@@ -389,7 +505,11 @@ CONF_SCHEMA = {
             'type': 'object',
             'properties': {
                 'process_throttle_secs': {'type': 'number'},
-                'interval': {'type': 'integer'}
+                'candle_settle_secs': {'type': 'number', 'minimum': 0},
+                'interval': {'type': 'integer'},
+                'max_ticker_history': {'type': 'integer', 'minimum': 1},
+                'signal_workers': {'type': 'integer', 'minimum': 1},
+                'max_ticker_age': {'type': 'number', 'minimum': 0}
             }
         }
     },
@@ -415,6 +535,26 @@ CONF_SCHEMA = {
                         'pattern': '^[0-9A-Z]+_[0-9A-Z]+$'
                     },
                     'uniqueItems': True
+                },
+                'http': {
+                    'type': 'object',
+                    'properties': {
+                        'pool_size': {'type': 'integer', 'minimum': 1},
+                        'timeout': {'type': 'number', 'exclusiveMinimum': True, 'minimum': 0},
+                        'keep_alive': {'type': 'boolean'}
+                    }
+                },
+                'rate_limit': {
+                    'type': 'object',
+                    'properties': {
+                        'calls_per_second': {'type': 'number', 'exclusiveMinimum': True,
+                                             'minimum': 0},
+                        'burst': {'type': 'number', 'minimum': 1},
+                        'weights': {
+                            'type': 'object',
+                            'additionalProperties': {'type': 'number', 'minimum': 0}
+                        }
+                    }
                 }
             },
             'required': ['name', 'key', 'secret', 'pair_whitelist']
@@ -2,54 +2,221 @@
 
 import logging
 import json
+import multiprocessing
 import os
-from typing import Optional, List, Dict
-from pandas import DataFrame
+import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Callable, Optional, Iterator, List, Dict, Tuple
+import arrow
+import numpy as np
+from pandas import DataFrame, to_datetime
+from tabulate import tabulate
 from freqtrade.exchange import get_ticker_history
 from freqtrade.analyze import populate_indicators, parse_ticker_dataframe
 
 from freqtrade import misc
+from freqtrade.optimize import catalog
+from freqtrade.optimize.cache import IndicatorCache, get_cache_key
 from user_data.hyperopt_conf import hyperopt_optimize_conf
 import gzip
 
 logger = logging.getLogger(__name__)
 
+# Concurrent downloads, throttled by the rate limiter of the exchange
+DOWNLOAD_WORKERS = 4
 
-def trim_tickerlist(tickerlist, timerange):
+# Ticker data of the running preprocess(), read by its worker processes
+_PREPROCESS_TICKERDATA: Dict[str, List] = {}
+
+
+def get_fork_context():
+    """
+    Returns the multiprocessing context forking the worker processes.
+    The workers of preprocess() and of hyperopt read module globals of the parent
+    (ticker data, loaded strategy, patched indicator function), which the workers
+    started by spawn or forkserver would not inherit.
+    :return: fork context, None if the platform does not support fork (Windows)
+    """
+    if 'fork' not in multiprocessing.get_all_start_methods():
+        return None
+    return multiprocessing.get_context('fork')
+
+
+def create_process_pool(max_workers: int) -> ProcessPoolExecutor:
+    """
+    Creates a pool of forked worker processes, see get_fork_context()
+    :param max_workers: number of worker processes
+    :return: ProcessPoolExecutor
+    """
+    if sys.version_info < (3, 7):
+        # No mp_context before Python 3.7, where the default start method is fork
+        return ProcessPoolExecutor(max_workers=max_workers)
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=get_fork_context())
+
+
+def _bisect_timestamps(timestamp_at: Callable[[int], int], length: int, timestamp: int) -> int:
+    """
+    Binary search on sorted candle timestamps
+    :param timestamp_at: function returning the epoch seconds of the candle at an index
+    :param length: number of candles
+    :param timestamp: epoch seconds to search
+    :return: index of the first candle not older than timestamp
+    """
+    low, high = 0, length
+    while low < high:
+        middle = (low + high) // 2
+        if timestamp_at(middle) < timestamp:
+            low = middle + 1
+        else:
+            high = middle
+    return low
+
+
+def get_timerange_slice(timerange, length: int, timestamp_at: Callable[[int], int]) -> slice:
+    """
+    Returns the candles of the given timerange as slice.
+    Dates are looked up by binary search: the start date is included,
+    the stop date is excluded (candles up to the day before)
+    :param timerange: timerange as returned by misc.parse_timerange
+    :param length: number of candles
+    :param timestamp_at: function returning the epoch seconds of the candle at an index
+    :return: slice
+    """
     (stype, start, stop) = timerange
     if stype == (None, 'line'):
-        return tickerlist[stop:]
+        return slice(stop, None)
     elif stype == ('line', None):
-        return tickerlist[0:start]
+        return slice(0, start)
     elif stype == ('index', 'index'):
-        return tickerlist[start:stop]
+        return slice(start, stop)
+    elif 'date' in stype:
+        start_index, stop_index = 0, length
+        if start:
+            start_index = _bisect_timestamps(timestamp_at, length,
+                                             arrow.get(start, 'YYYYMMDD').timestamp)
+        if stop:
+            stop_index = _bisect_timestamps(timestamp_at, length,
+                                            arrow.get(stop, 'YYYYMMDD').timestamp)
+        return slice(start_index, stop_index)
 
-    return tickerlist
+    return slice(None)
+
+
+def trim_tickerlist(tickerlist, timerange):
+    timerange_slice = get_timerange_slice(timerange, len(tickerlist),
+                                          lambda index: arrow.get(tickerlist[index]['T']).timestamp)
+    return tickerlist[timerange_slice]
+
+
+def load_tickerdata_json(file):
+    """
+    Load a ticker list from a .json file, or from its .json.gz version if it exists
+    :param file: path of the .json file
+    :return list OR None if the file does not exist
+    """
+    gzipfile = file + '.gz'
+    if os.path.isfile(gzipfile):
+        logger.debug('Loading ticker data from file %s', gzipfile)
+        with gzip.open(gzipfile) as tickerdata:
+            return json.load(tickerdata)
+    elif os.path.isfile(file):
+        logger.debug('Loading ticker data from file %s', file)
+        with open(file) as tickerdata:
+            return json.load(tickerdata)
+    return None
+
+
+def get_binary_file(file: str) -> Optional[str]:
+    """
+    Returns the binary file (.npz) of the given .json file,
+    if it exists and is not older than the .json and .json.gz files
+    :param file: path of the .json file
+    :return path of the binary file OR None
+    """
+    binfile = os.path.splitext(file)[0] + '.npz'
+    if not os.path.isfile(binfile):
+        return None
+    mtime = os.path.getmtime(binfile)
+    for source in [file, file + '.gz']:
+        if os.path.isfile(source) and os.path.getmtime(source) > mtime:
+            logger.warning('%s is older than %s, run convert-data to update it', binfile, source)
+            return None
+    return binfile
+
+
+def tickerlist_to_columns(tickerlist: List[Dict]) -> Dict[str, np.ndarray]:
+    """
+    Converts a ticker list into column arrays
+    :param tickerlist: list of candles, see exchange.get_ticker_history
+    :return dict of float64 arrays, and int64 epoch seconds for 'T'
+    """
+    frame = DataFrame(tickerlist)
+    columns = {key: frame[key].values.astype(np.float64) for key in frame if key != 'T'}
+    columns['T'] = to_datetime(frame['T'], utc=True).values.astype(np.int64) // 10**9
+    return columns
+
+
+def columns_to_tickerdata(columns: Dict[str, np.ndarray]) -> DataFrame:
+    """
+    Converts column arrays into a DataFrame accepted by analyze.parse_ticker_dataframe
+    :param columns: dict of arrays, see tickerlist_to_columns
+    :return DataFrame with one column per key
+    """
+    frame = DataFrame({key: value for key, value in columns.items() if key != 'T'},
+                      columns=sorted(columns))
+    frame['T'] = to_datetime(columns['T'], unit='s', utc=True)
+    return frame
+
+
+def save_tickerdata_binary(file: str, tickerlist: List[Dict]) -> None:
+    """
+    Save a ticker list into a binary file (.npz)
+    :param file: path of the binary file
+    :param tickerlist: list of candles, see exchange.get_ticker_history
+    :return None
+    """
+    with open(file, 'wb') as binfile:
+        np.savez(binfile, **tickerlist_to_columns(tickerlist))
+
+
+def load_tickerdata_binary(file: str, timerange=None) -> DataFrame:
+    """
+    Load a binary file (.npz) written by save_tickerdata_binary
+    :param file: path of the binary file
+    :param timerange: only keep the candles of this timerange (optional)
+    :return DataFrame, see columns_to_tickerdata
+    """
+    logger.debug('Loading ticker data from file %s', file)
+    with np.load(file) as data:
+        timerange_slice = slice(None)
+        if timerange:
+            timestamps = data['T']
+            timerange_slice = get_timerange_slice(timerange, len(timestamps),
+                                                  timestamps.__getitem__)
+        return columns_to_tickerdata({key: data[key][timerange_slice] for key in data.files})
 
 
 def load_tickerdata_file(datadir, pair, ticker_interval, timerange=None):
     """
-    Load a pair from file,
-    :return dict OR empty if unsuccesful
+    Load a pair from file, the binary file (.npz) is preferred when it is up to date
+    :return list OR DataFrame for binary files, None if unsuccesful
     """
     path = make_testdata_path(datadir)
     file = os.path.join(path, '{pair}-{ticker_interval}.json'.format(
         pair=pair,
         ticker_interval=ticker_interval,
     ))
-    gzipfile = file + '.gz'
 
     # If the file does not exist we download it when None is returned.
     # If file exists, read the file, load the json
-    if os.path.isfile(gzipfile):
-        logger.debug('Loading ticker data from file %s', gzipfile)
-        with gzip.open(gzipfile) as tickerdata:
-            pairdata = json.load(tickerdata)
-    elif os.path.isfile(file):
-        logger.debug('Loading ticker data from file %s', file)
-        with open(file) as tickerdata:
-            pairdata = json.load(tickerdata)
-    else:
+    binfile = get_binary_file(file)
+    if binfile:
+        return load_tickerdata_binary(binfile, timerange=timerange)
+
+    pairdata = load_tickerdata_json(file)
+    if pairdata is None:
         return None
 
     if timerange:
@@ -60,13 +227,24 @@ def load_tickerdata_file(datadir, pair, ticker_interval, timerange=None):
 def load_data(datadir: str, ticker_interval: int, pairs: Optional[List[str]] = None,
               refresh_pairs: Optional[bool] = False, timerange=None) -> Dict[str, List]:
     """
-    Loads ticker history data for the given parameters
+    Loads ticker history data for the given parameters.
+    Date timeranges are checked against the data catalog first, see optimize.catalog
     :param ticker_interval: ticker interval in minutes
     :param pairs: list of pairs
     :return: dict
     """
-    result = {}
+    return dict(iter_data(datadir, ticker_interval, pairs=pairs,
+                          refresh_pairs=refresh_pairs, timerange=timerange))
+
 
+def iter_data(datadir: str, ticker_interval: int, pairs: Optional[List[str]] = None,
+              refresh_pairs: Optional[bool] = False,
+              timerange=None) -> Iterator[Tuple[str, List]]:
+    """
+    Loads the ticker history data of the pairs one at a time, see load_data for the arguments.
+    Only the data of the current pair is held in memory
+    :return: iterator of tuples (pair, ticker data)
+    """
     _pairs = pairs or hyperopt_optimize_conf()['exchange']['pair_whitelist']
 
     # If the user force the refresh of pairs
@@ -74,26 +252,158 @@ def load_data(datadir: str, ticker_interval: int, pairs: Optional[List[str]] = N
         logger.info('Download data for all pairs and store them in %s', datadir)
         download_pairs(datadir, _pairs, ticker_interval)
 
+    if timerange:
+        catalog.check_timerange(make_testdata_path(datadir), _pairs, ticker_interval, timerange)
+
     for pair in _pairs:
         pairdata = load_tickerdata_file(datadir, pair, ticker_interval, timerange=timerange)
-        if not pairdata:
+        if pairdata is None or len(pairdata) == 0:
             # download the tickerdata from exchange
             download_backtesting_testdata(datadir, pair=pair, interval=ticker_interval)
             # and retry reading the pair
             pairdata = load_tickerdata_file(datadir, pair, ticker_interval, timerange=timerange)
-        result[pair] = pairdata
-    return result
+        yield pair, pairdata
 
 
-def tickerdata_to_dataframe(data):
-    preprocessed = preprocess(data)
+def tickerdata_to_dataframe(data, cache: Optional[IndicatorCache] = None,
+                            ticker_interval: Optional[int] = None, timerange=None, jobs: int = 1,
+                            compact: bool = False):
+    preprocessed = preprocess(data, cache=cache, ticker_interval=ticker_interval,
+                              timerange=timerange, jobs=jobs, compact=compact)
     return preprocessed
 
 
-def preprocess(tickerdata: Dict[str, List]) -> Dict[str, DataFrame]:
-    """Creates a dataframe and populates indicators for given ticker data"""
-    return {pair: populate_indicators(parse_ticker_dataframe(pair_data))
-            for pair, pair_data in tickerdata.items()}
+def preprocess_pair(pair: str, pair_data, cache: Optional[IndicatorCache] = None,
+                    ticker_interval: Optional[int] = None, timerange=None) -> DataFrame:
+    """
+    Creates a dataframe and populates indicators for the ticker data of one pair
+    (see preprocess for the arguments)
+    :return: DataFrame
+    """
+    dataframe = parse_ticker_dataframe(pair_data)
+    if cache is None:
+        return populate_indicators(dataframe)
+
+    key = get_cache_key(pair, ticker_interval, timerange, dataframe, populate_indicators)
+    result = cache.get(key, pair)
+    if result is None:
+        result = populate_indicators(dataframe)
+        cache.put(key, pair, result)
+    return result
+
+
+def _preprocess_pair_columns(pair: str, cache: Optional[IndicatorCache],
+                             ticker_interval: Optional[int], timerange) -> Tuple:
+    """
+    Runs preprocess_pair in a worker process. The ticker data is read from
+    _PREPROCESS_TICKERDATA, inherited from the parent process when the worker is forked.
+    The DataFrame is returned as column arrays, which are cheaper to transfer
+    :return: tuple (column arrays, timezone of the datetime columns, cache hits, cache misses)
+    """
+    hits, misses = (cache.hits, cache.misses) if cache else (0, 0)
+    if cache:
+        # Evicting here could remove the entries other workers are reading
+        cache.evict_on_put = False
+    frame = preprocess_pair(pair, _PREPROCESS_TICKERDATA[pair], cache=cache,
+                            ticker_interval=ticker_interval, timerange=timerange)
+    columns = OrderedDict((column, frame[column].values) for column in frame.columns)
+    timezones = {column: str(frame[column].dt.tz) for column in frame.columns
+                 if getattr(frame[column].dtype, 'tz', None) is not None}
+    if cache:
+        hits, misses = cache.hits - hits, cache.misses - misses
+    return columns, timezones, hits, misses
+
+
+def _columns_to_dataframe(columns: Dict[str, np.ndarray], timezones: Dict[str, str]) -> DataFrame:
+    frame = DataFrame(columns, columns=list(columns))
+    for column, timezone in timezones.items():
+        frame[column] = frame[column].dt.tz_localize(timezone)
+    return frame
+
+
+def preprocess(tickerdata: Dict[str, List], cache: Optional[IndicatorCache] = None,
+               ticker_interval: Optional[int] = None, timerange=None,
+               jobs: int = 1, compact: bool = False) -> Dict[str, DataFrame]:
+    """
+    Creates a dataframe and populates indicators for given ticker data
+    :param tickerdata: dict with the pair as key and its ticker data as value
+    :param cache: cache of the indicators (optional)
+    :param ticker_interval: ticker interval in minutes, part of the cache key
+    :param timerange: timerange of the data, part of the cache key
+    :param jobs: number of processes preprocessing the pairs in parallel
+    :param compact: store the candles and indicators as float32, see compact_dataframe
+    :return: dict with the pair as key and its DataFrame as value
+    """
+    if jobs > 1 and get_fork_context() is None:
+        logger.warning('--jobs requires fork, which this platform does not support: '
+                       'computing the indicators in a single process')
+        jobs = 1
+
+    if jobs <= 1 or len(tickerdata) <= 1:
+        result = {pair: preprocess_pair(pair, pair_data, cache=cache,
+                                        ticker_interval=ticker_interval, timerange=timerange)
+                  for pair, pair_data in tickerdata.items()}
+    else:
+        # Workers are forked, they inherit the ticker data,
+        # the loaded strategy and the indicator function
+        global _PREPROCESS_TICKERDATA
+        _PREPROCESS_TICKERDATA = tickerdata
+        pairs = list(tickerdata)
+        try:
+            with create_process_pool(min(jobs, len(pairs))) as executor:
+                futures = [executor.submit(_preprocess_pair_columns, pair, cache,
+                                           ticker_interval, timerange) for pair in pairs]
+                result = {}
+                for pair, future in zip(pairs, futures):
+                    columns, timezones, hits, misses = future.result()
+                    result[pair] = _columns_to_dataframe(columns, timezones)
+                    if cache is not None:
+                        cache.hits += hits
+                        cache.misses += misses
+        finally:
+            _PREPROCESS_TICKERDATA = {}
+        if cache is not None:
+            cache.evict()
+
+    if cache is not None:
+        logger.info('Indicator cache: %d hit(s), %d miss(es)', cache.hits, cache.misses)
+    if compact:
+        memory_usage = {}
+        for pair, dataframe in result.items():
+            before = dataframe.memory_usage().sum()
+            result[pair] = compact_dataframe(dataframe)
+            memory_usage[pair] = (before, result[pair].memory_usage().sum())
+        logger.info('Compact mode memory usage:\n%s', generate_memory_report(memory_usage))
+    return result
+
+
+def compact_dataframe(dataframe: DataFrame) -> DataFrame:
+    """
+    Converts the float64 columns of a preprocessed DataFrame into float32, halving
+    their memory usage. Dates keep their int64 representation (datetime64[ns]).
+    The indicators are computed in float64 before, and backtesting converts the rates
+    back to float64 for the profit calculation
+    :param dataframe: preprocessed DataFrame
+    :return: DataFrame
+    """
+    columns = dataframe.select_dtypes(include=[np.float64]).columns
+    return dataframe.astype({column: np.float32 for column in columns})
+
+
+def generate_memory_report(memory_usage: Dict[str, Tuple[int, int]]) -> str:
+    """
+    Generates a table of the memory saved per pair by compact_dataframe
+    :param memory_usage: dict with the pair as key and (bytes before, bytes after) as value
+    :return: table as string
+    """
+    headers = ['pair', 'before MB', 'after MB', 'saved %']
+    rows = [[pair, before / 2**20, after / 2**20, (1 - after / before) * 100 if before else 0]
+            for pair, (before, after) in memory_usage.items()]
+    before = sum(usage[0] for usage in memory_usage.values())
+    after = sum(usage[1] for usage in memory_usage.values())
+    rows.append(['TOTAL', before / 2**20, after / 2**20,
+                 (1 - after / before) * 100 if before else 0])
+    return tabulate(rows, headers=headers, floatfmt='.2f')
 
 
 def make_testdata_path(datadir: str) -> str:
@@ -104,16 +414,36 @@ def make_testdata_path(datadir: str) -> str:
 
 def download_pairs(datadir, pairs: List[str], ticker_interval: int) -> bool:
     """For each pairs passed in parameters, download the ticker intervals"""
-    for pair in pairs:
+    return all(download_tickerdata(datadir, pairs, [ticker_interval]).values())
+
+
+def download_tickerdata(datadir, pairs: List[str], ticker_intervals: List[int],
+                        workers: int = DOWNLOAD_WORKERS) -> Dict[Tuple[str, int], bool]:
+    """
+    Downloads the ticker intervals of all pairs in parallel.
+    A failed download does not stop the other ones.
+    The requests are throttled by the rate limiter of the exchange
+    :param pairs: list of pairs to download
+    :param ticker_intervals: list of ticker intervals in minutes
+    :param workers: number of concurrent downloads
+    :return: dict with (pair, interval) as key and True if its download succeeded as value
+    """
+    def download(pair: str, interval: int) -> bool:
         try:
-            download_backtesting_testdata(datadir, pair=pair, interval=ticker_interval)
+            return download_backtesting_testdata(datadir, pair=pair, interval=interval)
         except BaseException:
             logger.info('Failed to download the pair: "{pair}", Interval: {interval} min'.format(
                 pair=pair,
-                interval=ticker_interval,
+                interval=interval,
             ))
             return False
-    return True
+
+    jobs = [(pair, interval) for pair in pairs for interval in ticker_intervals]
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+        results = dict(zip(jobs, executor.map(lambda job: download(*job), jobs)))
+
+    logger.info('Downloaded %d of %d ticker files', sum(results.values()), len(results))
+    return results
 
 
 def file_dump_json(filename, data):
@@ -121,12 +451,34 @@ def file_dump_json(filename, data):
         json.dump(data, fp)
 
 
+def get_last_timestamp(filename: str) -> Optional[str]:
+    """
+    Returns the timestamp of the last candle of a ticker data file,
+    reading only the end of the file
+    :param filename: path of the .json file
+    :return: timestamp as stored in the file ('T'), None if the file holds no candle
+    """
+    with open(filename, 'rb') as file:
+        file.seek(0, os.SEEK_END)
+        file.seek(max(file.tell() - 1024, 0))
+        matches = re.findall(rb'"T":\s*"([^"]+)"', file.read())
+    if matches:
+        return matches[-1].decode()
+
+    # Candles longer than the tail read above
+    with open(filename) as file:
+        tickerlist = json.load(file)
+    return tickerlist[-1]['T'] if tickerlist else None
+
+
 # FIX: 20180110, suggest rename interval to tick_interval
 def download_backtesting_testdata(datadir: str, pair: str, interval: int = 5) -> bool:
     """
-    Download the latest 1 and 5 ticker intervals from Bittrex for the pairs passed in parameters
+    Download the latest ticker intervals from Bittrex for the pair passed in parameters.
+    Only the candles newer than the last one of the existing file are appended to it
     Based on @Rybolov work: https://github.com/rybolov/freqtrade-data
-    :param pairs: list of pairs to download
+    :param pair: pair to download
+    :param interval: ticker interval in minutes
     :return: bool
     """
 
@@ -142,24 +494,28 @@ def download_backtesting_testdata(datadir: str, pair: str, interval: int = 5) ->
         interval=interval,
     ))
 
+    last_timestamp = None
+    previous_size = 0
+    if os.path.isfile(filename):
+        last_timestamp = get_last_timestamp(filename)
+        previous_size = os.path.getsize(filename)
+    logger.debug("Current End: {}".format(last_timestamp))
+
+    # Keyed by timestamp to drop the duplicated candles
+    new_data = {
+        row['T']: row
+        for row in get_ticker_history(pair=pair, tick_interval=int(interval))
+        if last_timestamp is None or row['T'] > last_timestamp
+    }
+    data = [new_data[timestamp] for timestamp in sorted(new_data)]
+    if data:
+        logger.debug("New End: {}".format(data[-1]['T']))
+
     if os.path.isfile(filename):
-        with open(filename, "rt") as fp:
-            data = json.load(fp)
-        logger.debug("Current Start: {}".format(data[1]['T']))
-        logger.debug("Current End: {}".format(data[-1:][0]['T']))
+        misc.file_append_json(filename, data)
     else:
-        data = []
-        logger.debug("Current Start: None")
-        logger.debug("Current End: None")
-
-    new_data = get_ticker_history(pair=pair, tick_interval=int(interval))
-    for row in new_data:
-        if row not in data:
-            data.append(row)
-    logger.debug("New Start: {}".format(data[1]['T']))
-    logger.debug("New End: {}".format(data[-1:][0]['T']))
-    data = sorted(data, key=lambda data: data['T'])
-
-    misc.file_dump_json(filename, data)
+        misc.file_dump_json(filename, data)
+    logger.info('Appended %d candle(s) to %s', len(data), filename)
+    catalog.update_entry(path, pair, interval, data, previous_size)
 
     return True
@@ -1,19 +1,22 @@
 # pragma pylint: disable=missing-docstring,W0212
 
 import logging
-from typing import Dict, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 import arrow
-from pandas import DataFrame, Series
+import numpy as np
+from pandas import DataFrame, Series, concat
 from tabulate import tabulate
 
+import freqtrade.main as main
 import freqtrade.misc as misc
 import freqtrade.optimize as optimize
 from freqtrade import exchange
 from freqtrade.analyze import populate_buy_trend, populate_sell_trend
 from freqtrade.exchange import Bittrex
 from freqtrade.main import should_sell
-from freqtrade.persistence import Trade
+from freqtrade.optimize.cache import IndicatorCache
+from freqtrade.optimize.trade import SimulationTrade
 from freqtrade.strategy.strategy import Strategy
 
 logger = logging.getLogger(__name__)
@@ -70,12 +73,13 @@ def generate_text_table(
 def get_sell_trade_entry(pair, buy_row, partial_ticker, trade_count_lock, args):
     stake_amount = args['stake_amount']
     max_open_trades = args.get('max_open_trades', 0)
-    trade = Trade(open_rate=buy_row.close,
-                  open_date=buy_row.date,
-                  stake_amount=stake_amount,
-                  amount=stake_amount / buy_row.open,
-                  fee=exchange.get_fee()
-                  )
+    # Rates are converted to float64, the candles may be float32 (see optimize.compact_dataframe)
+    trade = SimulationTrade(open_rate=float(buy_row.close),
+                            open_date=buy_row.date,
+                            stake_amount=stake_amount,
+                            amount=stake_amount / float(buy_row.open),
+                            fee=exchange.get_fee(),
+                            pair=pair)
 
     # calculate win/lose forwards from buy point
     for sell_row in partial_ticker:
@@ -84,10 +88,11 @@ def get_sell_trade_entry(pair, buy_row, partial_ticker, trade_count_lock, args):
             trade_count_lock[sell_row.date] = trade_count_lock.get(sell_row.date, 0) + 1
 
         buy_signal = sell_row.buy
-        if should_sell(trade, sell_row.close, sell_row.date, buy_signal, sell_row.sell):
+        sell_rate = float(sell_row.close)
+        if should_sell(trade, sell_rate, sell_row.date, buy_signal, sell_row.sell):
             return sell_row, (pair,
-                              trade.calc_profit_percent(rate=sell_row.close),
-                              trade.calc_profit(rate=sell_row.close),
+                              trade.calc_profit_percent(rate=sell_rate),
+                              trade.calc_profit(rate=sell_rate),
                               (sell_row.date - buy_row.date).seconds // 60
                               ), sell_row.date
     return None
@@ -96,6 +101,26 @@ def get_sell_trade_entry(pair, buy_row, partial_ticker, trade_count_lock, args):
 def backtest(args) -> DataFrame:
     """
     Implements backtesting functionality
+    :param args: a dict containing:
+        stake_amount: btc amount to use for each trade
+        processed: a processed dictionary with format {pair, data}
+        max_open_trades: maximum number of concurrent trades (default: 0, disabled)
+        realistic: do we try to simulate realistic trades? (default: True)
+        sell_profit_only: sell if profit only
+        use_sell_signal: act on sell-signal
+        engine: 'vectorized' (default) or 'legacy'
+        records: list collecting the exported trades instead of dumping them (optional)
+    :return: DataFrame
+    """
+    if args.get('engine') == 'legacy':
+        return backtest_legacy(args)
+    return backtest_vectorized(args)
+
+
+def backtest_legacy(args) -> DataFrame:
+    """
+    Implements backtesting functionality by iterating over every candle.
+    Kept as reference implementation for backtest_vectorized()
     :param args: a dict containing:
         stake_amount: btc amount to use for each trade
         processed: a processed dictionary with format {pair, data}
@@ -110,7 +135,7 @@ def backtest(args) -> DataFrame:
     max_open_trades = args.get('max_open_trades', 0)
     realistic = args.get('realistic', False)
     record = args.get('record', None)
-    records = []
+    records = args.get('records', [])
     trades = []
     trade_count_lock: dict = {}
     exchange._API = Bittrex({'key': '', 'secret': ''})
@@ -149,13 +174,242 @@ def backtest(args) -> DataFrame:
                                     row.date, trade_entry[3]))
     # For now export inside backtest(), maybe change so that backtest()
     # returns a tuple like: (dataframe, records, logs, etc)
-    if record and record.find('trades') >= 0:
+    if record and record.find('trades') >= 0 and 'records' not in args:
+        logger.info('Dumping backtest results')
+        misc.file_dump_json('backtest-result.json', records)
+    labels = ['currency', 'profit_percent', 'profit_BTC', 'duration']
+    return DataFrame.from_records(trades, columns=labels)
+
+
+def _roi_lookup(minimal_roi: Dict) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Converts the ROI table into arrays usable with np.searchsorted.
+    min_roi_reached() walks the table in its given order and stops at the first
+    duration >= elapsed time, so the relevant entries are the prefix before the
+    first cumulative maximum >= elapsed time.
+    :return: tuple (cumulative max of durations, min threshold for each prefix length)
+    """
+    durations = np.array([float(key) for key in minimal_roi.keys()])
+    thresholds = np.array([float(value) for value in minimal_roi.values()])
+    if not len(durations):
+        return durations, np.array([np.inf])
+    return (np.maximum.accumulate(durations),
+            np.concatenate(([np.inf], np.minimum.accumulate(thresholds))))
+
+
+def _find_sell_index(index: int, close: np.ndarray, minutes: np.ndarray,
+                     sell_signal: Optional[np.ndarray], params: Dict) -> int:
+    """
+    Finds the first candle after index at which should_sell() would trigger
+    for a trade bought at the close of candle index.
+    The forward window is evaluated in chunks of growing size
+    to avoid computing the whole remaining history for short trades.
+    :return: index of the sell candle, -1 if the trade is never closed
+    """
+    # Same fee semantics as SimulationTrade.calc_profit_percent(), applied on arrays
+    amount = params['stake_amount'] / params['open'][index]
+    fee = params['fee']
+    buy_trade = amount * close[index]
+    open_price = buy_trade + buy_trade * fee
+    stoploss = params['stoploss']
+    roi_durations, roi_thresholds = params['roi']
+
+    length = len(close)
+    start = index + 1
+    size = 64
+    while start < length:
+        stop = min(length, start + size)
+        sell_trade = amount * close[start:stop]
+        close_price = sell_trade - sell_trade * fee
+        profit_percent = np.round(close_price / open_price - 1, 8)
+
+        elapsed = minutes[start:stop] - minutes[index]
+        hit = profit_percent > roi_thresholds[
+            np.searchsorted(roi_durations, elapsed, side='left')]
+        if stoploss is not None:
+            hit |= profit_percent < stoploss
+        if sell_signal is not None:
+            signal = sell_signal[start:stop]
+            if params['sell_profit_only']:
+                signal = signal & (np.round(close_price - open_price, 8) > 0)
+            hit |= signal
+
+        if hit.any():
+            return start + int(np.argmax(hit))
+        start = stop
+        size *= 2
+    return -1
+
+
+def _get_trade_entry(pair: str, index: int, sell_index: int,
+                     dates: np.ndarray, close: np.ndarray, params: Dict) -> Tuple:
+    """
+    Calculates the result of a trade bought on candle index and sold on candle sell_index
+    :return: tuple (pair, profit_percent, profit_BTC, duration)
+    """
+    trade = SimulationTrade(open_rate=close[index],
+                            open_date=dates[index],
+                            stake_amount=params['stake_amount'],
+                            amount=params['stake_amount'] / params['open'][index],
+                            fee=params['fee'],
+                            pair=pair)
+    # timedelta.seconds of the legacy engine ignores whole days
+    duration = (dates[sell_index] - dates[index]) // 10 ** 9 % 86400 // 60
+    return (pair,
+            trade.calc_profit_percent(rate=close[sell_index]),
+            trade.calc_profit(rate=close[sell_index]),
+            int(duration))
+
+
+def _backtest_pair(pair: str, ticker: DataFrame, params: Dict,
+                   trade_count_lock: Optional[Dict]) -> List[Tuple]:
+    """
+    Simulates all trades of one pair
+    :param trade_count_lock: dict with the open trade count array 'counts'
+    and the sorted candle dates 'dates' of all pairs, None if max_open_trades is disabled
+    :return: list of tuples (trade_entry, buy index, sell index)
+    """
+    dates = ticker['date'].values.astype('int64')
+    minutes = dates / 6e10
+    close = ticker['close'].values.astype(np.float64)
+    buy = ticker['buy'].values != 0
+    sell = ticker['sell'].values
+    params['open'] = ticker['open'].values.astype(np.float64)
+    sell_signal = (sell != 0) & ~buy if params['use_sell_signal'] else None
+    if trade_count_lock is not None:
+        counts = trade_count_lock['counts']
+        date_index = np.searchsorted(trade_count_lock['dates'], dates)
+
+    results = []
+    lock_pair_until = None
+    for index in np.flatnonzero(buy & (sell != 1)):
+        if params['realistic']:
+            if lock_pair_until is not None and dates[index] <= lock_pair_until:
+                continue
+        if trade_count_lock is not None:
+            # Check if max_open_trades has already been reached for the given date
+            if not counts[date_index[index]] < params['max_open_trades']:
+                continue
+            counts[date_index[index]] += 1
+
+        sell_index = _find_sell_index(index, close, minutes, sell_signal, params)
+        if trade_count_lock is not None:
+            # The trade is open on every candle up to and including the sell candle
+            stop = sell_index + 1 if sell_index >= 0 else len(dates)
+            np.add.at(counts, date_index[index + 1:stop], 1)
+        if sell_index < 0:
+            continue
+
+        lock_pair_until = dates[sell_index]
+        results.append((_get_trade_entry(pair, index, sell_index, dates, close, params),
+                        index, sell_index))
+    return results
+
+
+def backtest_vectorized(args) -> DataFrame:
+    """
+    Implements backtesting functionality on the raw numpy arrays of each pair.
+    Produces the same results as backtest_legacy() (see backtest() for the arguments)
+    :return: DataFrame
+    """
+    headers = ['date', 'buy', 'open', 'close', 'sell']
+    processed = args['processed']
+    record = args.get('record', None)
+    records = args.get('records', [])
+    trades = []
+    exchange._API = Bittrex({'key': '', 'secret': ''})
+
+    strategy = Strategy()
+    experimental = main._CONF.get('experimental', {})
+    params = {
+        'stake_amount': args['stake_amount'],
+        'max_open_trades': args.get('max_open_trades', 0),
+        'realistic': args.get('realistic', False),
+        'fee': exchange.get_fee(),
+        'stoploss': strategy.stoploss,
+        'roi': _roi_lookup(strategy.minimal_roi),
+        'sell_profit_only': experimental.get('sell_profit_only', False),
+        'use_sell_signal': experimental.get('use_sell_signal', False),
+    }
+
+    tickers = {}
+    for pair, pair_data in processed.items():
+        pair_data['buy'], pair_data['sell'] = 0, 0  # cleanup from previous run
+        tickers[pair] = populate_sell_trend(populate_buy_trend(pair_data))[headers]
+
+    # Open trade count per candle date, shared between all pairs
+    trade_count_lock = None
+    if params['max_open_trades'] > 0:
+        all_dates = np.unique(np.concatenate(
+            [ticker['date'].values.astype('int64') for ticker in tickers.values()]
+        ))
+        trade_count_lock = {'dates': all_dates,
+                            'counts': np.zeros(len(all_dates), dtype=np.int64)}
+
+    for pair, ticker in tickers.items():
+        for trade_entry, index, sell_index in _backtest_pair(pair, ticker, params,
+                                                             trade_count_lock):
+            trades.append(trade_entry)
+            if record:
+                buy_date = ticker['date'].iloc[index]
+                sell_date = ticker['date'].iloc[sell_index]
+                records.append((pair, trade_entry[1],
+                                buy_date.strftime('%s'),
+                                sell_date.strftime('%s'),
+                                buy_date, trade_entry[3]))
+    if record and record.find('trades') >= 0 and 'records' not in args:
         logger.info('Dumping backtest results')
         misc.file_dump_json('backtest-result.json', records)
     labels = ['currency', 'profit_percent', 'profit_BTC', 'duration']
     return DataFrame.from_records(trades, columns=labels)
 
 
+def backtest_streaming(tickerdata: Iterable[Tuple[str, List]], args: Dict,
+                       cache: Optional[IndicatorCache] = None,
+                       ticker_interval: Optional[int] = None, timerange=None,
+                       compact: bool = False) -> Tuple[DataFrame, Tuple[arrow.Arrow, arrow.Arrow]]:
+    """
+    Preprocesses and backtests the pairs one at a time, so only the data of the
+    current pair is held in memory. Only valid when max_open_trades is disabled,
+    as the pairs are then independent of each other
+    :param tickerdata: iterator of tuples (pair, ticker data), see optimize.iter_data
+    :param args: arguments of backtest(), without 'processed'
+    :param cache: cache of the indicators (optional), see optimize.preprocess
+    :param ticker_interval: ticker interval in minutes
+    :param timerange: timerange of the data
+    :param compact: store the candles and indicators as float32
+    :return: tuple (results of all pairs, (min_date, max_date) of the data)
+    """
+    if args.get('max_open_trades', 0) > 0:
+        raise ValueError('Streaming backtests require max_open_trades to be disabled')
+
+    records: List = []
+    results = []
+    min_date, max_date = None, None
+    for pair, pair_data in tickerdata:
+        processed = optimize.preprocess({pair: pair_data}, cache=cache,
+                                        ticker_interval=ticker_interval,
+                                        timerange=timerange, compact=compact)
+        pair_min, pair_max = get_timeframe(processed)
+        min_date = pair_min if min_date is None else min(min_date, pair_min)
+        max_date = pair_max if max_date is None else max(max_date, pair_max)
+        results.append(backtest(dict(args, processed=processed, records=records)))
+
+    record = args.get('record', None)
+    if record and record.find('trades') >= 0:
+        logger.info('Dumping backtest results')
+        misc.file_dump_json('backtest-result.json', records)
+    labels = ['currency', 'profit_percent', 'profit_BTC', 'duration']
+    if not results:
+        return DataFrame(columns=labels), (min_date, max_date)
+    return concat(results, ignore_index=True), (min_date, max_date)
+
+
+def _iter_live_data(pairs: List[str], ticker_interval: int) -> Iterator[Tuple[str, List]]:
+    for pair in pairs:
+        yield pair, exchange.get_ticker_history(pair, ticker_interval)
+
+
 def start(args):
     # Initialize logger
     logging.basicConfig(
@@ -180,52 +434,74 @@ def start(args):
 
     logger.info('Using ticker_interval: %d ...', strategy.ticker_interval)
 
-    data = {}
     pairs = config['exchange']['pair_whitelist']
     logger.info('Using stake_currency: %s ...', config['stake_currency'])
     logger.info('Using stake_amount: %s ...', config['stake_amount'])
 
-    if args.live:
-        logger.info('Downloading data for all pairs in whitelist ...')
-        for pair in pairs:
-            data[pair] = exchange.get_ticker_history(pair, strategy.ticker_interval)
-    else:
-        logger.info('Using local backtesting data (using whitelist in given config) ...')
-
-        timerange = misc.parse_timerange(args.timerange)
-        data = optimize.load_data(args.datadir,
-                                  pairs=pairs,
-                                  ticker_interval=strategy.ticker_interval,
-                                  refresh_pairs=args.refresh_pairs,
-                                  timerange=timerange)
     max_open_trades = 0
     if args.realistic_simulation:
         logger.info('Using max_open_trades: %s ...', config['max_open_trades'])
         max_open_trades = config['max_open_trades']
 
+    streaming = args.streaming
+    if streaming and max_open_trades > 0:
+        logger.warning('--streaming requires max_open_trades to be disabled, '
+                       'loading all pairs at once')
+        streaming = False
+
+    timerange = misc.parse_timerange(args.timerange)
+    if args.live:
+        logger.info('Downloading data for all pairs in whitelist ...')
+        tickerdata = _iter_live_data(pairs, strategy.ticker_interval)
+    else:
+        logger.info('Using local backtesting data (using whitelist in given config) ...')
+        # iter_data loads the pairs lazily, load_data all at once
+        load = optimize.iter_data if streaming else optimize.load_data
+        tickerdata = load(args.datadir,
+                          pairs=pairs,
+                          ticker_interval=strategy.ticker_interval,
+                          refresh_pairs=args.refresh_pairs,
+                          timerange=timerange)
+
     # Monkey patch config
     from freqtrade import main
     main._CONF = config
 
-    preprocessed = optimize.tickerdata_to_dataframe(data)
-    # Print timeframe
-    min_date, max_date = get_timeframe(preprocessed)
+    cache = None
+    if args.indicator_cache:
+        cache = IndicatorCache(max_size=args.indicator_cache_size)
+
+    logger.info('Using engine: %s ...', args.engine)
+    sell_profit_only = config.get('experimental', {}).get('sell_profit_only', False)
+    use_sell_signal = config.get('experimental', {}).get('use_sell_signal', False)
+    backtest_args = {'stake_amount': config['stake_amount'],
+                     'max_open_trades': max_open_trades,
+                     'realistic': args.realistic_simulation,
+                     'sell_profit_only': sell_profit_only,
+                     'use_sell_signal': use_sell_signal,
+                     'record': args.export,
+                     'engine': args.engine,
+                     }
+    if streaming:
+        logger.info('Backtesting the pairs one at a time ...')
+        results, (min_date, max_date) = backtest_streaming(
+            tickerdata, backtest_args, cache=cache, ticker_interval=strategy.ticker_interval,
+            timerange=args.timerange, compact=args.compact)
+    else:
+        preprocessed = optimize.tickerdata_to_dataframe(dict(tickerdata), cache=cache,
+                                                        ticker_interval=strategy.ticker_interval,
+                                                        timerange=args.timerange,
+                                                        jobs=args.jobs,
+                                                        compact=args.compact)
+        min_date, max_date = get_timeframe(preprocessed)
+        # Execute backtest
+        results = backtest(dict(backtest_args, processed=preprocessed))
+    # Print timeframe and results
     logger.info('Measuring data from %s up to %s (%s days)..',
                 min_date.isoformat(),
                 max_date.isoformat(),
                 (max_date-min_date).days)
-    # Execute backtest and print results
-    sell_profit_only = config.get('experimental', {}).get('sell_profit_only', False)
-    use_sell_signal = config.get('experimental', {}).get('use_sell_signal', False)
-    results = backtest({'stake_amount': config['stake_amount'],
-                        'processed': preprocessed,
-                        'max_open_trades': max_open_trades,
-                        'realistic': args.realistic_simulation,
-                        'sell_profit_only': sell_profit_only,
-                        'use_sell_signal': use_sell_signal,
-                        'record': args.export
-                        })
     logger.info(
         '\n==================================== BACKTESTING REPORT ====================================\n%s',  # noqa
-        generate_text_table(data, results, config['stake_currency'])
+        generate_text_table(pairs, results, config['stake_currency'])
     )
@@ -0,0 +1,148 @@
+# pragma pylint: disable=missing-docstring
+
+"""
+On-disk cache of the preprocessed ticker data.
+An entry is keyed by the pair, the ticker interval, the timerange, a hash of the
+candles and a hash of the code computing the indicators, so a change to any of
+them results in a new entry. Entries are stored with optimize.store and evicted
+least recently used first once the cache exceeds its maximum size.
+"""
+import hashlib
+import inspect
+import logging
+import os
+import shutil
+from typing import Callable, List, Optional, Tuple
+
+from pandas import DataFrame
+
+from freqtrade import OperationalException, analyze
+from freqtrade.optimize.store import META_FILE, load_processed, save_processed
+from freqtrade.strategy.strategy import Strategy
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join('user_data', 'indicator_cache')
+DEFAULT_MAX_SIZE = 1024  # MB
+
+
+def get_indicator_source(indicator_func: Callable) -> str:
+    """
+    Returns the source code the indicators depend on: the module defining the
+    populate_indicators function, resolved to the strategy when the function delegates to it
+    :param indicator_func: populate_indicators function used by optimize.preprocess
+    :return: source code
+    """
+    if indicator_func is analyze.populate_indicators:
+        indicator_func = Strategy().custom_strategy.populate_indicators
+    return indicator_func.__qualname__ + inspect.getsource(inspect.getmodule(indicator_func))
+
+
+def get_cache_key(pair: str, ticker_interval: Optional[int], timerange: Optional[Tuple],
+                  dataframe: DataFrame, indicator_func: Callable) -> str:
+    """
+    Returns the key of the cache entry of the given data
+    :param pair: pair of the data
+    :param ticker_interval: ticker interval in minutes
+    :param timerange: timerange as returned by misc.parse_timerange
+    :param dataframe: DataFrame returned by analyze.parse_ticker_dataframe
+    :param indicator_func: populate_indicators function used by optimize.preprocess
+    :return: hex digest
+    """
+    key = hashlib.sha1()
+    key.update(repr((pair, ticker_interval, timerange)).encode())
+    for column in sorted(dataframe.columns):
+        key.update(column.encode())
+        key.update(dataframe[column].values.tobytes())
+    key.update(get_indicator_source(indicator_func).encode())
+    return key.hexdigest()
+
+
+class IndicatorCache(object):
+    """
+    Directory of cache entries, one sub directory per key.
+    The modification time of an entry is updated on each hit, it is used to evict
+    the least recently used entries once the total size exceeds `max_size` MB.
+    Several processes may share the directory: an entry removed by another process
+    is a cache miss.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_DIR, max_size: float = DEFAULT_MAX_SIZE) -> None:
+        self.path = path
+        self.max_size = max_size
+        # Worker processes leave the eviction to their parent
+        self.evict_on_put = True
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str, pair: str) -> Optional[DataFrame]:
+        """
+        Returns the cached DataFrame of the given key, None if it is not cached
+        :param key: key returned by get_cache_key
+        :param pair: pair of the data
+        :return: memory-mapped DataFrame, see optimize.store.load_processed
+        """
+        metafile = os.path.join(self.path, key, META_FILE)
+        try:
+            os.utime(metafile)
+            dataframe = load_processed(os.path.join(self.path, key))[pair]
+        except (OSError, OperationalException):
+            # Not cached, or evicted meanwhile by another process
+            self.misses += 1
+            return None
+        self.hits += 1
+        logger.debug('Loaded the indicators of %s from the cache', pair)
+        return dataframe
+
+    def put(self, key: str, pair: str, dataframe: DataFrame) -> None:
+        """
+        Stores a DataFrame in the cache and evicts the least recently used entries.
+        DataFrames with columns optimize.store can not save are not cached
+        :param key: key returned by get_cache_key
+        :param pair: pair of the data
+        :param dataframe: preprocessed DataFrame
+        :return: None
+        """
+        entry = os.path.join(self.path, key)
+        try:
+            save_processed(entry, {pair: dataframe})
+        except OperationalException as error:
+            logger.debug('Not caching the indicators of %s: %s', pair, error)
+            shutil.rmtree(entry, ignore_errors=True)
+            return
+        if self.evict_on_put:
+            self.evict()
+
+    def _entries(self) -> List[Tuple[float, int, str]]:
+        """
+        :return: list of (last use, size in bytes, path) of the entries, least recently used first
+        """
+        entries = []
+        for key in os.listdir(self.path):
+            entry = os.path.join(self.path, key)
+            metafile = os.path.join(entry, META_FILE)
+            try:
+                size = sum(os.path.getsize(os.path.join(entry, file))
+                           for file in os.listdir(entry))
+                entries.append((os.path.getmtime(metafile), size, entry))
+            except OSError:
+                # Being written, or removed meanwhile by another process
+                continue
+        return sorted(entries)
+
+    def evict(self) -> int:
+        """
+        Removes the least recently used entries until the cache fits in max_size
+        :return: number of removed entries
+        """
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for _, size, entry in entries:
+            if total <= self.max_size * 2**20:
+                break
+            logger.debug('Evicting %s from the indicator cache', entry)
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+            removed += 1
+        return removed
@@ -0,0 +1,231 @@
+# pragma pylint: disable=missing-docstring
+
+"""
+Catalog of the ticker data files of a data directory.
+catalog.json records for each {pair}-{interval} file its first and last candle,
+its number of candles, the gaps between candles and its checksum, so the available
+data can be checked without parsing the data files.
+"""
+import gzip
+import hashlib
+import json
+import logging
+import os
+import threading
+from typing import Dict, List, Optional
+
+import arrow
+import numpy as np
+
+from freqtrade import OperationalException
+
+logger = logging.getLogger(__name__)
+
+CATALOG_FILE = 'catalog.json'
+
+# Serializes the updates of the downloader threads
+_CATALOG_LOCK = threading.RLock()
+
+
+def get_entry_name(pair: str, interval: int) -> str:
+    return '{pair}-{interval}'.format(pair=pair.replace('-', '_'), interval=interval)
+
+
+def get_data_file(path: str, name: str) -> Optional[str]:
+    """
+    Returns the ticker data file of an entry, the .json.gz file is preferred
+    like optimize.load_tickerdata_json does
+    :return: path of the file, None if it does not exist
+    """
+    for file in [name + '.json.gz', name + '.json']:
+        if os.path.isfile(os.path.join(path, file)):
+            return os.path.join(path, file)
+    return None
+
+
+def _read_tickerlist(file: str) -> List[Dict]:
+    if file.endswith('.gz'):
+        with gzip.open(file) as tickerdata:
+            return json.load(tickerdata)
+    with open(file) as tickerdata:
+        return json.load(tickerdata)
+
+
+def _checksum(file: str) -> str:
+    checksum = hashlib.sha1()
+    with open(file, 'rb') as data:
+        for chunk in iter(lambda: data.read(2**20), b''):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def find_gaps(timestamps: List[str], interval: int) -> List[List[str]]:
+    """
+    Finds the missing candles of a ticker history
+    :param timestamps: sorted candle timestamps ('T')
+    :param interval: ticker interval in minutes
+    :return: list of [last candle before the gap, first candle after the gap]
+    """
+    if len(timestamps) < 2:
+        return []
+    dates = np.array(timestamps, dtype='datetime64[ms]').astype(np.int64)
+    gaps = np.flatnonzero(np.diff(dates) > interval * 60000)
+    return [[timestamps[index], timestamps[index + 1]] for index in gaps]
+
+
+def describe_file(file: str, interval: int) -> Dict:
+    """
+    Parses a ticker data file and returns its catalog entry
+    :param file: path of the .json or .json.gz file
+    :param interval: ticker interval in minutes
+    :return: dict
+    """
+    timestamps = [candle['T'] for candle in _read_tickerlist(file)]
+    return {
+        'file': os.path.basename(file),
+        'interval': interval,
+        'first': timestamps[0] if timestamps else None,
+        'last': timestamps[-1] if timestamps else None,
+        'rows': len(timestamps),
+        'gaps': find_gaps(timestamps, interval),
+        'checksum': _checksum(file),
+        'size': os.path.getsize(file),
+        'mtime': os.path.getmtime(file),
+    }
+
+
+def _is_up_to_date(entry: Optional[Dict], file: str) -> bool:
+    return entry is not None and entry['file'] == os.path.basename(file) \
+        and entry['size'] == os.path.getsize(file) and entry['mtime'] == os.path.getmtime(file)
+
+
+def load_catalog(path: str) -> Dict[str, Dict]:
+    """
+    Loads the catalog of a data directory
+    :param path: data directory
+    :return: dict with {pair}-{interval} as key and its entry as value, empty if there is none
+    """
+    catalog_file = os.path.join(path, CATALOG_FILE)
+    if not os.path.isfile(catalog_file):
+        return {}
+    with open(catalog_file) as file:
+        return json.load(file)
+
+
+def save_catalog(path: str, catalog: Dict[str, Dict]) -> None:
+    catalog_file = os.path.join(path, CATALOG_FILE)
+    with open(catalog_file + '.tmp', 'w') as file:
+        json.dump(catalog, file, indent=2, sort_keys=True)
+    os.replace(catalog_file + '.tmp', catalog_file)
+
+
+def get_entries(path: str, pairs: List[str], interval: int) -> Dict[str, Optional[Dict]]:
+    """
+    Returns the catalog entries of the given pairs. Missing and outdated entries are
+    created by parsing their data file, and the catalog is saved
+    :param path: data directory
+    :param pairs: list of pairs
+    :param interval: ticker interval in minutes
+    :return: dict with the pair as key and its entry as value, None if it has no data file
+    """
+    with _CATALOG_LOCK:
+        catalog = load_catalog(path)
+        entries = {}
+        changed = False
+        for pair in pairs:
+            name = get_entry_name(pair, interval)
+            file = get_data_file(path, name)
+            if file is None:
+                entries[pair] = None
+                continue
+            if not _is_up_to_date(catalog.get(name), file):
+                logger.info('Updating the catalog entry of %s', name)
+                catalog[name] = describe_file(file, interval)
+                changed = True
+            entries[pair] = catalog[name]
+        if changed:
+            save_catalog(path, catalog)
+    return entries
+
+
+def update_entry(path: str, pair: str, interval: int, appended: List[Dict],
+                 previous_size: int) -> None:
+    """
+    Updates the entry of a .json file the downloader appended candles to, without parsing
+    the file. The entry describes the file the data is loaded from: if a .json.gz file
+    exists, it has precedence and its entry is refreshed instead.
+    Only done if the data directory has a catalog: it is created by get_entries()
+    :param path: data directory
+    :param pair: pair of the file
+    :param interval: ticker interval in minutes
+    :param appended: candles appended to the .json file
+    :param previous_size: size of the .json file before the candles were appended
+    :return: None
+    """
+    with _CATALOG_LOCK:
+        catalog = load_catalog(path)
+        name = get_entry_name(pair, interval)
+        file = get_data_file(path, name)
+        if not catalog or file is None:
+            return
+        entry = catalog.get(name)
+        if not file.endswith('.json'):
+            logger.warning('%s is loaded instead of the downloaded %s.json',
+                           os.path.basename(file), name)
+            if not _is_up_to_date(entry, file):
+                catalog[name] = describe_file(file, interval)
+        elif entry is None or entry['file'] != os.path.basename(file) \
+                or entry['size'] != previous_size:
+            catalog[name] = describe_file(file, interval)
+        elif appended:
+            timestamps = [entry['last']] if entry['last'] else []
+            timestamps += [candle['T'] for candle in appended]
+            entry['first'] = entry['first'] or timestamps[0]
+            entry['last'] = timestamps[-1]
+            entry['rows'] += len(appended)
+            entry['gaps'] += find_gaps(timestamps, interval)
+            entry.update(checksum=_checksum(file), size=os.path.getsize(file),
+                         mtime=os.path.getmtime(file))
+        else:
+            entry['mtime'] = os.path.getmtime(file)
+        save_catalog(path, catalog)
+
+
+def check_timerange(path: str, pairs: List[str], interval: int, timerange) -> None:
+    """
+    Checks the data of the given pairs covers a date timerange, using the catalog.
+    Logs the pairs lacking data, and the gaps within the timerange
+    :param path: data directory
+    :param pairs: list of pairs
+    :param interval: ticker interval in minutes
+    :param timerange: timerange as returned by misc.parse_timerange
+    :return: None
+    :raise OperationalException: if no pair has data within the timerange
+    """
+    (stype, start, stop) = timerange
+    if 'date' not in stype:
+        return
+    start = arrow.get(start, 'YYYYMMDD').isoformat()[:19] if start else None
+    # The stop date is excluded, the last candle expected is the one before
+    last = arrow.get(stop, 'YYYYMMDD').shift(minutes=-interval).isoformat()[:19] if stop else None
+    stop = arrow.get(stop, 'YYYYMMDD').isoformat()[:19] if stop else None
+
+    entries = {pair: entry for pair, entry in get_entries(path, pairs, interval).items()
+               if entry is not None}
+    covered = 0
+    for pair, entry in entries.items():
+        if not entry['rows'] or (start and entry['last'] < start) \
+                or (stop and entry['first'] >= stop):
+            logger.warning('No data for %s within the timerange (data from %s to %s)',
+                           pair, entry['first'], entry['last'])
+            continue
+        covered += 1
+        if start and entry['first'] > start or last and entry['last'] < last:
+            logger.warning('The data of %s only covers %s to %s', pair,
+                           entry['first'], entry['last'])
+        for before, after in entry['gaps']:
+            if (not stop or before < stop) and (not start or after > start):
+                logger.warning('Missing candles for %s between %s and %s', pair, before, after)
+
+    if entries and not covered:
+        raise OperationalException('None of the pairs has data within the given timerange')
@@ -0,0 +1,61 @@
+# pragma pylint: disable=missing-docstring
+
+"""
+Converts the JSON ticker data files into binary columnar files (.npz)
+"""
+import logging
+import os
+import re
+from argparse import Namespace
+from typing import List
+
+from freqtrade import optimize
+
+logger = logging.getLogger(__name__)
+
+TICKERDATA_FILE_PATTERN = re.compile(r'^(?P<name>[0-9A-Z]+_[0-9A-Z]+-\d+)\.json(\.gz)?$')
+
+
+def convert_tickerdata(datadir: str, force: bool = False) -> List[str]:
+    """
+    Converts every {pair}-{interval}.json(.gz) file of the given directory
+    into {pair}-{interval}.npz. Up to date binary files are kept unless force is set.
+    :param datadir: directory of the ticker data files
+    :param force: convert the files even if the binary file is up to date
+    :return: list of the written binary files
+    """
+    path = optimize.make_testdata_path(datadir)
+    names = sorted({match.group('name') for match in map(TICKERDATA_FILE_PATTERN.match,
+                                                         os.listdir(path)) if match})
+    converted = []
+    for name in names:
+        file = os.path.join(path, name + '.json')
+        if not force and optimize.get_binary_file(file):
+            logger.info('%s is up to date', name)
+            continue
+
+        tickerlist = optimize.load_tickerdata_json(file)
+        if not tickerlist:
+            logger.warning('No ticker data in %s, skipping', name)
+            continue
+
+        binfile = os.path.join(path, name + '.npz')
+        optimize.save_tickerdata_binary(binfile, tickerlist)
+        logger.info('Converted %s (%d candles) into %s', name, len(tickerlist), binfile)
+        converted.append(binfile)
+    return converted
+
+
+def start(args: Namespace) -> None:
+    """
+    Start the convert-data subcommand
+    :param args: Cli args from Arguments()
+    :return: None
+    """
+    # Initialize logger
+    logging.basicConfig(
+        level=args.loglevel,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    )
+    converted = convert_tickerdata(args.datadir, force=args.force)
+    logger.info('Converted %d file(s) in %s', len(converted), args.datadir)
@@ -4,28 +4,34 @@
 import json
 import logging
 import os
-import pickle
 import signal
 import sys
-from functools import reduce
-from math import exp
+from concurrent.futures import ProcessPoolExecutor
+from math import ceil, exp
 from operator import itemgetter
-from typing import Dict, Any, Callable
+from typing import Dict, Any, Callable, List, Optional
 
 import numpy
 import talib.abstract as ta
-from hyperopt import STATUS_FAIL, STATUS_OK, Trials, fmin, hp, space_eval, tpe
+from hyperopt import (JOB_STATE_DONE, STATUS_FAIL, STATUS_OK, Trials, base, fmin, hp,
+                      space_eval, tpe)
 from hyperopt.mongoexp import MongoTrials
+from hyperopt.utils import coarse_utcnow
 from pandas import DataFrame
 
 import freqtrade.vendor.qtpylib.indicators as qtpylib
 # Monkey patch config
 from freqtrade import main  # noqa; noqa
-from freqtrade import exchange, misc, optimize
+from freqtrade import OperationalException, exchange, misc, optimize
 from freqtrade.exchange import Bittrex
 from freqtrade.misc import load_config
 from freqtrade.optimize import backtesting
 from freqtrade.optimize.backtesting import backtest
+from freqtrade.optimize.cache import IndicatorCache
+from freqtrade.optimize.journal import (JournaledTrials, append_trials, load_trials,
+                                        migrate_pickle)
+from freqtrade.optimize.masks import get_condition_masks
+from freqtrade.optimize.store import load_processed, save_processed
 from freqtrade.strategy.strategy import Strategy
 from user_data.hyperopt_conf import hyperopt_optimize_conf
 
@@ -54,10 +60,27 @@ EXPECTED_MAX_PROFIT = 3.0
 PROCESSED = None  # optimize.preprocess(optimize.load_data())
 OPTIMIZE_CONFIG = hyperopt_optimize_conf()
 
-# Hyperopt Trials
-TRIALS_FILE = os.path.join('user_data', 'hyperopt_trials.pickle')
+# Early rejection (--subset): epochs are first backtested on the first part of the data,
+# and only backtested on all of it if their loss is among the best PROMOTION_QUANTILE
+# of the epochs evaluated so far. The first MIN_SUBSET_EPOCHS epochs are always promoted
+PROCESSED_SUBSET = None
+PROMOTION_QUANTILE = 0.5
+MIN_SUBSET_EPOCHS = 10
+_SUBSET_LOSSES = []
+
+# Memory-mapped copy of PROCESSED opened by the MongoDB workers
+PROCESSED_STORE = os.path.join('user_data', 'hyperopt_processed')
+
+# Hyperopt Trials, journaled in TRIALS_FILE (see optimize.journal)
+TRIALS_FILE = os.path.join('user_data', 'hyperopt_trials.jsonl')
+# Trials pickled by former versions, converted into TRIALS_FILE
+LEGACY_TRIALS_FILE = os.path.join('user_data', 'hyperopt_trials.pickle')
 TRIALS = Trials()
 
+# Objectives evaluated by the workers of fmin_parallel(), inherited as they are forked
+_PARALLEL_OBJECTIVE = None
+_PARALLEL_SUBSET_OBJECTIVE = None
+
 main._CONF = OPTIMIZE_CONFIG
 
 
@@ -182,17 +205,19 @@ def populate_indicators(dataframe: DataFrame) -> DataFrame:
 
 
 def save_trials(trials, trials_path=TRIALS_FILE):
-    """Save hyperopt trials to file"""
+    """Append the hyperopt trials not journaled yet to the trials file"""
     logger.info('Saving Trials to \'{}\''.format(trials_path))
-    pickle.dump(trials, open(trials_path, 'wb'))
+    if isinstance(trials, JournaledTrials):
+        trials.flush()
+    else:
+        append_trials(trials_path, [doc for doc in trials.trials
+                                    if doc['state'] == JOB_STATE_DONE])
 
 
 def read_trials(trials_path=TRIALS_FILE):
-    """Read hyperopt trials file"""
+    """Read hyperopt trials file, the new trials are appended to it"""
     logger.info('Reading Trials from \'{}\''.format(trials_path))
-    trials = pickle.load(open(trials_path, 'rb'))
-    os.remove(trials_path)
-    return trials
+    return load_trials(trials_path)
 
 
 def log_trials_result(trials):
@@ -329,73 +354,83 @@ def hyperopt_space(selected_spaces: str) -> Dict[str, Any]:
     return spaces
 
 
+# Guards of the buy space without value: name -> condition
+GUARDS = {
+    'uptrend_long_ema': lambda dataframe: dataframe['ema50'] > dataframe['ema100'],
+    'macd_below_zero': lambda dataframe: dataframe['macd'] < 0,
+    'uptrend_short_ema': lambda dataframe: dataframe['ema5'] > dataframe['ema10'],
+    'over_sar': lambda dataframe: dataframe['close'] > dataframe['sar'],
+    'green_candle': lambda dataframe: dataframe['close'] > dataframe['open'],
+    'uptrend_sma': lambda dataframe: dataframe['sma'] > dataframe['sma'].shift(1),
+}
+
+# Guards comparing an indicator to the value picked by hyperopt: name -> (column, operator)
+THRESHOLD_GUARDS = {
+    'mfi': ('mfi', '<'),
+    'fastd': ('fastd', '<'),
+    'adx': ('adx', '>'),
+    'rsi': ('rsi', '<'),
+}
+
+# Triggers of the buy space: type -> condition
+TRIGGERS = {
+    'lower_bb': lambda dataframe: (
+        dataframe['close'] < dataframe['bb_lowerband']
+    ),
+    'lower_bb_tema': lambda dataframe: (
+        dataframe['tema'] < dataframe['bb_lowerband']
+    ),
+    'faststoch10': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['fastd'], 10.0
+    )),
+    'ao_cross_zero': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['ao'], 0.0
+    )),
+    'ema3_cross_ema10': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['ema3'], dataframe['ema10']
+    )),
+    'macd_cross_signal': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['macd'], dataframe['macdsignal']
+    )),
+    'sar_reversal': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['close'], dataframe['sar']
+    )),
+    'ht_sine': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['htleadsine'], dataframe['htsine']
+    )),
+    'heiken_reversal_bull': lambda dataframe: (
+        (qtpylib.crossed_above(dataframe['ha_close'], dataframe['ha_open'])) &
+        (dataframe['ha_low'] == dataframe['ha_open'])
+    ),
+    'di_cross': lambda dataframe: (qtpylib.crossed_above(
+        dataframe['plus_di'], dataframe['minus_di']
+    )),
+}
+
+
 def buy_strategy_generator(params: Dict[str, Any]) -> Callable:
     """
-    Define the buy strategy parameters to be used by hyperopt
+    Define the buy strategy parameters to be used by hyperopt.
+    The conditions are the GUARDS, THRESHOLD_GUARDS and TRIGGERS, their masks are
+    computed once per DataFrame (see optimize.masks)
     """
     def populate_buy_trend(dataframe: DataFrame) -> DataFrame:
+        masks = get_condition_masks(dataframe)
         conditions = []
         # GUARDS AND TRENDS
-        if 'uptrend_long_ema' in params and params['uptrend_long_ema']['enabled']:
-            conditions.append(dataframe['ema50'] > dataframe['ema100'])
-        if 'macd_below_zero' in params and params['macd_below_zero']['enabled']:
-            conditions.append(dataframe['macd'] < 0)
-        if 'uptrend_short_ema' in params and params['uptrend_short_ema']['enabled']:
-            conditions.append(dataframe['ema5'] > dataframe['ema10'])
-        if 'mfi' in params and params['mfi']['enabled']:
-            conditions.append(dataframe['mfi'] < params['mfi']['value'])
-        if 'fastd' in params and params['fastd']['enabled']:
-            conditions.append(dataframe['fastd'] < params['fastd']['value'])
-        if 'adx' in params and params['adx']['enabled']:
-            conditions.append(dataframe['adx'] > params['adx']['value'])
-        if 'rsi' in params and params['rsi']['enabled']:
-            conditions.append(dataframe['rsi'] < params['rsi']['value'])
-        if 'over_sar' in params and params['over_sar']['enabled']:
-            conditions.append(dataframe['close'] > dataframe['sar'])
-        if 'green_candle' in params and params['green_candle']['enabled']:
-            conditions.append(dataframe['close'] > dataframe['open'])
-        if 'uptrend_sma' in params and params['uptrend_sma']['enabled']:
-            prevsma = dataframe['sma'].shift(1)
-            conditions.append(dataframe['sma'] > prevsma)
+        for name, condition in GUARDS.items():
+            if name in params and params[name]['enabled']:
+                conditions.append(masks.condition(name, condition))
+        for name, (column, operator) in THRESHOLD_GUARDS.items():
+            if name in params and params[name]['enabled']:
+                conditions.append(masks.threshold(column, operator, params[name]['value']))
 
         # TRIGGERS
-        triggers = {
-            'lower_bb': (
-                dataframe['close'] < dataframe['bb_lowerband']
-            ),
-            'lower_bb_tema': (
-                dataframe['tema'] < dataframe['bb_lowerband']
-            ),
-            'faststoch10': (qtpylib.crossed_above(
-                dataframe['fastd'], 10.0
-            )),
-            'ao_cross_zero': (qtpylib.crossed_above(
-                dataframe['ao'], 0.0
-            )),
-            'ema3_cross_ema10': (qtpylib.crossed_above(
-                dataframe['ema3'], dataframe['ema10']
-            )),
-            'macd_cross_signal': (qtpylib.crossed_above(
-                dataframe['macd'], dataframe['macdsignal']
-            )),
-            'sar_reversal': (qtpylib.crossed_above(
-                dataframe['close'], dataframe['sar']
-            )),
-            'ht_sine': (qtpylib.crossed_above(
-                dataframe['htleadsine'], dataframe['htsine']
-            )),
-            'heiken_reversal_bull': (
-                (qtpylib.crossed_above(dataframe['ha_close'], dataframe['ha_open'])) &
-                (dataframe['ha_low'] == dataframe['ha_open'])
-            ),
-            'di_cross': (qtpylib.crossed_above(
-                dataframe['plus_di'], dataframe['minus_di']
-            )),
-        }
-        conditions.append(triggers.get(params['trigger']['type']))
+        trigger = params['trigger']['type']
+        conditions.append(masks.condition('trigger-' + trigger, TRIGGERS[trigger]))
 
         dataframe.loc[
-            reduce(lambda x, y: x & y, conditions),
+            numpy.logical_and.reduce(conditions),
             'buy'] = 1
 
         return dataframe
@@ -403,22 +438,145 @@ def buy_strategy_generator(params: Dict[str, Any]) -> Callable:
     return populate_buy_trend
 
 
-def generate_optimizer(args):
-    def optimizer(params):
-        global _CURRENT_TRIES
+def get_processed() -> Dict[str, DataFrame]:
+    """
+    Returns the preprocessed data used by the optimizer.
+    MongoDB workers do not run start(), they open the store written by it instead
+    """
+    global PROCESSED
+    if PROCESSED is None:
+        PROCESSED = load_processed(PROCESSED_STORE)
+    return PROCESSED
+
+
+def get_processed_subset(fraction: float) -> Dict[str, DataFrame]:
+    """
+    Returns the candles of PROCESSED within the first `fraction` of its timeframe
+    :param fraction: part of the timeframe, between 0 and 1
+    :return: dict with the pair as key and its DataFrame as value
+    """
+    global PROCESSED_SUBSET
+    if PROCESSED_SUBSET is None:
+        processed = get_processed()
+        min_date, max_date = backtesting.get_timeframe(processed)
+        end_date = min_date + (max_date - min_date) * fraction
+        PROCESSED_SUBSET = {pair: frame[frame['date'] <= end_date.datetime].copy()
+                            for pair, frame in processed.items()}
+    return PROCESSED_SUBSET
 
-        strategy = Strategy()
-        if has_space(args.spaces, 'roi'):
-            strategy.minimal_roi = generate_roi_table(params)
 
-        if has_space(args.spaces, 'buy'):
-            backtesting.populate_buy_trend = buy_strategy_generator(params)
+def reject_on_subset(subset_loss: float) -> Optional[str]:
+    """
+    Decides whether an epoch is promoted to the whole data from its loss on the subset.
+    Only called by the main process, so every epoch is ranked against the same history
+    :param subset_loss: loss of the epoch on the subset
+    :return: reason of the rejection, None if the epoch is promoted
+    """
+    _SUBSET_LOSSES.append(subset_loss)
+    if len(_SUBSET_LOSSES) <= MIN_SUBSET_EPOCHS:
+        return None
+    losses = sorted(_SUBSET_LOSSES)
+    threshold = losses[max(0, int(ceil(len(losses) * PROMOTION_QUANTILE)) - 1)]
+    if subset_loss == float('inf') or subset_loss > threshold:
+        return 'rejected on the data subset: loss {:.5f} above {:.5f} (best {:.0%} of {})'.format(
+            subset_loss, threshold, PROMOTION_QUANTILE, len(losses))
+    return None
+
+
+def check_jobs(args) -> None:
+    """
+    Refuses --jobs before the data is loaded where fmin_parallel can not fork its workers
+    :raise OperationalException: if the platform does not support fork
+    """
+    if args.jobs > 1 and not args.mongodb and optimize.get_fork_context() is None:
+        raise OperationalException('--jobs requires fork, which this platform does not support')
+
+
+def init_subset(args) -> None:
+    """
+    Resets the state of the early rejection, and prepares the data subset
+    before the workers of fmin_parallel are forked, so they share it.
+    The MongoDB workers can not share the ranking of the epochs, --subset is ignored then
+    """
+    global PROCESSED_SUBSET
+    PROCESSED_SUBSET = None
+    del _SUBSET_LOSSES[:]
+    if args.subset and args.mongodb:
+        logger.warning('--subset is not supported with --mongodb, ignoring it')
+        args.subset = None
+    if args.subset:
+        subset = get_processed_subset(args.subset)
+        logger.info('Rejecting epochs early on the first %d%% of the data (%d candles) ...',
+                    args.subset * 100, sum(len(frame) for frame in subset.values()))
+
+
+def log_subset_rejections(args, trials) -> None:
+    if not args.subset:
+        return
+    rejected = [result for result in trials.results if 'subset_loss' in result]
+    logger.info('%d of %d epochs rejected on the data subset', len(rejected), len(trials.results))
+
+
+def set_params(args, params: Dict[str, Any]) -> None:
+    """
+    Applies the parameters picked by hyperopt to the strategy and to backtesting
+    """
+    strategy = Strategy()
+    if has_space(args.spaces, 'roi'):
+        strategy.minimal_roi = generate_roi_table(params)
 
-        if has_space(args.spaces, 'stoploss'):
-            strategy.stoploss = params['stoploss']
+    if has_space(args.spaces, 'buy'):
+        backtesting.populate_buy_trend = buy_strategy_generator(params)
 
+    if has_space(args.spaces, 'stoploss'):
+        strategy.stoploss = params['stoploss']
+
+
+def generate_subset_objective(args) -> Callable:
+    """
+    Returns the function computing the loss of parameters on the data subset,
+    with the results extrapolated to the whole timeframe
+    """
+    def subset_objective(params) -> float:
+        set_params(args, params)
         results = backtest({'stake_amount': OPTIMIZE_CONFIG['stake_amount'],
-                            'processed': PROCESSED,
+                            'processed': get_processed_subset(args.subset),
+                            'realistic': args.realistic_simulation,
+                            })
+        trade_count = len(results.index)
+        trade_duration = results.duration.mean()
+        if not trade_count or trade_duration > MAX_ACCEPTED_TRADE_DURATION:
+            return float('inf')
+        return calculate_loss(results.profit_percent.sum() / args.subset,
+                              int(trade_count / args.subset), trade_duration)
+
+    return subset_objective
+
+
+def evaluate_subset_loss(subset_loss: float) -> Optional[Dict[str, Any]]:
+    """
+    Ranks the loss of an epoch on the data subset, see reject_on_subset
+    :return: result of the rejected epoch, None if it is promoted to the whole data
+    """
+    reason = reject_on_subset(subset_loss)
+    if reason is None:
+        return None
+    return {
+        'status': STATUS_FAIL,
+        'loss': float('inf'),
+        'subset_loss': subset_loss,
+        'reason': reason,
+    }
+
+
+def generate_full_objective(args) -> Callable:
+    """
+    Returns the function backtesting parameters on the whole data
+    """
+    def full_objective(params):
+        set_params(args, params)
+        results = backtest({'stake_amount': OPTIMIZE_CONFIG['stake_amount'],
+                            'processed': get_processed(),
                             'realistic': args.realistic_simulation,
                             })
         result_explanation = format_results(results)
@@ -428,32 +586,250 @@ def generate_optimizer(args):
         trade_duration = results.duration.mean()
 
         if trade_count == 0 or trade_duration > MAX_ACCEPTED_TRADE_DURATION:
-            print('.', end='')
             return {
                 'status': STATUS_FAIL,
-                'loss': float('inf')
+                'loss': float('inf'),
+                'reason': 'no trade' if trade_count == 0 else 'trades too long',
             }
 
         loss = calculate_loss(total_profit, trade_count, trade_duration)
 
-        _CURRENT_TRIES += 1
-
-        log_results({
-            'loss': loss,
-            'current_tries': _CURRENT_TRIES,
-            'total_tries': TOTAL_TRIES,
-            'result': result_explanation,
-        })
-
         return {
             'loss': loss,
             'status': STATUS_OK,
             'result': result_explanation,
         }
 
+    return full_objective
+
+
+def generate_objective(args) -> Callable:
+    """
+    Returns the objective function minimized by hyperopt, without logging its results.
+    With args.subset, the epochs are first ranked on the data subset
+    """
+    full_objective = generate_full_objective(args)
+    subset_objective = generate_subset_objective(args) if args.subset else None
+
+    def objective(params):
+        if subset_objective is not None:
+            rejection = evaluate_subset_loss(subset_objective(params))
+            if rejection is not None:
+                return rejection
+        return full_objective(params)
+
+    return objective
+
+
+def log_evaluation(result: Dict[str, Any]) -> None:
+    """ counts and logs the result of an evaluation of the objective """
+    global _CURRENT_TRIES
+
+    if result['status'] == STATUS_FAIL:
+        print('.', end='')
+        return
+
+    _CURRENT_TRIES += 1
+
+    log_results({
+        'loss': result['loss'],
+        'current_tries': _CURRENT_TRIES,
+        'total_tries': TOTAL_TRIES,
+        'result': result['result'],
+    })
+
+
+def get_params_key(spaces, params: Dict[str, Any]) -> str:
+    """
+    Returns the canonical form of the parameters of an epoch: the parameters
+    leading to the same enabled guards, trigger, ROI table and stoploss have the same key
+    :param spaces: spaces optimized, see hyperopt_space
+    :param params: parameters picked by hyperopt
+    :return: key
+    """
+    key: Dict[str, Any] = {}
+    if has_space(spaces, 'buy'):
+        key['guards'] = sorted(name for name in GUARDS
+                               if name in params and params[name]['enabled'])
+        key['thresholds'] = sorted([name, float(params[name]['value'])]
+                                   for name in THRESHOLD_GUARDS
+                                   if name in params and params[name]['enabled'])
+        key['trigger'] = params['trigger']['type']
+    if has_space(spaces, 'roi'):
+        key['roi'] = sorted([float(duration), round(float(roi), 8)]
+                            for duration, roi in generate_roi_table(params).items())
+    if has_space(spaces, 'stoploss'):
+        key['stoploss'] = round(float(params['stoploss']), 8)
+    return json.dumps(key, sort_keys=True)
+
+
+class EvaluationCache(object):
+    """
+    Results of the objective by canonical parameters (see get_params_key).
+    hp.choice and hp.quniform make hyperopt pick equivalent parameters again,
+    their result is returned without backtesting them again.
+    """
+
+    def __init__(self, spaces) -> None:
+        self.spaces = spaces
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, params: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        :return: copy of the result of equivalent parameters, None if they were not evaluated
+        """
+        result = self.results.get(get_params_key(self.spaces, params))
+        if result is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return dict(result)
+
+    def put(self, params: Dict[str, Any], result: Dict[str, Any]) -> None:
+        self.results[get_params_key(self.spaces, params)] = dict(result)
+
+    def log_hit_rate(self) -> None:
+        total = self.hits + self.misses
+        if total:
+            logger.info('Evaluation cache: %d hit(s), %d miss(es) (%.1f%% hit rate)',
+                        self.hits, self.misses, 100.0 * self.hits / total)
+
+
+def generate_optimizer(args, cache: Optional[EvaluationCache] = None):
+    objective = generate_objective(args)
+
+    def optimizer(params):
+        result = cache.get(params) if cache is not None else None
+        if result is None:
+            result = objective(params)
+            if cache is not None:
+                cache.put(params, result)
+        log_evaluation(result)
+        return result
+
     return optimizer
 
 
+def _evaluate_parallel(params: Dict[str, Any]) -> Dict[str, Any]:
+    # SIGINT is handled by the main process, which saves the trials
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    return _PARALLEL_OBJECTIVE(params)
+
+
+def _evaluate_subset_parallel(params: Dict[str, Any]) -> float:
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    return _PARALLEL_SUBSET_OBJECTIVE(params)
+
+
+def _evaluate_batch(executor: ProcessPoolExecutor, params: List[Dict[str, Any]],
+                    cache: Optional[EvaluationCache],
+                    subset_objective: Optional[Callable]) -> List[Dict[str, Any]]:
+    """
+    Evaluates a batch of parameters in the workers of fmin_parallel.
+    The losses on the data subset are ranked here, in the order of the batch
+    :return: results, in the order of the parameters
+    """
+    results = [cache.get(param) if cache is not None else None for param in params]
+    missing = [index for index, result in enumerate(results) if result is None]
+    promoted = missing
+    if subset_objective is not None:
+        subset_losses = executor.map(_evaluate_subset_parallel,
+                                     [params[index] for index in missing])
+        for index, subset_loss in zip(missing, list(subset_losses)):
+            results[index] = evaluate_subset_loss(subset_loss)
+        promoted = [index for index in missing if results[index] is None]
+
+    evaluated = executor.map(_evaluate_parallel, [params[index] for index in promoted])
+    for index, result in zip(promoted, evaluated):
+        results[index] = result
+    if cache is not None:
+        for index in missing:
+            cache.put(params[index], results[index])
+    return results
+
+
+def _suggest_batch(domain: base.Domain, trials: Trials, tids: List[int],
+                   rstate: numpy.random.RandomState) -> List[Dict[str, Any]]:
+    """
+    Suggests the trials of a batch one at a time with the constant liar strategy.
+    TPE only learns from the losses of the trials: while the batch is suggested, its
+    pending trials get the mean loss of the finished trials, so the next suggestion
+    is not drawn from the same history. Their result is reset once the batch is complete
+    :return: trial documents of the batch, in the order of the tids
+    """
+    losses = [result['loss'] for result in trials.results
+              if result.get('status') == STATUS_OK and numpy.isfinite(result['loss'])]
+    for tid in tids:
+        docs = tpe.suggest([tid], domain, trials, rstate.randint(2 ** 31 - 1))
+        if losses:
+            for doc in docs:
+                doc['result'] = {'status': STATUS_OK, 'loss': float(numpy.mean(losses))}
+        trials.insert_trial_docs(docs)
+        trials.refresh()
+
+    docs = sorted((doc for doc in trials.trials if doc['tid'] in tids), key=itemgetter('tid'))
+    for doc in docs:
+        doc['result'] = {'status': base.STATUS_NEW}
+    return docs
+
+
+def fmin_parallel(objective: Callable, space: Dict[str, Any], trials: Trials,
+                  max_evals: int, jobs: int,
+                  cache: Optional[EvaluationCache] = None,
+                  subset_objective: Optional[Callable] = None) -> Dict[str, Any]:
+    """
+    Minimizes the objective like hyperopt.fmin, evaluating batches of `jobs` TPE
+    suggestions in a process pool. The workers are forked and inherit PROCESSED.
+    The batches are suggested with the constant liar strategy, see _suggest_batch.
+    :param objective: function returned by generate_full_objective
+    :param space: hyperopt space
+    :param trials: Trials receiving the results
+    :param max_evals: total number of trials
+    :param jobs: number of worker processes
+    :param cache: results of the parameters already evaluated (optional),
+    only the other parameters are sent to the workers
+    :param subset_objective: function returned by generate_subset_objective (optional).
+    The workers return the losses on the subset, the epochs are promoted to the
+    objective by this process (see evaluate_subset_loss)
+    :return: best parameters, as returned by fmin
+    :raise OperationalException: if the platform does not support fork
+    """
+    global _PARALLEL_OBJECTIVE, _PARALLEL_SUBSET_OBJECTIVE
+    if optimize.get_fork_context() is None:
+        raise OperationalException(
+            '--jobs requires fork, which this platform does not support')
+    _PARALLEL_OBJECTIVE = objective
+    _PARALLEL_SUBSET_OBJECTIVE = subset_objective
+    domain = base.Domain(objective, space)
+    rstate = numpy.random.RandomState()
+    try:
+        with optimize.create_process_pool(jobs) as executor:
+            trials.refresh()
+            while len(trials.trials) < max_evals:
+                tids = trials.new_trial_ids(min(jobs, max_evals - len(trials.trials)))
+                docs = _suggest_batch(domain, trials, tids, rstate)
+                params = [space_eval(space, {key: value[0]
+                                             for key, value in doc['misc']['vals'].items()
+                                             if value})
+                          for doc in docs]
+                results = _evaluate_batch(executor, params, cache, subset_objective)
+                for doc, result in zip(docs, results):
+                    doc['state'] = base.JOB_STATE_DONE
+                    doc['result'] = result
+                    doc['refresh_time'] = coarse_utcnow()
+                    log_evaluation(result)
+                trials.refresh()
+    finally:
+        _PARALLEL_OBJECTIVE = None
+        _PARALLEL_SUBSET_OBJECTIVE = None
+
+    if not any(result['status'] == STATUS_OK for result in trials.results):
+        raise ValueError('No trial succeeded')
+    return trials.argmin
+
+
 def format_results(results: DataFrame):
     return ('{:6d} trades. Avg profit {: 5.2f}%. '
             'Total profit {: 11.8f} BTC ({:.4f}Σ%). Avg duration {:5.1f} mins.').format(
@@ -478,6 +854,8 @@ def start(args):
         format='\n%(message)s',
     )
 
+    check_jobs(args)
+
     logger.info('Using config: %s ...', args.config)
     config = load_config(args.config)
     pairs = config['exchange']['pair_whitelist']
@@ -498,18 +876,32 @@ def start(args):
                               timerange=timerange)
     if has_space(args.spaces, 'buy'):
         optimize.populate_indicators = populate_indicators
-    PROCESSED = optimize.tickerdata_to_dataframe(data)
+    cache = None
+    if args.indicator_cache:
+        cache = IndicatorCache(max_size=args.indicator_cache_size)
+    PROCESSED = optimize.tickerdata_to_dataframe(data, cache=cache,
+                                                 ticker_interval=strategy.ticker_interval,
+                                                 timerange=args.timerange,
+                                                 jobs=args.jobs,
+                                                 compact=args.compact)
 
     if args.mongodb:
         logger.info('Using mongodb ...')
         logger.info('Start scripts/start-mongodb.sh and start-hyperopt-worker.sh manually!')
 
+        # Workers and this process share one memory-mapped copy of the data
+        save_processed(PROCESSED_STORE, PROCESSED)
+        PROCESSED = load_processed(PROCESSED_STORE)
+
         db_name = 'freqtrade_hyperopt'
         TRIALS = MongoTrials('mongo://127.0.0.1:1234/{}/jobs'.format(db_name), exp_key='exp1')
     else:
         logger.info('Preparing Trials..')
         signal.signal(signal.SIGINT, signal_handler)
+        if os.path.exists(LEGACY_TRIALS_FILE):
+            migrate_pickle(LEGACY_TRIALS_FILE, TRIALS_FILE)
         # read trials file if we have one
+        TRIALS = JournaledTrials(TRIALS_FILE)
         if os.path.exists(TRIALS_FILE):
             TRIALS = read_trials()
 
@@ -519,14 +911,29 @@ def start(args):
                 'Continuing with trials. Current: {}, Total: {}'
                 .format(_CURRENT_TRIES, TOTAL_TRIES))
 
+    init_subset(args)
+    evaluation_cache = EvaluationCache(args.spaces)
+
     try:
-        best_parameters = fmin(
-            fn=generate_optimizer(args),
-            space=hyperopt_space(args.spaces),
-            algo=tpe.suggest,
-            max_evals=TOTAL_TRIES,
-            trials=TRIALS
-        )
+        if not args.mongodb and args.jobs > 1:
+            logger.info('Evaluating %d epochs at a time ...', args.jobs)
+            best_parameters = fmin_parallel(
+                generate_full_objective(args),
+                hyperopt_space(args.spaces),
+                TRIALS,
+                max_evals=TOTAL_TRIES,
+                jobs=args.jobs,
+                cache=evaluation_cache,
+                subset_objective=generate_subset_objective(args) if args.subset else None
+            )
+        else:
+            best_parameters = fmin(
+                fn=generate_optimizer(args, evaluation_cache),
+                space=hyperopt_space(args.spaces),
+                algo=tpe.suggest,
+                max_evals=TOTAL_TRIES,
+                trials=TRIALS
+            )
 
         results = sorted(TRIALS.results, key=itemgetter('loss'))
         best_result = results[0]['result']
@@ -547,6 +954,8 @@ def start(args):
     if 'roi_t1' in best_parameters:
         logger.info('ROI table:\n%s', generate_roi_table(best_parameters))
     logger.info('Best Result:\n%s', best_result)
+    log_subset_rejections(args, TRIALS)
+    evaluation_cache.log_hit_rate()
 
     # Store trials result to file to resume next time
     save_trials(TRIALS)
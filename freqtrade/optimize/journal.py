@@ -0,0 +1,132 @@
+# pragma pylint: disable=missing-docstring
+
+"""
+Append-only journal of the hyperopt trials.
+Each finished trial is appended to a JSON lines file as soon as hyperopt
+records it, so an interrupted run loses nothing and can be resumed.
+A line is the hyperopt trial document: its parameters are in misc.vals,
+its loss and result summary in result.
+"""
+import json
+import logging
+import os
+import pickle
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, List, Set
+
+import numpy as np
+from hyperopt import JOB_STATE_DONE, Trials
+
+logger = logging.getLogger(__name__)
+
+DATETIME_FORMAT = '%Y-%m-%dT%H:%M:%S.%f'
+DATETIME_FIELDS = ['book_time', 'refresh_time']
+
+
+def _to_json(value):
+    if isinstance(value, datetime):
+        return value.strftime(DATETIME_FORMAT)
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError('{!r} is not JSON serializable'.format(value))
+
+
+def append_trials(path: str, docs: Iterable[Dict]) -> None:
+    """
+    Appends trial documents to the journal
+    :param path: journal file, created if it does not exist
+    :param docs: hyperopt trial documents
+    :return: None
+    """
+    with open(path, 'a+') as journal:
+        if journal.tell():
+            # Terminate a last line truncated by a crash
+            journal.seek(journal.tell() - 1)
+            if journal.read(1) != '\n':
+                journal.write('\n')
+        for doc in docs:
+            journal.write(json.dumps(doc, default=_to_json) + '\n')
+
+
+def read_journal(path: str) -> Iterator[Dict]:
+    """
+    Reads the trial documents of a journal one at a time.
+    A last line truncated by a crash is skipped
+    :param path: journal file
+    :return: iterator of trial documents
+    """
+    with open(path) as journal:
+        for number, line in enumerate(journal, 1):
+            try:
+                doc = json.loads(line)
+            except ValueError:
+                logger.warning('Skipping the corrupted line %d of %s', number, path)
+                continue
+            for field in DATETIME_FIELDS:
+                if doc.get(field):
+                    doc[field] = datetime.strptime(doc[field], DATETIME_FORMAT)
+            yield doc
+
+
+class JournaledTrials(Trials):
+    """
+    hyperopt Trials appending the trials to a journal once they are done.
+    hyperopt refreshes the trials after each evaluation, the new ones are written then
+    """
+
+    def __init__(self, path: str, exp_key=None, refresh: bool = True) -> None:
+        self.path = path
+        self._journaled: Set[int] = set()
+        super().__init__(exp_key=exp_key, refresh=refresh)
+
+    def new_trial_ids(self, n: int) -> List[int]:
+        # The tids of a resumed journal may have gaps, new ones follow the highest
+        start = max(self._ids, default=-1) + 1
+        tids = list(range(start, start + n))
+        self._ids.update(tids)
+        return tids
+
+    def refresh(self) -> None:
+        super().refresh()
+        self.flush()
+
+    def flush(self) -> None:
+        """
+        Appends the finished trials not in the journal yet
+        :return: None
+        """
+        docs = [doc for doc in self._dynamic_trials
+                if doc['state'] == JOB_STATE_DONE and doc['tid'] not in self._journaled]
+        if docs:
+            append_trials(self.path, docs)
+            self._journaled.update(doc['tid'] for doc in docs)
+
+
+def load_trials(path: str) -> JournaledTrials:
+    """
+    Rebuilds the trials of a journal, further trials are appended to it
+    :param path: journal file
+    :return: JournaledTrials
+    """
+    trials = JournaledTrials(path)
+    # A trial journaled twice (e.g. saved by several MongoDB runs) is kept once
+    docs = {doc['tid']: doc for doc in read_journal(path) if doc['state'] == JOB_STATE_DONE}
+    trials._journaled.update(docs)
+    trials.insert_trial_docs(list(docs.values()))
+    trials.refresh()
+    return trials
+
+
+def migrate_pickle(pickle_path: str, path: str) -> None:
+    """
+    Converts the trials pickled by former versions into a journal,
+    and removes the pickle file
+    :param pickle_path: file written by pickle.dump(trials)
+    :param path: journal file
+    :return: None
+    """
+    logger.info('Converting %s into %s', pickle_path, path)
+    with open(pickle_path, 'rb') as file:
+        trials = pickle.load(file)
+    append_trials(path, [doc for doc in trials.trials if doc['state'] == JOB_STATE_DONE])
+    os.remove(pickle_path)
@@ -0,0 +1,91 @@
+# pragma pylint: disable=missing-docstring
+
+"""
+Boolean masks of the buy conditions evaluated by hyperopt.
+The indicators of the preprocessed data do not change between epochs, so the
+mask of a condition is computed once per DataFrame and reused by every epoch
+selecting it. Threshold conditions are looked up in the sorted values of their
+column, and the mask of each threshold value is kept as well.
+"""
+import weakref
+from typing import Callable, Dict, Tuple
+
+import numpy as np
+from pandas import DataFrame
+
+# ConditionMasks of the live DataFrames, by id
+_MASKS: Dict[int, 'ConditionMasks'] = {}
+
+
+def get_condition_masks(dataframe: DataFrame) -> 'ConditionMasks':
+    """
+    Returns the masks of the given DataFrame, created on first use and
+    dropped once the DataFrame is garbage collected
+    :param dataframe: preprocessed DataFrame
+    :return: ConditionMasks
+    """
+    masks = _MASKS.get(id(dataframe))
+    if masks is None or masks.dataframe() is not dataframe:
+        masks = ConditionMasks(dataframe)
+        _MASKS[id(dataframe)] = masks
+    return masks
+
+
+class ConditionMasks(object):
+    """
+    Masks of the conditions of one DataFrame, keyed by condition name or by threshold.
+    The DataFrame is only referenced weakly, its masks must not outlive it.
+    """
+
+    def __init__(self, dataframe: DataFrame) -> None:
+        key = id(dataframe)
+        self.dataframe = weakref.ref(dataframe, lambda _: _MASKS.pop(key, None))
+        self._masks: Dict = {}
+        self._sorted: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def condition(self, name: str, condition: Callable[[DataFrame], object]) -> np.ndarray:
+        """
+        Returns the mask of a condition not depending on the hyperopt parameters
+        :param name: name of the condition
+        :param condition: function returning the boolean Series of the condition
+        :return: boolean array
+        """
+        if name not in self._masks:
+            self._masks[name] = np.asarray(condition(self.dataframe()), dtype=bool)
+        return self._masks[name]
+
+    def _sorted_column(self, column: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        :return: tuple (indexes of the non-NaN values in sorted order, sorted values)
+        """
+        if column not in self._sorted:
+            values = self.dataframe()[column].values
+            order = np.argsort(values, kind='mergesort')  # NaNs are sorted last
+            valid = len(values) - int(np.count_nonzero(np.isnan(values)))
+            self._sorted[column] = (order[:valid], values[order[:valid]])
+        return self._sorted[column]
+
+    def threshold(self, column: str, operator: str, value: float) -> np.ndarray:
+        """
+        Returns the mask of `dataframe[column] <operator> value`. NaNs never match,
+        as with pandas comparisons
+        :param column: column of the DataFrame
+        :param operator: one of '<', '<=', '>', '>='
+        :param value: threshold
+        :return: boolean array
+        """
+        key = (column, operator, value)
+        if key not in self._masks:
+            order, values = self._sorted_column(column)
+            if operator in ('<', '<='):
+                selected = order[:np.searchsorted(values, value,
+                                                  side='left' if operator == '<' else 'right')]
+            elif operator in ('>', '>='):
+                selected = order[np.searchsorted(values, value,
+                                                 side='right' if operator == '>' else 'left'):]
+            else:
+                raise ValueError('Unsupported operator: {}'.format(operator))
+            mask = np.zeros(len(self.dataframe()), dtype=bool)
+            mask[selected] = True
+            self._masks[key] = mask
+        return self._masks[key]
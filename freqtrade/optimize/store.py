@@ -0,0 +1,96 @@
+# pragma pylint: disable=missing-docstring
+
+"""
+Memory-mapped store of preprocessed ticker data.
+The columns of each pair are saved as one 2D .npy file per dtype. Opening the store
+maps these files read-only, so every process using the same store shares one
+physical copy of the data through the page cache instead of loading its own.
+"""
+import json
+import logging
+import os
+import shutil
+from typing import Dict
+
+import numpy as np
+from pandas import DataFrame, concat, to_datetime
+
+from freqtrade import OperationalException
+
+logger = logging.getLogger(__name__)
+
+META_FILE = 'meta.json'
+
+
+def _block_file(path: str, pair: str, index: int) -> str:
+    return os.path.join(path, '{pair}-{index}.npy'.format(pair=pair, index=index))
+
+
+def save_processed(path: str, processed: Dict[str, DataFrame]) -> None:
+    """
+    Saves preprocessed ticker data into the given directory, replacing its previous content.
+    Only numeric, boolean and datetime columns are supported.
+    :param path: directory of the store
+    :param processed: dict with the pair as key and its preprocessed DataFrame as value
+    :return: None
+    """
+    if os.path.isdir(path):
+        shutil.rmtree(path)
+    os.makedirs(path)
+
+    meta = {}
+    for pair, frame in processed.items():
+        blocks = {}
+        for column in frame.columns:
+            dtype = frame[column].dtype
+            if dtype.kind not in 'biufM':
+                raise OperationalException(
+                    'Column {} of {} has dtype {}, which can not be memory-mapped'.format(
+                        column, pair, dtype))
+            blocks.setdefault(str(dtype), []).append(column)
+
+        meta[pair] = []
+        for index, (dtype, columns) in enumerate(blocks.items()):
+            values = np.column_stack([frame[column].values for column in columns])
+            if values.dtype.kind == 'M':
+                # Timezone aware columns are stored in UTC
+                values = values.astype('datetime64[ns]').view(np.int64)
+            np.save(_block_file(path, pair, index), values)
+            meta[pair].append({'dtype': dtype, 'columns': columns})
+
+    # Written last, an interrupted save leaves no readable store behind
+    with open(os.path.join(path, META_FILE), 'w') as metafile:
+        json.dump(meta, metafile)
+    logger.info('Saved %d pair(s) into %s', len(processed), path)
+
+
+def load_processed(path: str) -> Dict[str, DataFrame]:
+    """
+    Opens a store written by save_processed.
+    Each DataFrame is backed by the read-only memory-mapped files of the store: columns
+    can be added to it, but its stored values can not be modified in place.
+    :param path: directory of the store
+    :return: dict with the pair as key and its preprocessed DataFrame as value
+    """
+    metafile = os.path.join(path, META_FILE)
+    if not os.path.isfile(metafile):
+        raise OperationalException('No preprocessed data store in {}'.format(path))
+    with open(metafile) as file:
+        meta = json.load(file)
+
+    processed = {}
+    for pair, blocks in meta.items():
+        frames = []
+        for index, block in enumerate(blocks):
+            values = np.load(_block_file(path, pair, index), mmap_mode='r')
+            if block['dtype'].startswith('datetime64'):
+                # Datetime columns are small, they are converted instead of mapped
+                frames.append(DataFrame({
+                    column: to_datetime(values[:, position], utc='UTC' in block['dtype'])
+                    for position, column in enumerate(block['columns'])
+                }))
+            else:
+                frames.append(DataFrame(values, columns=block['columns'], copy=False))
+        processed[pair] = concat(frames, axis=1, copy=False) if len(frames) > 1 else frames[0]
+    logger.info('Opened %d pair(s) from %s', len(processed), path)
+    return processed
@@ -0,0 +1,91 @@
+"""
+Lightweight trade record used by backtesting and hyperopt
+"""
+from datetime import datetime
+from typing import Optional
+
+
+class SimulationTrade(object):
+    """
+    Compact replacement for persistence.Trade during simulations.
+    It does not use SQLAlchemy instrumentation or Decimal arithmetic,
+    but applies the same fee semantics as persistence.Trade.
+    """
+    __slots__ = ('pair', 'fee', 'open_rate', 'close_rate', 'stake_amount',
+                 'amount', 'open_date', 'close_date')
+
+    def __init__(self, open_rate: float, open_date: datetime, stake_amount: float,
+                 amount: float, fee: float, pair: Optional[str] = None) -> None:
+        self.pair = pair
+        self.fee = fee
+        self.open_rate = open_rate
+        self.close_rate = None
+        self.stake_amount = stake_amount
+        self.amount = amount
+        self.open_date = open_date
+        self.close_date = None
+
+    def __repr__(self):
+        return 'SimulationTrade(pair={}, amount={:.8f}, open_rate={:.8f}, open_date={})'.format(
+            self.pair,
+            self.amount,
+            self.open_rate,
+            self.open_date
+        )
+
+    def calc_open_trade_price(self, fee: Optional[float] = None) -> float:
+        """
+        Calculate the open_rate in BTC
+        :param fee: fee to use on the open rate (optional).
+        If rate is not set self.fee will be used
+        :return: Price in BTC of the open trade
+        """
+        buy_trade = self.amount * self.open_rate
+        return buy_trade + buy_trade * (fee or self.fee)
+
+    def calc_close_trade_price(self, rate: Optional[float] = None,
+                               fee: Optional[float] = None) -> float:
+        """
+        Calculate the close_rate in BTC
+        :param fee: fee to use on the close rate (optional).
+        If rate is not set self.fee will be used
+        :param rate: rate to compare with (optional).
+        If rate is not set self.close_rate will be used
+        :return: Price in BTC of the open trade
+        """
+        if rate is None and not self.close_rate:
+            return 0.0
+
+        sell_trade = self.amount * (rate or self.close_rate)
+        return sell_trade - sell_trade * (fee or self.fee)
+
+    def calc_profit(self, rate: Optional[float] = None, fee: Optional[float] = None) -> float:
+        """
+        Calculate the profit in BTC between Close and Open trade
+        :param fee: fee to use on the close rate (optional).
+        If rate is not set self.fee will be used
+        :param rate: close rate to compare with (optional).
+        If rate is not set self.close_rate will be used
+        :return:  profit in BTC as float
+        """
+        open_trade_price = self.calc_open_trade_price()
+        close_trade_price = self.calc_close_trade_price(
+            rate=(rate or self.close_rate),
+            fee=(fee or self.fee)
+        )
+        return round(close_trade_price - open_trade_price, 8)
+
+    def calc_profit_percent(self, rate: Optional[float] = None,
+                            fee: Optional[float] = None) -> float:
+        """
+        Calculates the profit in percentage (including fee).
+        :param rate: rate to compare with (optional).
+        If rate is not set self.close_rate will be used
+        :return: profit in percentage as float
+        """
+        open_trade_price = self.calc_open_trade_price()
+        close_trade_price = self.calc_close_trade_price(
+            rate=(rate or self.close_rate),
+            fee=(fee or self.fee)
+        )
+        return round((close_trade_price / open_trade_price) - 1, 8)
@@ -0,0 +1,91 @@
+"""
+Schedules the tasks of the main loop
+"""
+import logging
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class Scheduler(object):
+    """
+    Runs each registered task at its own cadence.
+    A task is either run every `period` seconds, or right after each boundary of
+    `period` seconds (e.g. a candle close) plus a settle delay.
+    """
+
+    def __init__(self) -> None:
+        self._tasks: Dict[str, Dict[str, Any]] = {}
+
+    def add_task(self, name: str, func: Callable[..., Any], period: float,
+                 align: bool = False, delay: float = 0.0, **kwargs) -> None:
+        """
+        Registers a task. The first run of the task happens as soon as possible.
+        :param name: name of the task, used in logs and by next_run_times()
+        :param func: callable to run
+        :param period: cadence of the task in seconds
+        :param align: if True, runs are aligned to the multiples of period
+        :param delay: seconds to wait after the boundary when align is True
+        :param kwargs: keyword arguments passed to func
+        :return: None
+        """
+        self._tasks[name] = {
+            'func': func,
+            'period': period,
+            'align': align,
+            'delay': delay,
+            'kwargs': kwargs,
+            'next_run': 0.0,
+        }
+
+    def next_run_times(self) -> Dict[str, datetime]:
+        """
+        Returns the next run time of each task, for debugging purposes
+        :return: dict with the task name as key and the next run time (UTC) as value
+        """
+        return {
+            name: datetime.utcfromtimestamp(task['next_run'])
+            for name, task in self._tasks.items()
+        }
+
+    @staticmethod
+    def _get_next_run(task: Dict[str, Any], now: float) -> float:
+        """
+        Calculates the next run time of the given task
+        :param task: task as registered by add_task()
+        :param now: current time as timestamp
+        :return: timestamp of the next run
+        """
+        period = task['period']
+        if not task['align']:
+            return now + period
+        return (now - task['delay']) // period * period + period + task['delay']
+
+    def run_pending(self, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Runs the tasks which are due, in registration order, and schedules their next run
+        :param now: current time as timestamp (optional). Defaults to time.time()
+        :return: dict with the result of each task which has been run
+        """
+        now = now or time.time()
+        results = {}
+        for name, task in self._tasks.items():
+            if task['next_run'] > now:
+                continue
+            results[name] = task['func'](**task['kwargs'])
+            task['next_run'] = self._get_next_run(task, now)
+            logger.debug('Next run of %s at %s', name, self.next_run_times()[name])
+        return results
+
+    def sleep(self, max_secs: float, now: Optional[float] = None) -> None:
+        """
+        Sleeps until the next task is due, but at most max_secs seconds
+        :param max_secs: maximum duration of the sleep
+        :param now: current time as timestamp (optional). Defaults to time.time()
+        :return: None
+        """
+        now = now or time.time()
+        next_run = min((task['next_run'] for task in self._tasks.values()), default=now)
+        time.sleep(min(max(next_run - now, 0.0), max_secs))
@@ -16,7 +16,11 @@ class IStrategy(ABC):
         minimal_roi -> Dict: Minimal ROI designed for the strategy
         stoploss -> float: optimal stoploss designed for the strategy
         ticker_interval -> int: value of the ticker interval to use for the strategy
+        warmup_candles -> int: number of candles populate_indicators() needs before the
+                               indicators are stable. When set, the bot only re-analyzes new
+                               candles plus this warm-up window instead of the whole history
     """
+    warmup_candles = None
 
     @abstractmethod
     def populate_indicators(self, dataframe: DataFrame) -> DataFrame:
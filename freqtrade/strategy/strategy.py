@@ -24,6 +24,9 @@ class Strategy(object):
 
     DEFAULT_STRATEGY = 'default_strategy'
 
+    # Full analysis of the ticker history until a strategy declares its warm-up window
+    warmup_candles = None
+
     def __new__(cls) -> object:
         """
         Used to create the Singleton
@@ -79,6 +82,9 @@ class Strategy(object):
 
         self.ticker_interval = self.custom_strategy.ticker_interval
 
+        # Number of candles required to compute the indicators (optional)
+        self.warmup_candles = getattr(self.custom_strategy, 'warmup_candles', None)
+
     def _load_strategy(self, strategy_name: str) -> None:
         """
         Search and load the custom strategy. If no strategy found, fallback on the default strategy
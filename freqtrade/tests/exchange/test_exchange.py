@@ -4,11 +4,13 @@ from unittest.mock import MagicMock
 from random import randint
 import logging
 from requests.exceptions import RequestException
+import arrow
 import pytest
 
 from freqtrade import OperationalException
 from freqtrade.exchange import init, validate_pairs, buy, sell, get_balance, get_balances, \
-    get_ticker, get_ticker_history, cancel_order, get_name, get_fee
+    get_ticker, get_ticker_history, merge_ticker_history, cancel_order, get_name, get_fee, \
+    refresh_tickers, get_open_orders
 import freqtrade.exchange as exchange
 
 API_INIT = False
@@ -203,24 +205,154 @@ def test_get_ticker(default_conf, mocker):
     assert ticker['ask'] == 1
 
 
+def test_get_ticker_snapshot(default_conf, mocker):
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    # refresh_tickers() replaces the snapshot, it is restored after the test
+    mocker.patch('freqtrade.exchange._TICKER_SNAPSHOT', {'time': 0.0, 'tickers': {}})
+    api_mock = MagicMock()
+    api_mock.get_tickers = MagicMock(return_value={
+        'BTC_ETH': {'bid': 0.1, 'ask': 0.2, 'last': 0.15}
+    })
+    api_mock.get_ticker = MagicMock(return_value={'bid': 1, 'ask': 2, 'last': 1.5})
+    mocker.patch('freqtrade.exchange._API', api_mock)
+    time_mock = mocker.patch('freqtrade.exchange.time.time', return_value=1000)
+
+    refresh_tickers()
+    assert get_ticker('BTC_ETH') == {'bid': 0.1, 'ask': 0.2, 'last': 0.15}
+    assert api_mock.get_ticker.call_count == 0
+
+    # Pairs missing from the snapshot are queried on their own
+    assert get_ticker('BTC_NEW', refresh=False) == {'bid': 1, 'ask': 2, 'last': 1.5}
+    api_mock.get_ticker.assert_called_once_with('BTC_NEW', False)
+
+    # Stale snapshot
+    time_mock.return_value = 1011
+    assert get_ticker('BTC_ETH')['bid'] == 1
+    assert api_mock.get_ticker.call_count == 2
+
+    mocker.patch.dict('freqtrade.exchange._CONF', {'internals': {'max_ticker_age': 20}})
+    assert get_ticker('BTC_ETH')['bid'] == 0.1
+
+
+def test_refresh_tickers_exception(default_conf, mocker, caplog):
+    # refresh_tickers() replaces the snapshot, it is restored after the test
+    mocker.patch('freqtrade.exchange._TICKER_SNAPSHOT', {'time': 0.0, 'tickers': {}})
+    api_mock = MagicMock()
+    api_mock.get_tickers = MagicMock(side_effect=RequestException('timeout'))
+    api_mock.get_ticker = MagicMock(return_value={'bid': 1, 'ask': 2, 'last': 1.5})
+    mocker.patch('freqtrade.exchange._API', api_mock)
+
+    refresh_tickers()
+    assert get_ticker('BTC_ETH')['bid'] == 1
+    assert ('freqtrade.exchange', logging.WARNING,
+            'Unable to refresh tickers, querying them per pair. Reason: timeout'
+            ) in caplog.record_tuples
+
+
+def _make_ticks(start, count, interval=5):
+    return [{'T': start.shift(minutes=i * interval).format('YYYY-MM-DDTHH:mm:ss'),
+             'C': float(i)} for i in range(count)]
+
+
 def test_get_ticker_history(default_conf, mocker):
+    mocker.patch.dict('freqtrade.exchange._TICKER_HISTORY', {}, clear=True)
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    start = arrow.utcnow().floor('minute').shift(minutes=-5 * 9)
     api_mock = MagicMock()
-    tick = 123
-    api_mock.get_ticker_history = MagicMock(return_value=tick)
+    api_mock.get_ticker_history = MagicMock(return_value=_make_ticks(start, 10))
+    api_mock.get_latest_ticker_history = MagicMock(
+        return_value=_make_ticks(start.shift(minutes=5 * 9), 2)
+    )
     mocker.patch('freqtrade.exchange._API', api_mock)
 
-    # retrieve original ticker
-    ticks = get_ticker_history('BTC_ETH', int(default_conf['ticker_interval']))
-    assert ticks == 123
+    # first call downloads the whole history
+    ticks = get_ticker_history('BTC_ETH', 5)
+    assert len(ticks) == 10
+    assert api_mock.get_ticker_history.call_count == 1
 
-    # change the ticker
-    tick = 999
-    api_mock.get_ticker_history = MagicMock(return_value=tick)
+    # next calls only fetch the latest candles, replace the open candle
+    # and evict the oldest ones
+    ticks = get_ticker_history('BTC_ETH', 5)
+    assert api_mock.get_ticker_history.call_count == 1
+    assert api_mock.get_latest_ticker_history.call_count == 1
+    assert len(ticks) == 10
+    assert ticks[0]['T'] == start.shift(minutes=5).format('YYYY-MM-DDTHH:mm:ss')
+    assert ticks[-2]['C'] == 0.0
+    assert ticks[-1]['C'] == 1.0
+
+
+def test_get_ticker_history_refreshes_closed_candle(default_conf, mocker):
+    mocker.patch.dict('freqtrade.exchange._TICKER_HISTORY', {}, clear=True)
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    start = arrow.utcnow().floor('minute').shift(minutes=-5 * 9)
+    api_mock = MagicMock()
+    api_mock.get_ticker_history = MagicMock(return_value=_make_ticks(start, 10))
+    mocker.patch('freqtrade.exchange._API', api_mock)
+    get_ticker_history('BTC_ETH', 5)
+
+    # The last candle was still open: the exchange now has its final values,
+    # and a new candle opened. The latest candle alone cannot update it
+    final = _make_ticks(start, 11)
+    final[-2]['C'] = 42.0
+    api_mock.get_ticker_history = MagicMock(return_value=final)
+    api_mock.get_latest_ticker_history = MagicMock(return_value=final[-1:])
+    ticks = get_ticker_history('BTC_ETH', 5)
+    assert api_mock.get_ticker_history.call_count == 1
+    assert ticks[-2]['C'] == 42.0
+    assert ticks[-1]['T'] == final[-1]['T']
+
+
+def test_get_ticker_history_closed_by_clock(default_conf, mocker):
+    mocker.patch.dict('freqtrade.exchange._TICKER_HISTORY', {}, clear=True)
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    # The last candle started 5 minutes ago, it is closed
+    start = arrow.utcnow().floor('minute').shift(minutes=-5 * 10)
+    api_mock = MagicMock()
+    api_mock.get_ticker_history = MagicMock(return_value=_make_ticks(start, 10))
+    mocker.patch('freqtrade.exchange._API', api_mock)
+
+    get_ticker_history('BTC_ETH', 5)
+    get_ticker_history('BTC_ETH', 5)
+    assert api_mock.get_ticker_history.call_count == 2
+    assert api_mock.get_latest_ticker_history.call_count == 0
+
+
+def test_get_ticker_history_gap(default_conf, mocker):
+    mocker.patch.dict('freqtrade.exchange._TICKER_HISTORY', {}, clear=True)
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    api_mock = MagicMock()
+    api_mock.get_ticker_history = MagicMock(
+        return_value=_make_ticks(arrow.utcnow().shift(hours=-5), 10)
+    )
+    mocker.patch('freqtrade.exchange._API', api_mock)
+
+    # stored history is too old to be completed by the latest candle
+    get_ticker_history('BTC_ETH', 5)
+    get_ticker_history('BTC_ETH', 5)
+    assert api_mock.get_ticker_history.call_count == 2
+    assert api_mock.get_latest_ticker_history.call_count == 0
+
+
+def test_get_ticker_history_max_size(default_conf, mocker):
+    mocker.patch.dict('freqtrade.exchange._TICKER_HISTORY', {}, clear=True)
+    conf = dict(default_conf, internals={'max_ticker_history': 3})
+    mocker.patch.dict('freqtrade.exchange._CONF', conf)
+    api_mock = MagicMock()
+    api_mock.get_ticker_history = MagicMock(return_value=_make_ticks(arrow.utcnow(), 10))
     mocker.patch('freqtrade.exchange._API', api_mock)
 
-    # ensure caching will still return the original ticker
-    ticks = get_ticker_history('BTC_ETH', int(default_conf['ticker_interval']))
-    assert ticks == 123
+    ticks = get_ticker_history('BTC_ETH', 5)
+    assert [tick['C'] for tick in ticks] == [7.0, 8.0, 9.0]
+
+
+def test_merge_ticker_history():
+    history = [{'T': '2017-11-26T08:50:00'}, {'T': '2017-11-26T08:55:00'}]
+    assert merge_ticker_history(history, []) == history
+    merged = merge_ticker_history(history, [{'T': '2017-11-26T08:55:00', 'C': 1},
+                                            {'T': '2017-11-26T09:00:00'}])
+    assert merged == [{'T': '2017-11-26T08:50:00'},
+                      {'T': '2017-11-26T08:55:00', 'C': 1},
+                      {'T': '2017-11-26T09:00:00'}]
 
 
 def test_cancel_order_dry_run(default_conf, mocker):
@@ -287,3 +419,18 @@ def test_exchange_misc(mocker):
     assert exchange.get_fee() == 456
     exchange.get_wallet_health()
     assert api_mock.get_wallet_health.call_count == 1
+
+
+def test_get_open_orders(default_conf, mocker):
+    default_conf['dry_run'] = True
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    api_mock = MagicMock()
+    api_mock.get_open_orders = MagicMock(return_value=[{'id': 123, 'type': 'LIMIT_BUY'}])
+    mocker.patch('freqtrade.exchange._API', api_mock)
+
+    assert get_open_orders() == {}
+    assert api_mock.get_open_orders.call_count == 0
+
+    default_conf['dry_run'] = False
+    mocker.patch.dict('freqtrade.exchange._CONF', default_conf)
+    assert get_open_orders() == {'123': {'id': 123, 'type': 'LIMIT_BUY'}}
@@ -45,11 +45,13 @@ class FakeBittrex():
         btx._API.get_balances = self.fake_get_balances
         btx._API.get_ticker = self.fake_get_ticker
         btx._API.get_order = self.fake_get_order
+        btx._API.get_open_orders = self.fake_get_open_orders
         btx._API.cancel = self.fake_cancel_order
         btx._API.get_markets = self.fake_get_markets
         btx._API.get_market_summaries = self.fake_get_market_summaries
         btx._API_V2 = MagicMock()
         btx._API_V2.get_candles = self.fake_get_candles
+        btx._API_V2.get_latest_candle = self.fake_get_candles
         btx._API_V2.get_wallet_health = self.fake_get_wallet_health
 
     def fake_buysell_limit(self, pair, amount, limit):
@@ -90,6 +92,18 @@ class FakeBittrex():
                            'Closed': True},
                 'message': 'lost'}
 
+    def fake_get_open_orders(self):
+        return {'success': self.success,
+                'result': [{'OrderUuid': 'ABC123',
+                            'OrderType': 'LIMIT_BUY',
+                            'Exchange': 'BTC-ETH',
+                            'Opened': '2017-11-14T17:21:50.65',
+                            'PricePerUnit': None,
+                            'Quantity': 1,
+                            'QuantityRemaining': 1,
+                            'Closed': None}],
+                'message': 'no orders'}
+
     def fake_cancel_order(self, uuid):
         return self.result or {'success': self.success,
                                'message': 'no such order'}
@@ -261,6 +275,19 @@ def test_exchange_bittrex_get_ticker_history():
         wb.get_ticker_history('BTC_ETH', 5)
 
 
+def test_exchange_bittrex_get_latest_ticker_history():
+    wb = make_wrap_bittrex()
+    fb = FakeBittrex()
+    assert ([{'C': 0, 'V': 0, 'O': 0, 'H': 0, 'L': 0, 'T': 0}] ==
+            wb.get_latest_ticker_history('BTC_ETH', 5))
+    with pytest.raises(ValueError, match=r'.*Cannot parse tick_interval.*'):
+        wb.get_latest_ticker_history('BTC_ETH', 2)
+
+    fb.success = False
+    with pytest.raises(btx.OperationalException, match=r'candles lit.*'):
+        wb.get_latest_ticker_history('BTC_ETH', 5)
+
+
 def test_exchange_bittrex_get_order():
     wb = make_wrap_bittrex()
     fb = FakeBittrex()
@@ -271,6 +298,20 @@ def test_exchange_bittrex_get_order():
         wb.get_order('someUUID')
 
 
+def test_exchange_bittrex_get_open_orders():
+    wb = make_wrap_bittrex()
+    fb = FakeBittrex()
+    orders = wb.get_open_orders()
+    assert len(orders) == 1
+    assert orders[0]['id'] == 'ABC123'
+    assert orders[0]['type'] == 'LIMIT_BUY'
+    assert orders[0]['pair'] == 'BTC_ETH'
+    assert orders[0]['closed'] is None
+    fb.success = False
+    with pytest.raises(btx.OperationalException, match=r'no orders'):
+        wb.get_open_orders()
+
+
 def test_exchange_bittrex_cancel_order():
     wb = make_wrap_bittrex()
     fb = FakeBittrex()
@@ -311,6 +352,16 @@ def test_exchange_get_market_summaries():
         wb.get_market_summaries()
 
 
+def test_exchange_get_tickers():
+    wb = make_wrap_bittrex()
+    fb = FakeBittrex()
+    fb.result = {'success': True,
+                 'message': 'no summary',
+                 'result': [{'MarketName': 'BTC-ETH', 'Bid': 0.1, 'Ask': 0.2, 'Last': 0.15},
+                            {'MarketName': 'BTC-NEW', 'Bid': None, 'Ask': None, 'Last': None}]}
+    assert wb.get_tickers() == {'BTC_ETH': {'bid': 0.1, 'ask': 0.2, 'last': 0.15}}
+
+
 def test_exchange_get_wallet_health():
     wb = make_wrap_bittrex()
     fb = FakeBittrex()
@@ -345,3 +396,29 @@ def test_validate_response_min_trade_requirement_not_met():
     }
     with pytest.raises(ContentDecodingError, match=r'.*MIN_TRADE_REQUIREMENT_NOT_MET.*'):
         Bittrex._validate_response(response)
+
+
+def test_exchange_bittrex_dispatch(mocker):
+    limiter_mock = MagicMock()
+    mocker.patch('freqtrade.exchange.bittrex._RATE_LIMITER', limiter_mock)
+    session_mock = MagicMock()
+    session_mock.get.return_value.json.return_value = {'success': True}
+    mocker.patch('freqtrade.exchange.bittrex._SESSION', session_mock)
+
+    url = 'https://bittrex.com/api/v1.1/public/getmarketsummaries?apikey=key&nonce=1&'
+    assert btx._dispatch(url, 'sign') == {'success': True}
+    limiter_mock.acquire.assert_called_once_with('getmarketsummaries')
+    session_mock.get.assert_called_once_with(url, headers={'apisign': 'sign'})
+
+
+def test_exchange_bittrex_rate_limit(mocker):
+    mocker.patch.dict('freqtrade.exchange.bittrex._EXCHANGE_CONF')
+    conf = _stub_config()
+    conf['rate_limit'] = {'calls_per_second': 5, 'burst': 10, 'weights': {'GetTicks': 2}}
+    btx.Bittrex(conf)
+    assert btx._RATE_LIMITER.rate == 5
+    assert btx._RATE_LIMITER.capacity == 10
+    assert btx._RATE_LIMITER.weights == {'getticks': 2}
+    assert btx._API.dispatch == btx._dispatch
+    assert btx._API_V2.dispatch == btx._dispatch
+    assert btx._SESSION.timeout == 10
@@ -0,0 +1,100 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+import threading
+
+import pytest
+
+from freqtrade.exchange import cryptopia
+from freqtrade.exchange.cryptopia import Cryptopia
+from freqtrade.exchange.rate_limiter import RateLimiter
+
+
+def test_rate_limiter_burst(mocker):
+    mocker.patch('freqtrade.exchange.rate_limiter.time.monotonic', return_value=100.0)
+    sleep_mock = mocker.patch('freqtrade.exchange.rate_limiter.time.sleep')
+    limiter = RateLimiter(rate=2, capacity=3)
+
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert sleep_mock.call_count == 0
+
+    # The bucket is empty, the next calls are spread at the refill rate
+    assert limiter.acquire() == 0.5
+    assert limiter.acquire() == 1.0
+    assert sleep_mock.call_count == 2
+
+
+def test_rate_limiter_refill(mocker):
+    time_mock = mocker.patch('freqtrade.exchange.rate_limiter.time.monotonic',
+                             return_value=100.0)
+    mocker.patch('freqtrade.exchange.rate_limiter.time.sleep')
+    limiter = RateLimiter(rate=2, capacity=3)
+    for _ in range(3):
+        limiter.acquire()
+
+    time_mock.return_value = 101.0
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.0
+    assert limiter.acquire() == 0.5
+
+    # Never refilled above capacity
+    time_mock.return_value = 1000.0
+    assert [limiter.acquire() for _ in range(3)] == [0.0, 0.0, 0.0]
+    assert limiter.acquire() == 0.5
+
+
+def test_rate_limiter_weights(mocker):
+    mocker.patch('freqtrade.exchange.rate_limiter.time.monotonic', return_value=100.0)
+    mocker.patch('freqtrade.exchange.rate_limiter.time.sleep')
+    limiter = RateLimiter(rate=1, capacity=4, weights={'getmarketsummaries': 3})
+
+    assert limiter.acquire('getmarketsummaries') == 0.0
+    assert limiter.acquire('getticker') == 0.0
+    assert limiter.acquire('getticker', weight=2) == 2.0
+
+
+def test_rate_limiter_weights_ignore_case(mocker):
+    mocker.patch('freqtrade.exchange.rate_limiter.time.monotonic', return_value=100.0)
+    mocker.patch('freqtrade.exchange.rate_limiter.time.sleep')
+    # Bittrex and Cryptopia name their endpoints in CamelCase
+    limiter = RateLimiter(rate=1, capacity=4, weights={'GetMarketOrders': 3})
+    assert limiter.weights == {'getmarketorders': 3}
+
+    assert limiter.acquire('GETMARKETORDERS') == 0.0
+    assert limiter.acquire('getmarketorders') == 2.0
+
+
+def test_rate_limiter_invalid():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0, capacity=1)
+
+
+def test_rate_limiter_threads(mocker):
+    mocker.patch('freqtrade.exchange.rate_limiter.time.monotonic', return_value=100.0)
+    mocker.patch('freqtrade.exchange.rate_limiter.time.sleep')
+    limiter = RateLimiter(rate=10, capacity=5)
+    waits = []
+
+    def worker():
+        for _ in range(10):
+            waits.append(limiter.acquire())
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Every request got its own slot
+    assert sorted(waits) == pytest.approx([0.0] * 5 + [i / 10 for i in range(1, 36)])
+
+
+def test_cryptopia_rate_limit_weights(mocker):
+    mocker.patch.dict('freqtrade.exchange.cryptopia._EXCHANGE_CONF')
+    mocker.patch('freqtrade.exchange.cryptopia._API', None)
+    mocker.patch('freqtrade.exchange.rate_limiter.time.monotonic', return_value=100.0)
+    mocker.patch('freqtrade.exchange.rate_limiter.time.sleep')
+    Cryptopia({'key': '', 'secret': '',
+               'rate_limit': {'calls_per_second': 1, 'burst': 4,
+                              'weights': {'getmarketorders': 3}}})
+    # Cryptopia requests its endpoints in CamelCase
+    assert cryptopia._API.rate_limiter.acquire('GetMarketOrders') == 0.0
+    assert cryptopia._API.rate_limiter.acquire('GetMarketOrders') == 2.0
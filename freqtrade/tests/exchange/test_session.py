@@ -0,0 +1,33 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+from unittest.mock import MagicMock
+
+from freqtrade.exchange.session import PooledSession, create_session
+
+
+def test_pooled_session_timeout(mocker):
+    request_mock = mocker.patch('requests.Session.request', return_value=MagicMock())
+    session = PooledSession(timeout=5)
+
+    session.get('https://example.com')
+    assert request_mock.call_args[1]['timeout'] == 5
+
+    session.get('https://example.com', timeout=1)
+    assert request_mock.call_args[1]['timeout'] == 1
+
+
+def test_pooled_session_pool():
+    session = PooledSession(pool_size=4)
+    adapter = session.get_adapter('https://bittrex.com/api')
+    assert adapter._pool_maxsize == 4
+    assert adapter is session.get_adapter('https://www.cryptopia.co.nz/Api')
+    assert session.headers.get('Connection') != 'close'
+
+
+def test_create_session():
+    session = create_session({'http': {'pool_size': 2, 'timeout': 3, 'keep_alive': False}})
+    assert session.timeout == 3
+    assert session.get_adapter('https://bittrex.com')._pool_maxsize == 2
+    assert session.headers['Connection'] == 'close'
+
+    session = create_session({})
+    assert session.timeout == 10
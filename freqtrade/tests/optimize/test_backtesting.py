@@ -5,6 +5,7 @@ import math
 from unittest.mock import MagicMock
 import pandas as pd
 import numpy as np
+import pytest
 from freqtrade import exchange, optimize
 from freqtrade.exchange import Bittrex
 from freqtrade.optimize import preprocess
@@ -241,6 +242,24 @@ def test_backtest_alternate_buy_sell(default_conf, mocker, default_strategy):
     assert len(results) == 3
 
 
+def test_backtest_engines_match(default_conf, mocker, default_strategy):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    data = optimize.load_data(None, ticker_interval=1, pairs=['BTC_UNITEST'])
+    for max_open_trades, realistic in [(0, False), (1, True)]:
+        backtest_conf = {'stake_amount': default_conf['stake_amount'],
+                         'processed': optimize.preprocess(data),
+                         'max_open_trades': max_open_trades,
+                         'realistic': realistic}
+        legacy = backtest(dict(backtest_conf, engine='legacy'))
+        vectorized = backtest(dict(backtest_conf, engine='vectorized'))
+        assert not legacy.empty
+        assert len(legacy) == len(vectorized)
+        assert (legacy.currency == vectorized.currency).all()
+        assert (legacy.duration == vectorized.duration).all()
+        assert np.allclose(legacy.profit_percent, vectorized.profit_percent)
+        assert np.allclose(legacy.profit_BTC, vectorized.profit_BTC)
+
+
 def test_backtest_record(default_conf, mocker, default_strategy):
     names = []
     records = []
@@ -315,6 +334,10 @@ def test_backtest_start(default_conf, mocker, caplog):
     args.datadir = None
     args.export = None
     args.timerange = '-100'  # needed due to MagicMock malleability
+    args.indicator_cache = False
+    args.jobs = 1
+    args.compact = False
+    args.streaming = False
     backtesting.start(args)
     # check the logs, that will contain the backtest result
     exists = ['Using max_open_trades: 1 ...',
@@ -341,6 +364,10 @@ def test_backtest_start_live(default_strategy, default_conf, mocker, caplog):
     args.datadir = None
     args.export = None
     args.timerange = '-100'  # needed due to MagicMock malleability
+    args.indicator_cache = False
+    args.jobs = 1
+    args.compact = False
+    args.streaming = False
     backtesting.start(args)
     # check the logs, that will contain the backtest result
     exists = ['Using max_open_trades: 1 ...',
@@ -351,3 +378,47 @@ def test_backtest_start_live(default_strategy, default_conf, mocker, caplog):
         assert ('freqtrade.optimize.backtesting',
                 logging.INFO,
                 line) in caplog.record_tuples
+
+
+def test_backtest_streaming(default_conf, mocker, default_strategy):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    data = optimize.load_data(None, ticker_interval=1, pairs=['BTC_UNITEST', 'BTC_ETH'])
+    args = {'stake_amount': default_conf['stake_amount'], 'realistic': True}
+    expected = backtest(dict(args, processed=optimize.preprocess(data)))
+
+    results, (min_date, max_date) = backtesting.backtest_streaming(data.items(), args)
+    assert results.equals(expected)
+    assert (min_date, max_date) == get_timeframe(optimize.preprocess(data))
+
+    with pytest.raises(ValueError, match=r'max_open_trades'):
+        backtesting.backtest_streaming(data.items(), dict(args, max_open_trades=1))
+
+
+def test_backtest_start_streaming(default_conf, mocker, caplog):
+    caplog.set_level(logging.INFO)
+    default_conf['exchange']['pair_whitelist'] = ['BTC_UNITEST']
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    mocker.patch('freqtrade.misc.load_config', new=lambda s: default_conf)
+    iter_data = mocker.patch('freqtrade.optimize.iter_data',
+                             side_effect=lambda *a, **k: mocked_load_data(*a, **k).items())
+    args = MagicMock()
+    args.ticker_interval = 1
+    args.level = 10
+    args.live = False
+    args.datadir = None
+    args.export = None
+    args.timerange = '-100'  # needed due to MagicMock malleability
+    args.indicator_cache = False
+    args.jobs = 1
+    args.compact = False
+    args.streaming = True
+    args.realistic_simulation = False
+    backtesting.start(args)
+    assert iter_data.call_count == 1
+    exists = ['Backtesting the pairs one at a time ...',
+              'Measuring data from 2017-11-14T21:17:00+00:00 '
+              'up to 2017-11-14T22:59:00+00:00 (0 days)..']
+    for line in exists:
+        assert ('freqtrade.optimize.backtesting',
+                logging.INFO,
+                line) in caplog.record_tuples
@@ -0,0 +1,135 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import os
+import shutil
+
+from pandas.testing import assert_frame_equal
+
+from freqtrade import analyze, optimize
+from freqtrade.analyze import parse_ticker_dataframe
+from freqtrade.optimize.cache import IndicatorCache, get_cache_key
+
+
+def _tickerdata():
+    tickerdata = optimize.load_tickerdata_file(None, 'BTC_UNITEST', 1,
+                                               timerange=((None, 'line'), None, -200))
+    return {'BTC_UNITEST': tickerdata}
+
+
+def test_get_cache_key(default_strategy):
+    dataframe = parse_ticker_dataframe(_tickerdata()['BTC_UNITEST'])
+    key = get_cache_key('BTC_UNITEST', 1, '-200', dataframe, optimize.populate_indicators)
+    assert key == get_cache_key('BTC_UNITEST', 1, '-200', dataframe.copy(),
+                                optimize.populate_indicators)
+    assert key != get_cache_key('BTC_ETH', 1, '-200', dataframe, optimize.populate_indicators)
+    assert key != get_cache_key('BTC_UNITEST', 5, '-200', dataframe, optimize.populate_indicators)
+
+    changed = dataframe.copy()
+    changed.loc[changed.index[-1], 'close'] += 1e-8
+    assert key != get_cache_key('BTC_UNITEST', 1, '-200', changed, optimize.populate_indicators)
+
+    def populate_indicators(frame):
+        return frame
+    assert key != get_cache_key('BTC_UNITEST', 1, '-200', dataframe, populate_indicators)
+
+
+def test_preprocess_uses_cache(default_strategy, mocker, tmpdir):
+    cache = IndicatorCache(str(tmpdir))
+    expected = optimize.preprocess(_tickerdata())
+
+    calls = []
+
+    def populate_indicators(dataframe):
+        calls.append(dataframe)
+        return analyze.populate_indicators(dataframe)
+    mocker.patch('freqtrade.optimize.populate_indicators', populate_indicators)
+
+    first = optimize.preprocess(_tickerdata(), cache=cache, ticker_interval=1)
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    # The second run does not compute the indicators
+    second = optimize.preprocess(_tickerdata(), cache=cache, ticker_interval=1)
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    for processed in [first, second]:
+        frame = processed['BTC_UNITEST']
+        assert_frame_equal(frame[expected['BTC_UNITEST'].columns], expected['BTC_UNITEST'])
+
+
+def test_indicator_cache_evicts_least_recently_used(default_strategy, tmpdir):
+    dataframe = optimize.preprocess(_tickerdata())['BTC_UNITEST']
+    cache = IndicatorCache(str(tmpdir), max_size=1024)
+    for key, mtime in [('a', 100), ('b', 200), ('c', 300)]:
+        cache.put(key, 'BTC_UNITEST', dataframe)
+        os.utime(os.path.join(str(tmpdir), key, 'meta.json'), (mtime, mtime))
+    entry_size = cache._entries()[0][1]
+
+    # 'a' is used again, 'b' becomes the least recently used entry
+    assert cache.get('a', 'BTC_UNITEST') is not None
+    cache.max_size = 2.5 * entry_size / 2**20
+    assert cache.evict() == 1
+    assert sorted(os.listdir(str(tmpdir))) == ['a', 'c']
+    assert cache.get('b', 'BTC_UNITEST') is None
+
+
+def test_preprocess_jobs_uses_cache(default_strategy, tmpdir):
+    cache = IndicatorCache(str(tmpdir))
+    tickerdata = {'BTC_UNITEST': _tickerdata()['BTC_UNITEST'],
+                  'BTC_ETH': optimize.load_tickerdata_file(None, 'BTC_ETH', 1)[-200:]}
+    optimize.preprocess(tickerdata, cache=cache, ticker_interval=1, jobs=2)
+    assert (cache.hits, cache.misses) == (0, 2)
+    optimize.preprocess(tickerdata, cache=cache, ticker_interval=1, jobs=2)
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+def test_indicator_cache_skips_unsupported_columns(default_strategy, tmpdir):
+    dataframe = optimize.preprocess(_tickerdata())['BTC_UNITEST']
+    dataframe['comment'] = 'not numeric'
+    cache = IndicatorCache(str(tmpdir))
+    cache.put('a', 'BTC_UNITEST', dataframe)
+    assert os.listdir(str(tmpdir)) == []
+    assert cache.get('a', 'BTC_UNITEST') is None
+    assert (cache.hits, cache.misses) == (0, 1)
+
+
+def test_indicator_cache_entry_removed_by_another_process(default_strategy, mocker, tmpdir):
+    dataframe = optimize.preprocess(_tickerdata())['BTC_UNITEST']
+    cache = IndicatorCache(str(tmpdir))
+    cache.put('a', 'BTC_UNITEST', dataframe)
+    cache.put('b', 'BTC_UNITEST', dataframe)
+
+    # 'a' is evicted between the listing of the directory and its stat
+    listdir = os.listdir
+
+    def removing_listdir(path):
+        files = listdir(path)
+        if path == str(tmpdir):
+            shutil.rmtree(os.path.join(path, 'a'))
+        return files
+    mocker.patch('freqtrade.optimize.cache.os.listdir', removing_listdir)
+    assert [entry for _, _, entry in cache._entries()] == [os.path.join(str(tmpdir), 'b')]
+    assert cache.get('a', 'BTC_UNITEST') is None
+    assert cache.misses == 1
+
+
+def test_preprocess_jobs_evicts_in_parent(default_strategy, mocker, tmpdir):
+    cache_dir = tmpdir.mkdir('cache')
+    cache = IndicatorCache(str(cache_dir), max_size=0)
+    evict = IndicatorCache.evict
+    pids = tmpdir.join('pids')
+
+    def recording_evict(self):
+        with open(str(pids), 'a') as file:
+            file.write('{}\n'.format(os.getpid()))
+        return evict(self)
+    mocker.patch.object(IndicatorCache, 'evict', recording_evict)
+
+    tickerdata = {'BTC_UNITEST': _tickerdata()['BTC_UNITEST'],
+                  'BTC_ETH': optimize.load_tickerdata_file(None, 'BTC_ETH', 1)[-200:]}
+    optimize.preprocess(tickerdata, cache=cache, ticker_interval=1, jobs=2)
+    # The workers put their entries, the parent evicts them once they are done
+    assert cache.misses == 2
+    assert pids.read().split() == [str(os.getpid())]
+    assert os.listdir(str(cache_dir)) == []
@@ -0,0 +1,129 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import gzip
+import json
+import logging
+import os
+
+import pytest
+
+from freqtrade import OperationalException, optimize
+from freqtrade.misc import parse_timerange
+from freqtrade.optimize import catalog
+
+
+def _candle(timestamp):
+    return {'O': 0.1, 'H': 0.1, 'L': 0.1, 'C': 0.1, 'V': 1.0, 'T': timestamp, 'BV': 0.1}
+
+
+def _write(path, name, timestamps):
+    with open(os.path.join(path, name + '.json'), 'w') as file:
+        json.dump([_candle(timestamp) for timestamp in timestamps], file)
+
+
+def test_find_gaps():
+    timestamps = ['2018-01-01T00:00:00', '2018-01-01T00:05:00', '2018-01-01T00:20:00',
+                  '2018-01-01T00:25:00']
+    assert catalog.find_gaps(timestamps, 5) == [['2018-01-01T00:05:00', '2018-01-01T00:20:00']]
+    assert catalog.find_gaps(timestamps, 15) == []
+    assert catalog.find_gaps(timestamps[:1], 5) == []
+
+
+def test_get_entries(tmpdir):
+    path = str(tmpdir)
+    _write(path, 'BTC_ETH-5', ['2018-01-01T00:00:00', '2018-01-01T00:05:00',
+                               '2018-01-01T00:15:00'])
+    entries = catalog.get_entries(path, ['BTC-ETH', 'BTC-LTC'], 5)
+
+    assert entries['BTC-LTC'] is None
+    entry = entries['BTC-ETH']
+    assert entry['first'] == '2018-01-01T00:00:00'
+    assert entry['last'] == '2018-01-01T00:15:00'
+    assert entry['rows'] == 3
+    assert entry['gaps'] == [['2018-01-01T00:05:00', '2018-01-01T00:15:00']]
+    assert catalog.load_catalog(path) == {'BTC_ETH-5': entry}
+
+    # An outdated entry is refreshed
+    _write(path, 'BTC_ETH-5', ['2018-01-01T00:00:00'])
+    os.utime(os.path.join(path, 'BTC_ETH-5.json'), (0, 0))
+    assert catalog.get_entries(path, ['BTC-ETH'], 5)['BTC-ETH']['rows'] == 1
+
+
+def test_update_entry(tmpdir, mocker):
+    path = str(tmpdir)
+    timestamps = ['2018-01-01T00:00:00', '2018-01-01T00:01:00']
+    _write(path, 'BTC_ETH-1', timestamps)
+    # Without catalog, nothing is done
+    catalog.update_entry(path, 'BTC-ETH', 1, [], 0)
+    assert not os.path.isfile(os.path.join(path, catalog.CATALOG_FILE))
+
+    catalog.get_entries(path, ['BTC-ETH'], 1)
+    previous_size = os.path.getsize(os.path.join(path, 'BTC_ETH-1.json'))
+    appended = [_candle('2018-01-01T00:05:00')]
+    _write(path, 'BTC_ETH-1', timestamps + ['2018-01-01T00:05:00'])
+
+    describe = mocker.spy(catalog, 'describe_file')
+    catalog.update_entry(path, 'BTC-ETH', 1, appended, previous_size)
+    assert describe.call_count == 0
+    entry = catalog.load_catalog(path)['BTC_ETH-1']
+    assert entry == catalog.describe_file(os.path.join(path, 'BTC_ETH-1.json'), 1)
+    assert entry['gaps'] == [['2018-01-01T00:01:00', '2018-01-01T00:05:00']]
+
+
+def test_update_entry_gzip(tmpdir):
+    path = str(tmpdir)
+    _write(path, 'BTC_ETH-1', ['2018-01-01T00:00:00', '2018-01-01T00:01:00'])
+    with open(os.path.join(path, 'BTC_ETH-1.json'), 'rb') as file, \
+            gzip.open(os.path.join(path, 'BTC_ETH-1.json.gz'), 'wb') as gzfile:
+        gzfile.write(file.read())
+    os.remove(os.path.join(path, 'BTC_ETH-1.json'))
+    catalog.get_entries(path, ['BTC-ETH'], 1)
+
+    # The downloader appends to a new .json file, the .json.gz one is still loaded
+    _write(path, 'BTC_ETH-1', ['2018-01-01T00:02:00'])
+    catalog.update_entry(path, 'BTC-ETH', 1, [_candle('2018-01-01T00:02:00')], 0)
+    entry = catalog.load_catalog(path)['BTC_ETH-1']
+    assert entry == catalog.describe_file(os.path.join(path, 'BTC_ETH-1.json.gz'), 1)
+    assert (entry['rows'], entry['last']) == (2, '2018-01-01T00:01:00')
+
+
+def test_download_backtesting_testdata_updates_catalog(tmpdir, mocker):
+    path = str(tmpdir)
+    _write(path, 'BTC_ETH-1', ['2018-01-01T00:00:00'])
+    catalog.get_entries(path, ['BTC-ETH'], 1)
+    mocker.patch('freqtrade.optimize.get_ticker_history',
+                 return_value=[_candle('2018-01-01T00:01:00')])
+
+    optimize.download_backtesting_testdata(path, 'BTC-ETH', 1)
+    entry = catalog.load_catalog(path)['BTC_ETH-1']
+    assert (entry['rows'], entry['last']) == (2, '2018-01-01T00:01:00')
+    assert catalog.get_entries(path, ['BTC-ETH'], 1)['BTC-ETH'] == entry
+
+
+def test_check_timerange(tmpdir, caplog):
+    caplog.set_level(logging.WARNING)
+    path = str(tmpdir)
+    _write(path, 'BTC_ETH-60', ['2018-01-01T00:00:00', '2018-01-01T01:00:00',
+                                '2018-01-01T05:00:00', '2018-01-01T23:00:00'])
+    _write(path, 'BTC_LTC-60', ['2017-12-01T00:00:00'])
+    pairs = ['BTC-ETH', 'BTC-LTC', 'BTC-XMR']
+
+    catalog.check_timerange(path, pairs, 60, parse_timerange('20180101-20180102'))
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == [
+        'Missing candles for BTC-ETH between 2018-01-01T01:00:00 and 2018-01-01T05:00:00',
+        'Missing candles for BTC-ETH between 2018-01-01T05:00:00 and 2018-01-01T23:00:00',
+        'No data for BTC-LTC within the timerange '
+        '(data from 2017-12-01T00:00:00 to 2017-12-01T00:00:00)',
+    ]
+
+    caplog.clear()
+    catalog.check_timerange(path, pairs, 60, parse_timerange('20180101-20180103'))
+    assert 'The data of BTC-ETH only covers 2018-01-01T00:00:00 to 2018-01-01T23:00:00' in \
+        [record.getMessage() for record in caplog.records]
+
+    # Line based timeranges are not checked
+    catalog.check_timerange(path, pairs, 60, parse_timerange('-200'))
+
+    with pytest.raises(OperationalException, match=r'None of the pairs has data'):
+        catalog.check_timerange(path, pairs, 60, parse_timerange('20180201-'))
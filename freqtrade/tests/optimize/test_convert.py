@@ -0,0 +1,78 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import os
+import time
+from shutil import copyfile
+
+from pandas import DataFrame
+
+from freqtrade import optimize
+from freqtrade.analyze import parse_ticker_dataframe
+from freqtrade.optimize.convert import convert_tickerdata
+
+_TESTDATA = os.path.join('freqtrade', 'tests', 'testdata')
+
+
+def _copy_testdata(datadir, *files):
+    for file in files:
+        copyfile(os.path.join(_TESTDATA, file), os.path.join(str(datadir), file))
+
+
+def test_tickerlist_to_columns():
+    tickerlist = optimize.load_tickerdata_file(None, 'BTC_UNITEST', 1)
+    columns = optimize.tickerlist_to_columns(tickerlist)
+    assert sorted(columns) == ['BV', 'C', 'H', 'L', 'O', 'T', 'V']
+    assert columns['T'].dtype == 'int64'
+    assert columns['C'].dtype == 'float64'
+    assert columns['T'][0] == 1509836520  # 2017-11-04T23:02:00
+    assert columns['C'][0] == tickerlist[0]['C']
+
+
+def test_convert_tickerdata(tmpdir):
+    _copy_testdata(tmpdir, 'BTC_UNITEST-1.json', 'BTC_UNITEST-8.json', 'BTC_UNITEST-8.json.gz')
+
+    converted = convert_tickerdata(str(tmpdir))
+    assert [os.path.basename(file) for file in converted] == \
+        ['BTC_UNITEST-1.npz', 'BTC_UNITEST-8.npz']
+
+    # Up to date binary files are kept
+    assert convert_tickerdata(str(tmpdir)) == []
+    assert len(convert_tickerdata(str(tmpdir), force=True)) == 2
+
+
+def test_load_tickerdata_file_binary(tmpdir):
+    _copy_testdata(tmpdir, 'BTC_UNITEST-1.json')
+    tickerlist = optimize.load_tickerdata_file(str(tmpdir), 'BTC_UNITEST', 1)
+    convert_tickerdata(str(tmpdir))
+
+    tickerdata = optimize.load_tickerdata_file(str(tmpdir), 'BTC_UNITEST', 1)
+    assert isinstance(tickerdata, DataFrame)
+    assert len(tickerdata) == len(tickerlist)
+
+    expected = parse_ticker_dataframe(tickerlist).reset_index(drop=True)
+    dataframe = parse_ticker_dataframe(tickerdata).reset_index(drop=True)
+    assert dataframe[expected.columns].equals(expected)
+
+    # Timerange applies to binary data as well
+    timerange = ((None, 'line'), None, -100)
+    tickerdata = optimize.load_tickerdata_file(str(tmpdir), 'BTC_UNITEST', 1, timerange)
+    assert len(tickerdata) == 100
+    assert len(optimize.preprocess({'BTC_UNITEST': tickerdata})['BTC_UNITEST']) == 100
+
+    timerange = (('date', 'date'), '20171110', '20171112')
+    tickerdata = optimize.load_tickerdata_file(str(tmpdir), 'BTC_UNITEST', 1, timerange)
+    assert len(tickerdata) == len(optimize.trim_tickerlist(tickerlist, timerange))
+    assert tickerdata['T'].iloc[0].isoformat() == '2017-11-10T00:00:00+00:00'
+
+
+def test_load_tickerdata_file_stale_binary(tmpdir, caplog):
+    _copy_testdata(tmpdir, 'BTC_UNITEST-1.json')
+    convert_tickerdata(str(tmpdir))
+
+    # The .json file has been updated since the conversion
+    file = os.path.join(str(tmpdir), 'BTC_UNITEST-1.json')
+    mtime = time.time() + 10
+    os.utime(file, (mtime, mtime))
+
+    assert optimize.get_binary_file(file) is None
+    assert isinstance(optimize.load_tickerdata_file(str(tmpdir), 'BTC_UNITEST', 1), list)
@@ -1,14 +1,22 @@
 # pragma pylint: disable=missing-docstring,W0212,C0103
 import logging
+import multiprocessing
+import os
 
 from unittest.mock import MagicMock
 
 import pandas as pd
+import pytest
+from hyperopt import STATUS_FAIL, STATUS_OK, Trials, fmin, hp, rand, tpe
 
 from freqtrade.optimize.hyperopt import calculate_loss, TARGET_TRADES, EXPECTED_MAX_PROFIT, start, \
     log_results, save_trials, read_trials, generate_roi_table, has_space
 
 import freqtrade.optimize.hyperopt as hyperopt
+from freqtrade.optimize.journal import JournaledTrials, read_journal
+import freqtrade.vendor.qtpylib.indicators as qtpylib
+from freqtrade import OperationalException, optimize
+from freqtrade.analyze import parse_ticker_dataframe
 
 
 def test_loss_calculation_prefer_correct_trade_count():
@@ -39,6 +47,7 @@ def create_trials(mocker):
       - we don't create any pickle'd files in the filesystem
       - we might have a pickle'd file so make sure that we return
         false when looking for it
+      - we don't write the memory-mapped store of the MongoDB workers
     """
     mocker.patch('freqtrade.optimize.hyperopt.TRIALS_FILE',
                  return_value='freqtrade/tests/optimize/ut_trials.pickle')
@@ -50,6 +59,8 @@ def create_trials(mocker):
                  return_value=None)
     mocker.patch('freqtrade.optimize.hyperopt.os.remove',
                  return_value=True)
+    mocker.patch('freqtrade.optimize.hyperopt.save_processed')
+    mocker.patch('freqtrade.optimize.hyperopt.load_processed')
     return mocker.Mock(
         results=[{
             'loss': 1,
@@ -71,24 +82,50 @@ def test_start_calls_fmin(mocker):
     mock_fmin = mocker.patch('freqtrade.optimize.hyperopt.fmin', return_value={})
 
     args = mocker.Mock(epochs=1, config='config.json.example', mongodb=False,
-                       timerange=None, spaces='all')
+                       jobs=1, timerange=None, spaces='all', subset=None)
     start(args)
 
     mock_fmin.assert_called_once()
 
 
+def test_start_uses_fmin_parallel(mocker):
+    trials = create_trials(mocker)
+    mocker.patch('freqtrade.optimize.tickerdata_to_dataframe')
+    mocker.patch('freqtrade.optimize.hyperopt.TRIALS', return_value=trials)
+    mocker.patch('freqtrade.optimize.hyperopt.sorted',
+                 return_value=trials.results)
+    mocker.patch('freqtrade.optimize.load_data')
+    mock_fmin = mocker.patch('freqtrade.optimize.hyperopt.fmin', return_value={})
+    mock_parallel = mocker.patch('freqtrade.optimize.hyperopt.fmin_parallel', return_value={})
+
+    args = mocker.Mock(epochs=4, config='config.json.example', mongodb=False,
+                       jobs=2, timerange=None, spaces='all', subset=None)
+    start(args)
+
+    assert mock_fmin.call_count == 0
+    mock_parallel.assert_called_once()
+    assert mock_parallel.call_args[1]['max_evals'] == 4
+    assert mock_parallel.call_args[1]['jobs'] == 2
+    assert isinstance(mock_parallel.call_args[1]['cache'], hyperopt.EvaluationCache)
+
+
 def test_start_uses_mongotrials(mocker):
     mock_mongotrials = mocker.patch('freqtrade.optimize.hyperopt.MongoTrials',
                                     return_value=create_trials(mocker))
     mocker.patch('freqtrade.optimize.tickerdata_to_dataframe')
     mocker.patch('freqtrade.optimize.load_data')
     mocker.patch('freqtrade.optimize.hyperopt.fmin', return_value={})
+    mock_save = mocker.patch('freqtrade.optimize.hyperopt.save_processed')
+    mock_load = mocker.patch('freqtrade.optimize.hyperopt.load_processed')
 
     args = mocker.Mock(epochs=1, config='config.json.example', mongodb=True,
-                       timerange=None, spaces='all')
+                       jobs=1, timerange=None, spaces='all', subset=None)
     start(args)
 
     mock_mongotrials.assert_called_once()
+    mock_save.assert_called_once()
+    mock_load.assert_called_once_with(hyperopt.PROCESSED_STORE)
+    assert hyperopt.PROCESSED == mock_load.return_value
 
 
 def test_log_results_if_loss_improves(mocker):
@@ -148,7 +185,7 @@ def test_fmin_best_results(mocker, caplog):
     mocker.patch('freqtrade.optimize.hyperopt.fmin', return_value=fmin_result)
 
     args = mocker.Mock(epochs=1, config='config.json.example',
-                       timerange=None, spaces='all')
+                       jobs=1, timerange=None, spaces='all', subset=None)
     start(args)
 
     exists = [
@@ -172,7 +209,7 @@ def test_fmin_throw_value_error(mocker, caplog):
     mocker.patch('freqtrade.optimize.hyperopt.fmin', side_effect=ValueError())
 
     args = mocker.Mock(epochs=1, config='config.json.example',
-                       timerange=None, spaces='all')
+                       jobs=1, timerange=None, spaces='all', subset=None)
     start(args)
 
     exists = [
@@ -196,6 +233,7 @@ def test_resuming_previous_hyperopt_results_succeeds(mocker):
                  return_value=len(trials.results))
     mock_read = mocker.patch('freqtrade.optimize.hyperopt.read_trials',
                              return_value=trials)
+    mock_migrate = mocker.patch('freqtrade.optimize.hyperopt.migrate_pickle')
     mock_save = mocker.patch('freqtrade.optimize.hyperopt.save_trials',
                              return_value=None)
     mocker.patch('freqtrade.optimize.hyperopt.sorted',
@@ -207,13 +245,16 @@ def test_resuming_previous_hyperopt_results_succeeds(mocker):
     args = mocker.Mock(epochs=1,
                        config='config.json.example',
                        mongodb=False,
+                       jobs=1,
                        timerange=None,
-                       spaces='all')
+                       spaces='all',
+                       subset=None)
 
     start(args)
 
     mock_read.assert_called_once()
     mock_save.assert_called_once()
+    mock_migrate.assert_called_once_with(hyperopt.LEGACY_TRIALS_FILE, hyperopt.TRIALS_FILE)
 
     current_tries = hyperopt._CURRENT_TRIES
     total_tries = hyperopt.TOTAL_TRIES
@@ -222,29 +263,26 @@ def test_resuming_previous_hyperopt_results_succeeds(mocker):
     assert total_tries == (current_tries + len(trials.results))
 
 
-def test_save_trials_saves_trials(mocker):
-    trials = create_trials(mocker)
-    mock_dump = mocker.patch('freqtrade.optimize.hyperopt.pickle.dump',
-                             return_value=None)
-    trials_path = mocker.patch('freqtrade.optimize.hyperopt.TRIALS_FILE',
-                               return_value='ut_trials.pickle')
-    mocker.patch('freqtrade.optimize.hyperopt.open',
-                 return_value=trials_path)
+def test_save_trials_saves_trials(tmpdir):
+    trials_path = str(tmpdir.join('trials.jsonl'))
+    trials = Trials()
+    fmin(lambda x: x ** 2, hp.uniform('x', -1, 1), algo=tpe.suggest, max_evals=3,
+         trials=trials)
     save_trials(trials, trials_path)
 
-    mock_dump.assert_called_once_with(trials, trials_path)
+    assert len(list(read_journal(trials_path))) == 3
 
 
-def test_read_trials_returns_trials_file(mocker):
-    trials = create_trials(mocker)
-    mock_load = mocker.patch('freqtrade.optimize.hyperopt.pickle.load',
-                             return_value=trials)
-    mock_open = mocker.patch('freqtrade.optimize.hyperopt.open',
-                             return_value=mock_load)
+def test_read_trials_returns_trials_file(tmpdir):
+    trials_path = str(tmpdir.join('trials.jsonl'))
+    trials = JournaledTrials(trials_path)
+    fmin(lambda x: x ** 2, hp.uniform('x', -1, 1), algo=tpe.suggest, max_evals=3,
+         trials=trials)
 
-    assert read_trials() == trials
-    mock_open.assert_called_once()
-    mock_load.assert_called_once()
+    read = read_trials(trials_path)
+    assert read.results == trials.results
+    # The file is kept, the next trials are appended to it
+    assert os.path.isfile(trials_path)
 
 
 def test_roi_table_generation():
@@ -259,8 +297,44 @@ def test_roi_table_generation():
     assert generate_roi_table(params) == {0: 6, 15: 3, 25: 1, 30: 0}
 
 
+def test_buy_strategy_generator(default_strategy):
+    tickerdata = optimize.load_tickerdata_file(None, 'BTC_UNITEST', 1)
+    dataframe = parse_ticker_dataframe(tickerdata)
+    dataframe = hyperopt.populate_indicators(dataframe)
+    dataframe['buy'] = 0
+
+    params = {
+        'uptrend_long_ema': {'enabled': True},
+        'uptrend_sma': {'enabled': True},
+        'adx': {'enabled': False},
+        'rsi': {'enabled': True, 'value': 40.0},
+        'trigger': {'type': 'lower_bb'},
+    }
+    expected = (
+        (dataframe['ema50'] > dataframe['ema100']) &
+        (dataframe['sma'] > dataframe['sma'].shift(1)) &
+        (dataframe['rsi'] < 40.0) &
+        (dataframe['close'] < dataframe['bb_lowerband'])
+    )
+    assert expected.any()
+    result = hyperopt.buy_strategy_generator(params)(dataframe)
+    assert (result['buy'] == 1).tolist() == expected.tolist()
+
+    # Other values of the same DataFrame reuse its masks
+    dataframe['buy'] = 0
+    params['rsi']['value'] = 30.0
+    params['trigger']['type'] = 'faststoch10'
+    expected = (
+        (dataframe['ema50'] > dataframe['ema100']) &
+        (dataframe['sma'] > dataframe['sma'].shift(1)) &
+        (dataframe['rsi'] < 30.0) &
+        qtpylib.crossed_above(dataframe['fastd'], 10.0)
+    )
+    result = hyperopt.buy_strategy_generator(params)(dataframe)
+    assert (result['buy'] == 1).tolist() == expected.tolist()
+
+
 # test log_trials_result
-# test buy_strategy_generator def populate_buy_trend
 # test optimizer if 'ro_t1' in params
 
 def test_format_results():
@@ -282,8 +356,271 @@ def test_signal_handler(mocker):
     assert m.call_count == 3
 
 
+def test_get_processed_opens_store(mocker):
+    processed = {'BTC_UNITEST': pd.DataFrame()}
+    mock_load = mocker.patch('freqtrade.optimize.hyperopt.load_processed',
+                             return_value=processed)
+    mocker.patch('freqtrade.optimize.hyperopt.PROCESSED', None)
+
+    assert hyperopt.get_processed() is processed
+    assert hyperopt.get_processed() is processed
+    mock_load.assert_called_once_with(hyperopt.PROCESSED_STORE)
+
+
 def test_has_space():
     assert has_space(['buy', 'roi'], 'roi')
     assert has_space(['buy', 'roi'], 'buy')
     assert not has_space(['buy', 'roi'], 'stoploss')
     assert has_space(['all'], 'buy')
+
+
+def test_fmin_parallel(mocker):
+    mocker.patch('freqtrade.optimize.hyperopt.log_results')
+
+    def objective(params):
+        if params['x'] > 0.9:
+            return {'status': STATUS_FAIL, 'loss': float('inf')}
+        return {'loss': params['x'] ** 2, 'status': STATUS_OK, 'result': str(params['x'])}
+
+    trials = Trials()
+    best = hyperopt.fmin_parallel(objective, {'x': hp.uniform('x', -1, 1)}, trials,
+                                  max_evals=5, jobs=2)
+    assert len(trials.trials) == 5
+    assert all(trial['state'] == 2 for trial in trials.trials)  # JOB_STATE_DONE
+    assert trials.best_trial['result']['loss'] == best['x'] ** 2
+    assert hyperopt._PARALLEL_OBJECTIVE is None
+
+    # Resumed trials count towards max_evals
+    hyperopt.fmin_parallel(objective, {'x': hp.uniform('x', -1, 1)}, trials,
+                           max_evals=8, jobs=2)
+    assert len(trials.trials) == 8
+
+
+def test_reject_on_subset(mocker):
+    mocker.patch('freqtrade.optimize.hyperopt._SUBSET_LOSSES', [])
+    mocker.patch('freqtrade.optimize.hyperopt.MIN_SUBSET_EPOCHS', 4)
+    # The first epochs are always promoted
+    for loss in [1.0, 2.0, 3.0, float('inf')]:
+        assert hyperopt.reject_on_subset(loss) is None
+
+    # Only the best half is promoted afterwards
+    assert hyperopt.reject_on_subset(1.5) is None
+    assert hyperopt.reject_on_subset(2.5) == \
+        'rejected on the data subset: loss 2.50000 above 2.00000 (best 50% of 6)'
+    assert hyperopt.reject_on_subset(float('inf')).startswith('rejected on the data subset')
+
+
+def test_get_processed_subset(mocker):
+    dates = pd.to_datetime(['2018-01-01 00:00', '2018-01-01 01:00', '2018-01-01 02:00',
+                            '2018-01-01 03:00', '2018-01-01 04:00'], utc=True)
+    processed = {
+        'BTC_ETH': pd.DataFrame({'date': dates, 'close': range(5)}),
+        'BTC_LTC': pd.DataFrame({'date': dates[2:], 'close': range(3)}),
+    }
+    mocker.patch('freqtrade.optimize.hyperopt.PROCESSED', processed)
+    mocker.patch('freqtrade.optimize.hyperopt.PROCESSED_SUBSET', None)
+
+    subset = hyperopt.get_processed_subset(0.5)
+    assert subset['BTC_ETH']['close'].tolist() == [0, 1, 2]
+    assert subset['BTC_LTC']['close'].tolist() == [0]
+    assert hyperopt.get_processed_subset(0.5) is subset
+
+
+def test_objective_rejects_on_subset(mocker):
+    results = pd.DataFrame.from_records([('BTC_ETH', 0.01, 0.0001, 20)] * 10, columns=[
+        'currency', 'profit_percent', 'profit_BTC', 'duration'])
+    mock_backtest = mocker.patch('freqtrade.optimize.hyperopt.backtest', return_value=results)
+    subset = mocker.patch('freqtrade.optimize.hyperopt.get_processed_subset')
+    mocker.patch('freqtrade.optimize.hyperopt.get_processed')
+    reject = mocker.patch('freqtrade.optimize.hyperopt.reject_on_subset',
+                          return_value='rejected on the data subset')
+    args = mocker.Mock(spaces=['stoploss'], subset=0.25, realistic_simulation=False)
+    objective = hyperopt.generate_objective(args)
+
+    result = objective({'stoploss': -0.1})
+    assert result['status'] == STATUS_FAIL
+    assert result['reason'] == 'rejected on the data subset'
+    assert mock_backtest.call_count == 1
+    subset.assert_called_once_with(0.25)
+    # The results of the subset are extrapolated to the whole timeframe
+    reject.assert_called_once_with(hyperopt.calculate_loss(0.4, 40, 20))
+
+    reject.return_value = None
+    assert objective({'stoploss': -0.1})['status'] == STATUS_OK
+    assert mock_backtest.call_count == 3
+
+
+def test_get_params_key():
+    params = {
+        'mfi': {'enabled': False},
+        'fastd': {'enabled': True, 'value': 30.0},
+        'adx': {'enabled': False},
+        'rsi': {'enabled': False},
+        'uptrend_long_ema': {'enabled': True},
+        'macd_below_zero': {'enabled': False},
+        'uptrend_short_ema': {'enabled': False},
+        'over_sar': {'enabled': False},
+        'green_candle': {'enabled': False},
+        'uptrend_sma': {'enabled': False},
+        'trigger': {'type': 'lower_bb'},
+        'roi_t1': 5, 'roi_t2': 10, 'roi_t3': 15,
+        'roi_p1': 0.01, 'roi_p2': 0.01, 'roi_p3': 0.01,
+        'stoploss': -0.1,
+    }
+    key = hyperopt.get_params_key('all', params)
+
+    # The value of a disabled guard has no effect
+    assert hyperopt.get_params_key('all', {**params, 'mfi': {'enabled': False, 'value': 10.0}}) \
+        == key
+    # Neither has a ROI table generating the same ROI
+    assert hyperopt.get_params_key('all', {**params, 'roi_p1': 0.010000000001}) == key
+    assert hyperopt.get_params_key('all', {**params, 'fastd': {'enabled': True, 'value': 35.0}}) \
+        != key
+    assert hyperopt.get_params_key('all', {**params, 'trigger': {'type': 'ht_sine'}}) != key
+    assert hyperopt.get_params_key('all', {**params, 'stoploss': -0.2}) != key
+    # Only the optimized spaces are part of the key
+    assert hyperopt.get_params_key('stoploss', params) == '{"stoploss": -0.1}'
+
+
+def test_generate_optimizer_uses_cache(mocker):
+    log_results = mocker.patch('freqtrade.optimize.hyperopt.log_results')
+    objective = MagicMock(side_effect=lambda params: {
+        'loss': -params['stoploss'], 'status': STATUS_OK, 'result': 'result'})
+    mocker.patch('freqtrade.optimize.hyperopt.generate_objective', return_value=objective)
+    cache = hyperopt.EvaluationCache('stoploss')
+    optimizer = hyperopt.generate_optimizer(MagicMock(), cache)
+
+    assert optimizer({'stoploss': -0.1})['loss'] == 0.1
+    assert optimizer({'stoploss': -0.2})['loss'] == 0.2
+    assert optimizer({'stoploss': -0.1})['loss'] == 0.1
+    assert objective.call_count == 2
+    assert (cache.hits, cache.misses) == (1, 2)
+    # Cached epochs are still logged
+    assert log_results.call_count == 3
+
+
+def test_fmin_parallel_uses_cache(mocker, caplog):
+    caplog.set_level(logging.INFO)
+    mocker.patch('freqtrade.optimize.hyperopt.log_results')
+
+    def objective(params):
+        return {'loss': -params['stoploss'], 'status': STATUS_OK, 'result': 'result'}
+
+    cache = hyperopt.EvaluationCache('stoploss')
+    trials = Trials()
+    hyperopt.fmin_parallel(objective, {'stoploss': hp.choice('stoploss', [-0.1, -0.2])},
+                           trials, max_evals=10, jobs=2, cache=cache)
+    assert len(trials.trials) == 10
+    assert sorted(cache.results) == ['{"stoploss": -0.1}', '{"stoploss": -0.2}']
+    assert cache.hits + cache.misses == 10
+    assert cache.hits >= 6
+    assert all(result['loss'] == [0.1, 0.2][trial['misc']['vals']['stoploss'][0]]
+               for trial, result in zip(trials.trials, trials.results))
+
+    cache.log_hit_rate()
+    assert 'Evaluation cache: {} hit(s), {} miss(es)'.format(cache.hits, cache.misses) \
+        in caplog.text
+
+
+def test_fmin_parallel_ranks_subset_in_main_process(mocker):
+    mocker.patch('freqtrade.optimize.hyperopt.log_results')
+    mocker.patch('freqtrade.optimize.hyperopt.MIN_SUBSET_EPOCHS', 4)
+
+    def suggest(new_ids, domain, trials, seed):
+        # The suggestions only depend on the trial id, whatever the batches
+        return rand.suggest(new_ids, domain, trials, new_ids[0])
+    mocker.patch('freqtrade.optimize.hyperopt.tpe.suggest', suggest)
+
+    def subset_objective(params):
+        return params['x']
+
+    def full_objective(params):
+        return {'loss': params['x'], 'status': STATUS_OK, 'result': str(params['x'])}
+    mocker.patch('freqtrade.optimize.hyperopt.generate_subset_objective',
+                 return_value=subset_objective)
+    mocker.patch('freqtrade.optimize.hyperopt.generate_full_objective',
+                 return_value=full_objective)
+    space = {'x': hp.uniform('x', 0, 1)}
+
+    def rejected(trials):
+        return [trial['tid'] for trial in trials.trials if 'subset_loss' in trial['result']]
+
+    mocker.patch('freqtrade.optimize.hyperopt._SUBSET_LOSSES', [])
+    sequential = Trials()
+    fmin(fn=hyperopt.generate_optimizer(MagicMock(subset=0.5)), space=space, algo=suggest,
+         max_evals=20, trials=sequential)
+    assert rejected(sequential)
+
+    for jobs in [1, 3]:
+        mocker.patch('freqtrade.optimize.hyperopt._SUBSET_LOSSES', [])
+        trials = Trials()
+        hyperopt.fmin_parallel(full_objective, space, trials, max_evals=20, jobs=jobs,
+                               subset_objective=subset_objective)
+        assert rejected(trials) == rejected(sequential)
+        assert len(hyperopt._SUBSET_LOSSES) == 20
+    assert hyperopt._PARALLEL_SUBSET_OBJECTIVE is None
+
+
+def test_init_subset_ignored_with_mongodb(mocker, caplog):
+    subset = mocker.patch('freqtrade.optimize.hyperopt.get_processed_subset')
+    args = mocker.Mock(subset=0.2, mongodb=True)
+    hyperopt.init_subset(args)
+    assert args.subset is None
+    assert subset.call_count == 0
+    assert '--subset is not supported with --mongodb, ignoring it' in caplog.text
+
+
+def test_fmin_parallel_constant_liar(mocker):
+    mocker.patch('freqtrade.optimize.hyperopt.log_results')
+    suggest = tpe.suggest
+    pending = []
+
+    def recording_suggest(new_ids, domain, trials, seed):
+        pending.append([trial['result'] for trial in trials.trials if trial['state'] == 0])
+        return suggest(new_ids, domain, trials, seed)
+    mocker.patch('freqtrade.optimize.hyperopt.tpe.suggest', recording_suggest)
+
+    def objective(params):
+        return {'loss': params['x'], 'status': STATUS_OK, 'result': str(params['x'])}
+
+    trials = Trials()
+    hyperopt.fmin_parallel(objective, {'x': hp.uniform('x', 0, 1)}, trials,
+                           max_evals=6, jobs=3)
+    first_losses = [result['loss'] for result in trials.results[:3]]
+
+    # Nothing is known of the first batch, the next suggestions of the second batch
+    # see its pending trials with the mean loss of the first batch
+    assert pending[:3] == [[], [{'status': 'new'}], [{'status': 'new'}] * 2]
+    liar = {'status': STATUS_OK, 'loss': sum(first_losses) / 3}
+    assert pending[3:] == [[], [liar], [liar] * 2]
+    # The provisional results are replaced by the evaluated ones
+    assert all(result['result'] == str(result['loss']) for result in trials.results)
+
+
+def test_fmin_parallel_default_start_method_spawn(mocker):
+    mocker.patch('freqtrade.optimize.hyperopt.log_results')
+
+    def objective(params):
+        return {'loss': params['x'], 'status': STATUS_OK, 'result': str(params['x'])}
+
+    # The workers are forked whatever the default start method is
+    start_method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method('spawn', force=True)
+    try:
+        trials = Trials()
+        hyperopt.fmin_parallel(objective, {'x': hp.uniform('x', 0, 1)}, trials,
+                               max_evals=4, jobs=2)
+    finally:
+        multiprocessing.set_start_method(start_method, force=True)
+    assert all(result['status'] == STATUS_OK for result in trials.results)
+
+
+def test_jobs_require_fork(mocker):
+    mocker.patch('freqtrade.optimize.get_fork_context', return_value=None)
+    with pytest.raises(OperationalException, match=r'--jobs requires fork'):
+        hyperopt.check_jobs(mocker.Mock(jobs=2, mongodb=False))
+    with pytest.raises(OperationalException, match=r'--jobs requires fork'):
+        hyperopt.fmin_parallel(MagicMock(), {'x': hp.uniform('x', 0, 1)}, Trials(),
+                               max_evals=4, jobs=2)
+    hyperopt.check_jobs(mocker.Mock(jobs=1, mongodb=False))
+    hyperopt.check_jobs(mocker.Mock(jobs=2, mongodb=True))
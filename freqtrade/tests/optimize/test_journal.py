@@ -0,0 +1,57 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import os
+import pickle
+
+from hyperopt import STATUS_OK, Trials, fmin, hp, tpe
+
+from freqtrade.optimize.journal import (JournaledTrials, load_trials, migrate_pickle,
+                                        read_journal)
+
+
+def _objective(x):
+    return {'loss': x ** 2, 'status': STATUS_OK, 'result': 'x={}'.format(x)}
+
+
+def _space():
+    return hp.uniform('x', -1, 1)
+
+
+def test_trials_are_journaled_when_done(tmpdir):
+    path = str(tmpdir.join('trials.jsonl'))
+    trials = JournaledTrials(path)
+    assert not os.path.isfile(path)
+
+    fmin(_objective, _space(), algo=tpe.suggest, max_evals=4, trials=trials)
+    docs = list(read_journal(path))
+    assert [doc['tid'] for doc in docs] == [0, 1, 2, 3]
+    assert [doc['result'] for doc in docs] == trials.results
+    assert docs[0]['misc']['vals']['x'] == trials.trials[0]['misc']['vals']['x']
+    assert docs[0]['refresh_time'] == trials.trials[0]['refresh_time']
+
+
+def test_load_trials_resumes(tmpdir):
+    path = str(tmpdir.join('trials.jsonl'))
+    fmin(_objective, _space(), algo=tpe.suggest, max_evals=3, trials=JournaledTrials(path))
+    # A line truncated by a crash is skipped
+    with open(path, 'a') as journal:
+        journal.write('{"state": 2, "tid"')
+
+    trials = load_trials(path)
+    assert len(trials.trials) == 3
+    fmin(_objective, _space(), algo=tpe.suggest, max_evals=5, trials=trials)
+    assert [doc['tid'] for doc in read_journal(path)] == [0, 1, 2, 3, 4]
+    assert load_trials(path).results == trials.results
+
+
+def test_migrate_pickle(tmpdir):
+    pickle_path = str(tmpdir.join('trials.pickle'))
+    path = str(tmpdir.join('trials.jsonl'))
+    trials = Trials()
+    fmin(_objective, _space(), algo=tpe.suggest, max_evals=2, trials=trials)
+    with open(pickle_path, 'wb') as file:
+        pickle.dump(trials, file)
+
+    migrate_pickle(pickle_path, path)
+    assert not os.path.isfile(pickle_path)
+    assert load_trials(path).results == trials.results
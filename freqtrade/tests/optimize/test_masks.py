@@ -0,0 +1,60 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import gc
+
+import numpy as np
+import pytest
+from pandas import DataFrame
+
+from freqtrade.optimize import masks
+from freqtrade.optimize.masks import get_condition_masks
+
+
+def _dataframe():
+    return DataFrame({
+        'rsi': [30.0, np.nan, 20.0, 25.0, 40.0, 25.0],
+        'close': [1.0, 2.0, 3.0, 2.0, 1.0, 4.0],
+    })
+
+
+def test_threshold_matches_pandas():
+    dataframe = _dataframe()
+    condition_masks = get_condition_masks(dataframe)
+    for value in [10, 20, 25, 27.5, 40, 50]:
+        expected = {
+            '<': dataframe['rsi'] < value,
+            '<=': dataframe['rsi'] <= value,
+            '>': dataframe['rsi'] > value,
+            '>=': dataframe['rsi'] >= value,
+        }
+        for operator, series in expected.items():
+            assert condition_masks.threshold('rsi', operator, value).tolist() == series.tolist()
+
+    with pytest.raises(ValueError, match=r'Unsupported operator'):
+        condition_masks.threshold('rsi', '==', 25)
+
+
+def test_condition_is_computed_once():
+    dataframe = _dataframe()
+    calls = []
+
+    def rising(frame):
+        calls.append(frame)
+        return frame['close'] > frame['close'].shift(1)
+
+    first = get_condition_masks(dataframe).condition('rising', rising)
+    second = get_condition_masks(dataframe).condition('rising', rising)
+    assert first is second
+    assert len(calls) == 1
+    assert first.tolist() == [False, True, True, False, False, True]
+
+
+def test_masks_are_dropped_with_dataframe():
+    dataframe = _dataframe()
+    get_condition_masks(dataframe).threshold('rsi', '<', 30)
+    key = id(dataframe)
+    assert key in masks._MASKS
+
+    del dataframe
+    gc.collect()
+    assert key not in masks._MASKS
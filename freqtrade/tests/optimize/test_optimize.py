@@ -3,6 +3,7 @@
 import os
 import json
 import logging
+import multiprocessing
 import uuid
 from shutil import copyfile
 from freqtrade import exchange, optimize
@@ -203,11 +204,56 @@ def test_download_backtesting_testdata(default_conf, ticker_history, mocker):
 def test_download_backtesting_testdata2(mocker):
     tick = [{'T': 'bar'}, {'T': 'foo'}]
     mocker.patch('freqtrade.misc.file_dump_json', return_value=None)
+    mocker.patch('freqtrade.misc.file_append_json', return_value=None)
     mocker.patch('freqtrade.optimize.__init__.get_ticker_history', return_value=tick)
     assert download_backtesting_testdata(None, pair="BTC-UNITEST", interval=1)
     assert download_backtesting_testdata(None, pair="BTC-UNITEST", interval=3)
 
 
+def test_download_backtesting_testdata_appends(ticker_history, mocker, tmpdir):
+    stored = [{'T': '2017-11-26T08:50:00', 'C': 1}, {'T': '2017-11-26T08:55:00', 'C': 2}]
+    file = tmpdir.join('BTC_ETH-5.json')
+    file.write(json.dumps(stored, indent=2) + '\n')
+
+    new_data = [
+        {'T': '2017-11-26T08:55:00', 'C': 3},
+        {'T': '2017-11-26T09:05:00', 'C': 5},
+        {'T': '2017-11-26T09:00:00', 'C': 4},
+        {'T': '2017-11-26T09:05:00', 'C': 5},
+    ]
+    mocker.patch('freqtrade.optimize.__init__.get_ticker_history', return_value=new_data)
+    assert download_backtesting_testdata(str(tmpdir), pair='BTC-ETH', interval=5)
+
+    # Only the newer candles are appended once, in order
+    assert json.loads(file.read()) == stored + [new_data[2], new_data[1]]
+    assert optimize.get_last_timestamp(str(file)) == '2017-11-26T09:05:00'
+
+    # Nothing newer to append
+    assert download_backtesting_testdata(str(tmpdir), pair='BTC-ETH', interval=5)
+    assert len(json.loads(file.read())) == 4
+
+
+def test_download_tickerdata_reports_failures(mocker, caplog):
+    caplog.set_level(logging.INFO)
+
+    def download(datadir, pair, interval):
+        if pair == 'BTC-CFI':
+            raise BaseException('Network error')
+        return True
+    mocker.patch('freqtrade.optimize.__init__.download_backtesting_testdata',
+                 side_effect=download)
+
+    results = optimize.__init__.download_tickerdata(None, ['BTC-MEME', 'BTC-CFI', 'BTC-ETH'],
+                                                    [1, 5])
+    assert results == {
+        ('BTC-MEME', 1): True, ('BTC-MEME', 5): True,
+        ('BTC-CFI', 1): False, ('BTC-CFI', 5): False,
+        ('BTC-ETH', 1): True, ('BTC-ETH', 5): True,
+    }
+    assert 'Downloaded 4 of 6 ticker files' in caplog.text
+    assert not optimize.__init__.download_pairs(None, ['BTC-MEME', 'BTC-CFI'], 1)
+
+
 def test_load_tickerdata_file():
     # 7 does not exist in either format.
     assert not load_tickerdata_file(None, 'BTC_UNITEST', 7)
@@ -234,6 +280,70 @@ def test_tickerdata_to_dataframe():
     assert len(data['BTC_UNITEST']) == 100
 
 
+def test_preprocess_jobs(default_strategy):
+    timerange = ((None, 'line'), None, -100)
+    tickerdata = {pair: load_tickerdata_file(None, pair, 1, timerange=timerange)
+                  for pair in ['BTC_UNITEST', 'BTC_ETH', 'BTC_LTC']}
+    expected = optimize.preprocess(tickerdata)
+    data = optimize.preprocess(tickerdata, jobs=2)
+
+    assert list(data) == list(expected)
+    for pair, dataframe in data.items():
+        assert dataframe.equals(expected[pair])
+        assert str(dataframe['date'].dt.tz) == 'UTC'
+
+
+def test_preprocess_jobs_default_start_method_spawn(default_strategy):
+    timerange = ((None, 'line'), None, -100)
+    tickerdata = {pair: load_tickerdata_file(None, pair, 1, timerange=timerange)
+                  for pair in ['BTC_UNITEST', 'BTC_ETH']}
+    expected = optimize.preprocess(tickerdata)
+    # The workers are forked whatever the default start method is
+    start_method = multiprocessing.get_start_method(allow_none=True)
+    multiprocessing.set_start_method('spawn', force=True)
+    try:
+        data = optimize.tickerdata_to_dataframe(tickerdata, jobs=2)
+    finally:
+        multiprocessing.set_start_method(start_method, force=True)
+    for pair, dataframe in data.items():
+        assert dataframe.equals(expected[pair])
+
+
+def test_preprocess_jobs_without_fork(default_strategy, mocker, caplog):
+    mocker.patch('freqtrade.optimize.get_fork_context', return_value=None)
+    pool = mocker.patch('freqtrade.optimize.create_process_pool')
+    timerange = ((None, 'line'), None, -100)
+    tickerdata = {pair: load_tickerdata_file(None, pair, 1, timerange=timerange)
+                  for pair in ['BTC_UNITEST', 'BTC_ETH']}
+    data = optimize.preprocess(tickerdata, jobs=2)
+    assert list(data) == ['BTC_UNITEST', 'BTC_ETH']
+    assert pool.call_count == 0
+    assert 'computing the indicators in a single process' in caplog.text
+
+
+def test_preprocess_compact(default_strategy, caplog):
+    caplog.set_level(logging.INFO)
+    timerange = ((None, 'line'), None, -100)
+    tickerdata = {'BTC_UNITEST': load_tickerdata_file(None, 'BTC_UNITEST', 1, timerange=timerange)}
+    expected = optimize.preprocess(tickerdata)['BTC_UNITEST']
+    dataframe = optimize.preprocess(tickerdata, compact=True)['BTC_UNITEST']
+
+    assert dataframe['close'].dtype == 'float32'
+    assert dataframe['rsi'].dtype == 'float32'
+    assert dataframe['date'].equals(expected['date'])
+    assert ((dataframe['close'] - expected['close']).abs() <= expected['close'] * 1e-7).all()
+    assert dataframe.memory_usage().sum() < expected.memory_usage().sum() * 0.6
+    assert 'Compact mode memory usage' in caplog.text
+
+
+def test_generate_memory_report():
+    report = optimize.generate_memory_report({'BTC_ETH': (4 * 2**20, 2 * 2**20),
+                                              'BTC_LTC': (2 * 2**20, 2**20)})
+    lines = report.splitlines()
+    assert lines[2].split() == ['BTC_ETH', '4.00', '2.00', '50.00']
+    assert lines[-1].split() == ['TOTAL', '6.00', '3.00', '50.00']
+
+
 def test_trim_tickerlist():
     with open('freqtrade/tests/testdata/BTC_ETH-1.json') as data_file:
         ticker_list = json.load(data_file)
@@ -279,6 +389,31 @@ def test_trim_tickerlist():
     assert ticker_list_len == ticker_len
 
 
+def test_trim_tickerlist_dates():
+    ticker_list = load_tickerdata_file(None, 'BTC_UNITEST', 1)
+
+    # The start date is included, the stop date excluded
+    timerange = (('date', 'date'), '20171110', '20171112')
+    ticker = trim_tickerlist(ticker_list, timerange)
+    assert ticker[0]['T'] == '2017-11-10T00:00:00'
+    assert ticker[-1]['T'] == '2017-11-11T23:59:00'
+    assert ticker_list[ticker_list.index(ticker[0]) - 1]['T'] < '2017-11-10T00:00:00'
+
+    timerange = ((None, 'date'), None, '20171110')
+    before = trim_tickerlist(ticker_list, timerange)
+    timerange = (('date', None), '20171110', None)
+    after = trim_tickerlist(ticker_list, timerange)
+    assert before[0] is ticker_list[0]
+    assert after[-1] is ticker_list[-1]
+    assert len(before) + len(after) == _BTC_UNITTEST_LENGTH
+
+    # Dates outside of the data
+    timerange = (('date', 'date'), '20170101', '20170201')
+    assert trim_tickerlist(ticker_list, timerange) == []
+    timerange = (('date', None), '20170101', None)
+    assert len(trim_tickerlist(ticker_list, timerange)) == _BTC_UNITTEST_LENGTH
+
+
 def test_file_dump_json():
 
     file = 'freqtrade/tests/testdata/test_{id}.json'.format(id=str(uuid.uuid4()))
@@ -0,0 +1,53 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+
+import numpy as np
+import pytest
+from pandas import DataFrame, to_datetime
+from pandas.testing import assert_frame_equal
+
+from freqtrade import OperationalException
+from freqtrade.optimize.store import load_processed, save_processed
+
+
+def _processed():
+    return {'BTC_UNITEST': DataFrame({
+        'date': to_datetime([1509836520, 1509836580, 1509836640], unit='s', utc=True),
+        'close': [0.00162008, 0.00162008, 0.00162009],
+        'rsi': [30.5, 31.0, 29.2],
+        'cdl': np.array([0, 100, -100], dtype=np.int32),
+    })}
+
+
+def test_save_load_processed(tmpdir):
+    processed = _processed()
+    save_processed(str(tmpdir), processed)
+    loaded = load_processed(str(tmpdir))
+
+    assert list(loaded) == ['BTC_UNITEST']
+    frame = loaded['BTC_UNITEST']
+    assert_frame_equal(frame[processed['BTC_UNITEST'].columns], processed['BTC_UNITEST'])
+
+    # Numeric columns are read-only views of the memory-mapped files
+    assert not frame['close'].values.flags.writeable
+    # Columns can still be added, as backtesting does
+    frame['buy'] = 0
+    frame.loc[frame['rsi'] < 30, 'buy'] = 1
+    assert frame['buy'].tolist() == [0, 0, 1]
+
+
+def test_save_processed_replaces_store(tmpdir):
+    save_processed(str(tmpdir), _processed())
+    save_processed(str(tmpdir), {'BTC_ETH': _processed()['BTC_UNITEST']})
+    assert list(load_processed(str(tmpdir))) == ['BTC_ETH']
+
+
+def test_save_processed_unsupported_column(tmpdir):
+    processed = _processed()
+    processed['BTC_UNITEST']['name'] = 'foo'
+    with pytest.raises(OperationalException, match=r'can not be memory-mapped'):
+        save_processed(str(tmpdir), processed)
+
+
+def test_load_processed_missing_store(tmpdir):
+    with pytest.raises(OperationalException, match=r'No preprocessed data store'):
+        load_processed(str(tmpdir.join('missing')))
@@ -0,0 +1,48 @@
+# pragma pylint: disable=missing-docstring
+from datetime import datetime
+
+import pytest
+
+from freqtrade.optimize.trade import SimulationTrade
+from freqtrade.persistence import Trade
+
+
+def _make_trades(**kwargs):
+    trade = Trade(pair='BTC_ETH', exchange='BITTREX', **kwargs)
+    sim_trade = SimulationTrade(pair='BTC_ETH', **kwargs)
+    return trade, sim_trade
+
+
+def test_simulation_trade_has_no_dict():
+    trade = SimulationTrade(open_rate=0.00001099, open_date=datetime.utcnow(),
+                            stake_amount=0.001, amount=90.99181073, fee=0.0025)
+    assert not hasattr(trade, '__dict__')
+    with pytest.raises(AttributeError):
+        trade.foo = 'bar'
+
+
+def test_simulation_trade_matches_trade():
+    trade, sim_trade = _make_trades(open_rate=0.00001099, open_date=datetime.utcnow(),
+                                    stake_amount=0.001, amount=90.99181073, fee=0.0025)
+
+    assert sim_trade.calc_open_trade_price() == pytest.approx(trade.calc_open_trade_price())
+    for rate in [0.00001234, 0.00000123, 0.00001173]:
+        for fee in [None, 0.003]:
+            assert sim_trade.calc_close_trade_price(rate=rate, fee=fee) == \
+                pytest.approx(trade.calc_close_trade_price(rate=rate, fee=fee))
+            assert sim_trade.calc_profit(rate=rate, fee=fee) == \
+                pytest.approx(trade.calc_profit(rate=rate, fee=fee), abs=1e-8)
+            assert sim_trade.calc_profit_percent(rate=rate, fee=fee) == \
+                pytest.approx(trade.calc_profit_percent(rate=rate, fee=fee), abs=1e-6)
+
+
+def test_simulation_trade_calc_profit():
+    trade = SimulationTrade(open_rate=0.00001099, open_date=datetime.utcnow(),
+                            stake_amount=0.001, amount=90.99181073, fee=0.0025)
+    assert trade.calc_close_trade_price() == 0.0
+    assert trade.calc_profit(rate=0.00001234) == 0.00011753
+    assert trade.calc_profit(rate=0.00000123, fee=0.003) == -0.00089092
+    assert trade.calc_profit_percent(rate=0.00001173) == pytest.approx(0.06201057, abs=1e-7)
+
+    trade.close_rate = 0.00001173
+    assert trade.calc_profit() == 0.00006217
@@ -1,13 +1,17 @@
 # pragma pylint: disable=missing-docstring, C0103
 import datetime
+import json
 from unittest.mock import MagicMock
 
 import arrow
 import logging
+import pytest
 from pandas import DataFrame
 
+import freqtrade.analyze
 import freqtrade.tests.conftest as tt  # test tools
-from freqtrade.analyze import (get_signal, parse_ticker_dataframe,
+from freqtrade.analyze import (analyze_ticker, analyze_ticker_incremental,
+                               get_signal, parse_ticker_dataframe,
                                populate_buy_trend, populate_indicators,
                                populate_sell_trend)
 from freqtrade.strategy.strategy import Strategy
@@ -126,3 +130,81 @@ def test_parse_ticker_dataframe(ticker_history, ticker_history_without_bv):
     # Test file without BV data
     dataframe = parse_ticker_dataframe(ticker_history_without_bv)
     assert dataframe.columns.tolist() == columns
+
+
+def test_parse_ticker_dataframe_same_as_legacy(mocker):
+    with open('freqtrade/tests/testdata/BTC_ETH-1.json') as data_file:
+        ticker = json.load(data_file)[:500]
+    legacy = mocker.spy(freqtrade.analyze, 'parse_ticker_dataframe_legacy')
+
+    for data in [ticker, list(reversed(ticker)), ticker[250:] + ticker[:250], ticker[:1]]:
+        dataframe = parse_ticker_dataframe(data)
+        expected = freqtrade.analyze.parse_ticker_dataframe_legacy(data)
+        assert dataframe.equals(expected[dataframe.columns])
+        assert dataframe.index.equals(expected.index)
+    assert legacy.call_count == 4  # only the explicit calls above
+
+
+def test_parse_ticker_dataframe_fallback(ticker_history, mocker):
+    legacy = mocker.spy(freqtrade.analyze, 'parse_ticker_dataframe_legacy')
+
+    # Timezone aware timestamps and unknown columns use the legacy parser
+    ticker = [dict(row, T=row['T'] + 'Z') for row in ticker_history]
+    dataframe = parse_ticker_dataframe(ticker)
+    assert legacy.call_count == 1
+    assert dataframe['date'].iloc[0].isoformat() == '2017-11-26T08:50:00+00:00'
+
+    parse_ticker_dataframe([dict(row, foo=1) for row in ticker_history])
+    assert legacy.call_count == 2
+
+    dataframe = parse_ticker_dataframe(DataFrame(ticker_history))
+    assert legacy.call_count == 3
+    assert len(dataframe) == 3
+
+
+def test_analyze_ticker_incremental_without_warmup(default_strategy, mocker):
+    analyze_mock = mocker.patch('freqtrade.analyze.analyze_ticker', return_value=DataFrame())
+    mocker.patch.dict('freqtrade.analyze._ANALYZED_TICKERS', clear=True)
+
+    analyze_ticker_incremental('BTC_ETH', [])
+    analyze_ticker_incremental('BTC_ETH', [])
+    assert analyze_mock.call_count == 2
+
+
+def test_analyze_ticker_incremental(default_strategy, mocker):
+    with open('freqtrade/tests/testdata/BTC_ETH-1.json') as data_file:
+        ticks = json.load(data_file)[:1000]
+    mocker.patch.object(default_strategy, 'warmup_candles', 200)
+    mocker.patch.dict('freqtrade.analyze._ANALYZED_TICKERS', clear=True)
+    indicators_mock = mocker.patch('freqtrade.analyze.populate_indicators',
+                                   side_effect=populate_indicators)
+
+    # First call analyzes the whole history
+    analyze_ticker_incremental('BTC_ETH', ticks[:-10])
+    assert len(indicators_mock.call_args[0][0]) == 990
+
+    # Next calls only analyze the new candles and the warm-up window
+    for index in range(9, -1, -1):
+        dataframe = analyze_ticker_incremental('BTC_ETH', ticks[:len(ticks) - index])
+        assert len(indicators_mock.call_args[0][0]) == 202
+    assert len(dataframe) == 1000
+
+    expected = analyze_ticker(ticks).reset_index(drop=True)
+    assert dataframe['date'].equals(expected['date'])
+    assert dataframe['sma'].tail(10).tolist() == pytest.approx(expected['sma'].tail(10).tolist())
+    assert dataframe['buy'].fillna(0).equals(expected['buy'].fillna(0))
+    assert dataframe['sell'].fillna(0).equals(expected['sell'].fillna(0))
+
+
+def test_analyze_ticker_incremental_no_overlap(default_strategy, mocker):
+    with open('freqtrade/tests/testdata/BTC_ETH-1.json') as data_file:
+        ticks = json.load(data_file)[:1000]
+    mocker.patch.object(default_strategy, 'warmup_candles', 200)
+    mocker.patch.dict('freqtrade.analyze._ANALYZED_TICKERS', clear=True)
+    indicators_mock = mocker.patch('freqtrade.analyze.populate_indicators',
+                                   side_effect=populate_indicators)
+
+    analyze_ticker_incremental('BTC_ETH', ticks[:400])
+    dataframe = analyze_ticker_incremental('BTC_ETH', ticks[500:])
+    assert len(indicators_mock.call_args[0][0]) == 500
+    assert len(dataframe) == 500
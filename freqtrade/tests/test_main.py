@@ -1,6 +1,7 @@
 # pragma pylint: disable=missing-docstring, C0103
 import copy
 import logging
+from datetime import datetime
 from unittest.mock import MagicMock
 
 import arrow
@@ -12,8 +13,11 @@ import freqtrade.main as main
 import freqtrade.tests.conftest as tt  # test tools
 from freqtrade import DependencyException, OperationalException
 from freqtrade.exchange import Exchanges
+from freqtrade.exchange.cryptopia import Cryptopia
 from freqtrade.main import (_process, check_handle_timedout, create_trade,
-                            execute_sell, get_target_bid, handle_trade, init)
+                            execute_sell, get_buy_pair, get_scheduler,
+                            get_target_bid, handle_trade, init,
+                            process_maybe_execute_sell, reconcile_orders)
 from freqtrade.misc import State, get_state
 from freqtrade.persistence import Trade
 
@@ -81,6 +85,7 @@ def test_process_trade_creation(default_conf, ticker, limit_buy_order, health, m
     mocker.patch.multiple('freqtrade.rpc', init=MagicMock(), send_msg=MagicMock())
     mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
     mocker.patch.multiple('freqtrade.main.exchange',
+                          refresh_tickers=MagicMock(),
                           validate_pairs=MagicMock(),
                           get_ticker=ticker,
                           get_wallet_health=health,
@@ -112,6 +117,7 @@ def test_process_exchange_failures(default_conf, ticker, health, mocker):
     mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
     sleep_mock = mocker.patch('time.sleep', side_effect=lambda _: None)
     mocker.patch.multiple('freqtrade.main.exchange',
+                          refresh_tickers=MagicMock(),
                           validate_pairs=MagicMock(),
                           get_ticker=ticker,
                           get_wallet_health=health,
@@ -128,6 +134,7 @@ def test_process_operational_exception(default_conf, ticker, health, mocker):
     mocker.patch.multiple('freqtrade.rpc', init=MagicMock(), send_msg=msg_mock)
     mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
     mocker.patch.multiple('freqtrade.main.exchange',
+                          refresh_tickers=MagicMock(),
                           validate_pairs=MagicMock(),
                           get_ticker=ticker,
                           get_wallet_health=health,
@@ -146,6 +153,7 @@ def test_process_trade_handling(default_conf, ticker, limit_buy_order, health, m
     mocker.patch.multiple('freqtrade.rpc', init=MagicMock(), send_msg=MagicMock())
     mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
     mocker.patch.multiple('freqtrade.main.exchange',
+                          refresh_tickers=MagicMock(),
                           validate_pairs=MagicMock(),
                           get_ticker=ticker,
                           get_wallet_health=health,
@@ -164,6 +172,61 @@ def test_process_trade_handling(default_conf, ticker, limit_buy_order, health, m
     assert result is False
 
 
+def test_process_open_trades_only(default_conf, ticker, health, mocker):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    mocker.patch.multiple('freqtrade.rpc', init=MagicMock(), send_msg=MagicMock())
+    mocker.patch.multiple('freqtrade.main.exchange',
+                          refresh_tickers=MagicMock(),
+                          validate_pairs=MagicMock(),
+                          get_ticker=ticker,
+                          get_wallet_health=health)
+    buy_mock = mocker.patch('freqtrade.main.process_maybe_execute_buy')
+    init(default_conf, create_engine('sqlite://'))
+
+    assert _process(interval=int(default_conf['ticker_interval']), buy=False) is False
+    assert buy_mock.call_count == 0
+    assert main.exchange.get_wallet_health.call_count == 0
+
+
+def test_process_buy_only(default_conf, ticker, health, limit_buy_order, mocker):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    mocker.patch.multiple('freqtrade.rpc', init=MagicMock(), send_msg=MagicMock())
+    mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
+    mocker.patch.multiple('freqtrade.main.exchange',
+                          refresh_tickers=MagicMock(),
+                          validate_pairs=MagicMock(),
+                          get_ticker=ticker,
+                          get_wallet_health=health,
+                          buy=MagicMock(return_value='mocked_limit_buy'),
+                          get_order=MagicMock(return_value=limit_buy_order))
+    sell_mock = mocker.patch('freqtrade.main.process_maybe_execute_sell')
+    reconcile_mock = mocker.patch('freqtrade.main.reconcile_orders')
+    timedout_mock = mocker.patch('freqtrade.main.check_handle_timedout')
+    init(default_conf, create_engine('sqlite://'))
+
+    assert _process(interval=int(default_conf['ticker_interval']), sell=False) is True
+    assert _process(interval=int(default_conf['ticker_interval']), sell=False) is False
+    # The open trade is left to the open_trades task
+    assert sell_mock.call_count == 0
+    assert reconcile_mock.call_count == 0
+    assert timedout_mock.call_count == 0
+
+
+def test_get_scheduler(default_conf, mocker):
+    default_conf['internals'] = {'process_throttle_secs': 5, 'candle_settle_secs': 3}
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    process_mock = mocker.patch('freqtrade.main._process', return_value=False)
+
+    scheduler = get_scheduler(nb_assets=10)
+    scheduler.run_pending(now=1000)
+    process_mock.assert_any_call(interval=5, nb_assets=10, sell=False)
+    process_mock.assert_any_call(interval=5, buy=False)
+
+    next_runs = scheduler.next_run_times()
+    assert next_runs['process'] == datetime.utcfromtimestamp(1203)
+    assert next_runs['open_trades'] == datetime.utcfromtimestamp(1005)
+
+
 def test_create_trade(default_conf, ticker, limit_buy_order, mocker):
     mocker.patch.dict('freqtrade.main._CONF', default_conf)
     mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
@@ -271,6 +334,23 @@ def test_create_trade_no_signal(default_conf, mocker):
     assert not create_trade(stake_amount, int(default_conf['ticker_interval']))
 
 
+def test_get_buy_pair(default_conf, mocker):
+    whitelist = ['BTC_ETH', 'BTC_TKN', 'BTC_TRST', 'BTC_SWT', 'BTC_BCC']
+    signals = {'BTC_TRST': (True, False), 'BTC_SWT': (True, False), 'BTC_TKN': (True, True)}
+    signal_mock = mocker.patch('freqtrade.main.get_signal',
+                               side_effect=lambda pair, _: signals.get(pair, (False, False)))
+
+    for workers in (1, 3):
+        default_conf['internals'] = {'signal_workers': workers}
+        mocker.patch.dict('freqtrade.main._CONF', default_conf)
+        assert get_buy_pair(whitelist, 5) == 'BTC_TRST'
+
+    signals.clear()
+    signal_mock.reset_mock()
+    assert get_buy_pair(whitelist, 5) is None
+    assert sorted(call[0][0] for call in signal_mock.call_args_list) == sorted(whitelist)
+
+
 def test_handle_trade(default_conf, limit_buy_order, limit_sell_order, mocker):
     mocker.patch.dict('freqtrade.main._CONF', default_conf)
     mocker.patch('freqtrade.main.get_signal', side_effect=lambda s, t: (True, False))
@@ -479,6 +559,126 @@ def test_check_handle_timedout_buy(default_conf, ticker, limit_buy_order_old, mo
     assert nb_trades == 0
 
 
+def test_check_handle_timedout_reconciled_orders(default_conf, ticker, limit_buy_order_old,
+                                                 mocker):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    cancel_order_mock = MagicMock()
+    mocker.patch('freqtrade.rpc.init', MagicMock())
+    mocker.patch('freqtrade.main.rpc.send_msg', MagicMock())
+    get_order_mock = MagicMock(return_value=limit_buy_order_old)
+    mocker.patch.multiple('freqtrade.main.exchange',
+                          validate_pairs=MagicMock(),
+                          get_ticker=ticker,
+                          get_order=get_order_mock,
+                          cancel_order=cancel_order_mock)
+    init(default_conf, create_engine('sqlite://'))
+
+    for order_id in ['123456789', 'new_order']:
+        Trade.session.add(Trade(
+            pair='BTC_ETH',
+            open_rate=0.00001099,
+            exchange='BITTREX',
+            open_order_id=order_id,
+            amount=90.99181073,
+            fee=0.0,
+            stake_amount=1,
+            open_date=arrow.utcnow().shift(minutes=-601).datetime,
+            is_open=True
+        ))
+
+    # Orders which are not reconciled are not queried again
+    check_handle_timedout(600, {'123456789': limit_buy_order_old})
+    assert get_order_mock.call_count == 0
+    assert cancel_order_mock.call_count == 1
+    trades = Trade.query.filter(Trade.open_order_id.isnot(None)).all()
+    assert [trade.open_order_id for trade in trades] == ['new_order']
+
+
+def test_check_handle_timedout_cryptopia_orders(default_conf, ticker, mocker):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    cancel_order_mock = MagicMock()
+    mocker.patch('freqtrade.rpc.init', MagicMock())
+    mocker.patch('freqtrade.main.rpc.send_msg', MagicMock())
+    mocker.patch.multiple('freqtrade.main.exchange',
+                          validate_pairs=MagicMock(),
+                          get_ticker=ticker,
+                          cancel_order=cancel_order_mock)
+    init(default_conf, create_engine('sqlite://'))
+
+    def open_order(order_id, minutes):
+        timestamp = arrow.utcnow().shift(minutes=-minutes).format('YYYY-MM-DDTHH:mm:ss.SSSSSSS')
+        # As returned by the OpenOrders endpoint of Cryptopia
+        return {
+            'OrderId': order_id,
+            'TradePairId': 100,
+            'Market': 'ETH/BTC',
+            'Type': 'Buy',
+            'Rate': 0.00001099,
+            'Amount': 90.99181073,
+            'Total': 0.001,
+            'Remaining': 90.99181073,
+            'TimeStamp': timestamp,
+        }
+
+    api_mock = MagicMock()
+    api_mock.get_openorders = MagicMock(return_value={
+        'Success': True, 'Error': None, 'Data': [open_order(1, 10), open_order(2, 601)]})
+    mocker.patch('freqtrade.exchange.cryptopia._API', api_mock)
+    orders = {str(order['id']): order for order in Cryptopia.get_open_orders(MagicMock())}
+
+    for order_id, minutes in [('1', 10), ('2', 601)]:
+        Trade.session.add(Trade(
+            pair='BTC_ETH',
+            open_rate=0.00001099,
+            exchange='CRYPTOPIA',
+            open_order_id=order_id,
+            amount=90.99181073,
+            fee=0.0,
+            stake_amount=1,
+            open_date=arrow.utcnow().shift(minutes=-minutes).datetime,
+            is_open=True
+        ))
+
+    # Only the order placed more than 600 minutes ago is cancelled
+    check_handle_timedout(600, orders)
+    assert cancel_order_mock.call_count == 1
+    assert [trade.open_order_id for trade in Trade.query.all()] == ['1']
+
+
+def test_reconcile_orders(default_conf, limit_buy_order, mocker):
+    mocker.patch.dict('freqtrade.main._CONF', default_conf)
+    mocker.patch('freqtrade.rpc.init', MagicMock())
+    open_order = dict(limit_buy_order, id='open', closed=None, remaining=1)
+    get_open_orders_mock = MagicMock(return_value={'open': open_order})
+    get_order_mock = MagicMock(side_effect=[limit_buy_order,
+                                            requests.exceptions.RequestException])
+    mocker.patch.multiple('freqtrade.main.exchange',
+                          validate_pairs=MagicMock(),
+                          get_open_orders=get_open_orders_mock,
+                          get_order=get_order_mock)
+    init(default_conf, create_engine('sqlite://'))
+
+    # No request without open orders
+    assert reconcile_orders() == {}
+    assert get_open_orders_mock.call_count == 0
+
+    for order_id in ['open', 'filled', 'unknown']:
+        Trade.session.add(Trade(pair='BTC_ETH', exchange='BITTREX', open_order_id=order_id,
+                                stake_amount=1, fee=0.0, is_open=True))
+
+    orders = reconcile_orders()
+    assert orders == {'open': open_order, 'filled': limit_buy_order}
+    assert get_open_orders_mock.call_count == 1
+    assert [call[0][0] for call in get_order_mock.call_args_list] == ['filled', 'unknown']
+
+    mocker.patch('freqtrade.main.handle_trade', return_value=False)
+    trade = Trade.query.filter(Trade.open_order_id == 'filled').first()
+    assert process_maybe_execute_sell(trade, int(default_conf['ticker_interval']), orders) is False
+    assert get_order_mock.call_count == 2
+    assert trade.open_order_id is None
+    assert trade.open_rate == limit_buy_order['rate']
+
+
 def test_handle_timedout_limit_buy(mocker):
     cancel_order = MagicMock()
     mocker.patch('freqtrade.exchange.cancel_order', cancel_order)
@@ -9,7 +9,7 @@ import datetime
 import pytest
 from jsonschema import ValidationError
 from freqtrade.analyze import parse_ticker_dataframe
-from freqtrade.misc import (common_args_parser, file_dump_json, load_config,
+from freqtrade.misc import (common_args_parser, file_append_json, file_dump_json, load_config,
                             parse_args, parse_timerange, throttle, datesarray_to_datetimearray)
 
 
@@ -135,6 +135,50 @@ def test_parse_args_hyperopt_custom():
     assert call_args.func is not None
 
 
+def test_parse_args_convert_data():
+    call_args = parse_args(['-d', 'user_data/data', 'convert-data', '--force'], '')
+    assert call_args.datadir == 'user_data/data'
+    assert call_args.subparser == 'convert-data'
+    assert call_args.force is True
+    assert call_args.func is not None
+
+
+def test_parse_args_jobs():
+    call_args = parse_args(['backtesting', '--jobs', '4'], '')
+    assert call_args.jobs == 4
+    call_args = parse_args(['hyperopt', '-j', '2'], '')
+    assert call_args.jobs == 2
+    assert parse_args(['backtesting'], '').jobs == 1
+
+
+def test_parse_args_subset():
+    assert parse_args(['hyperopt', '--subset', '0.2'], '').subset == 0.2
+    assert parse_args(['hyperopt'], '').subset is None
+    with pytest.raises(SystemExit, match=r'2'):
+        parse_args(['hyperopt', '--subset', '1.5'], '')
+
+
+def test_parse_args_streaming():
+    assert parse_args(['backtesting', '--streaming'], '').streaming is True
+    assert parse_args(['backtesting'], '').streaming is False
+
+
+def test_file_append_json(tmpdir):
+    file = tmpdir.join('data.json')
+    file.write('[]')
+    file_append_json(str(file), [{'T': 1}])
+    file_append_json(str(file), [])
+    assert json.loads(file.read()) == [{'T': 1}]
+
+    file.write('[\n  {"T": 1}\n]\n')
+    file_append_json(str(file), [{'T': 2}, {'T': 3}])
+    assert json.loads(file.read()) == [{'T': 1}, {'T': 2}, {'T': 3}]
+
+    file.write('{"T": 1}')
+    with pytest.raises(ValueError, match=r'does not contain a JSON list'):
+        file_append_json(str(file), [{'T': 2}])
+
+
 def test_file_dump_json(mocker):
     file_open = mocker.patch('freqtrade.misc.open', MagicMock())
     json_dump = mocker.patch('json.dump', MagicMock())
@@ -0,0 +1,55 @@
+# pragma pylint: disable=missing-docstring, protected-access, C0103
+from datetime import datetime
+from unittest.mock import MagicMock
+
+from freqtrade.scheduler import Scheduler
+
+
+def test_scheduler_period():
+    func = MagicMock(return_value=True)
+    scheduler = Scheduler()
+    scheduler.add_task('task', func, period=10, foo='bar')
+
+    # First run happens as soon as possible
+    assert scheduler.run_pending(now=1000) == {'task': True}
+    func.assert_called_once_with(foo='bar')
+    assert scheduler.next_run_times() == {'task': datetime.utcfromtimestamp(1010)}
+
+    assert scheduler.run_pending(now=1009) == {}
+    assert scheduler.run_pending(now=1010) == {'task': True}
+    assert func.call_count == 2
+
+
+def test_scheduler_align():
+    func = MagicMock(return_value=None)
+    scheduler = Scheduler()
+    scheduler.add_task('candle', func, period=300, align=True, delay=5)
+
+    scheduler.run_pending(now=1000)
+    assert scheduler.next_run_times()['candle'] == datetime.utcfromtimestamp(1205)
+
+    # Not before the candle boundary and its settle delay
+    scheduler.run_pending(now=1203)
+    assert func.call_count == 1
+    scheduler.run_pending(now=1206)
+    assert func.call_count == 2
+    assert scheduler.next_run_times()['candle'] == datetime.utcfromtimestamp(1505)
+
+    # Within the settle delay, the previous boundary is still the reference
+    scheduler.run_pending(now=1502)
+    assert func.call_count == 2
+
+
+def test_scheduler_sleep(mocker):
+    sleep_mock = mocker.patch('freqtrade.scheduler.time.sleep')
+    scheduler = Scheduler()
+    scheduler.add_task('slow', MagicMock(), period=60)
+    scheduler.add_task('fast', MagicMock(), period=5)
+    scheduler.run_pending(now=1000)
+
+    scheduler.sleep(max_secs=10, now=1002)
+    sleep_mock.assert_called_with(3)
+    scheduler.sleep(max_secs=1, now=1002)
+    sleep_mock.assert_called_with(1)
+    scheduler.sleep(max_secs=1, now=1010)
+    sleep_mock.assert_called_with(0.0)
@@ -1,10 +1,11 @@
 #!/usr/bin/env python3
 
 """This script generate json data from bittrex"""
+import os
 import sys
 import json
 
-from freqtrade import exchange
+from freqtrade import exchange, optimize
 from freqtrade.exchange import Bittrex
 from freqtrade import misc
 
@@ -30,9 +31,7 @@ print('About to download pairs:', PAIRS)
 # Init Bittrex exchange
 exchange._API = Bittrex({'key': '', 'secret': ''})
 
-for pair in PAIRS:
-    for tick_interval in TICKER_INTERVALS:
-        print('downloading pair %s, interval %s' % (pair, tick_interval))
-        data = exchange.get_ticker_history(pair, tick_interval)
-        filename = '{}-{}.json'.format(pair, tick_interval)
-        misc.file_dump_json(filename, data)
+# Only the candles newer than the existing files are appended to them
+results = optimize.download_tickerdata(os.getcwd(), PAIRS, TICKER_INTERVALS)
+for (pair, tick_interval), success in sorted(results.items()):
+    print('pair %s, interval %s: %s' % (pair, tick_interval, 'ok' if success else 'failed'))
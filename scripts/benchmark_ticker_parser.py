@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark of analyze.parse_ticker_dataframe against the legacy parser.
+Usage: python3 scripts/benchmark_ticker_parser.py [--rows 100000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import timeit
+from datetime import datetime, timedelta
+
+from freqtrade.analyze import parse_ticker_dataframe, parse_ticker_dataframe_legacy
+
+TESTDATA = os.path.join(os.path.dirname(__file__), '..', 'freqtrade', 'tests', 'testdata',
+                        'BTC_ETH-1.json')
+START = datetime(2018, 1, 1)
+
+
+def make_ticker(rows: int) -> list:
+    """Repeats the candles of the test data with consecutive 1 minute timestamps"""
+    with open(TESTDATA) as file:
+        candles = json.load(file)
+    ticker = []
+    for index in range(rows):
+        candle = dict(candles[index % len(candles)])
+        candle['T'] = (START + timedelta(minutes=index)).isoformat()
+        ticker.append(candle)
+    return ticker
+
+
+def main(argv) -> None:
+    parser = argparse.ArgumentParser(description='Benchmark the ticker parsers')
+    parser.add_argument('--rows', type=int, default=100000, help='number of candles')
+    parser.add_argument('--repeat', type=int, default=5, help='number of runs per parser')
+    args = parser.parse_args(argv)
+
+    ticker = make_ticker(args.rows)
+    reverse = list(reversed(ticker))
+    for name, data in [('sorted', ticker), ('reversed', reverse)]:
+        legacy = min(timeit.repeat(lambda: parse_ticker_dataframe_legacy(data),
+                                   number=1, repeat=args.repeat))
+        fast = min(timeit.repeat(lambda: parse_ticker_dataframe(data),
+                                 number=1, repeat=args.repeat))
+        print('{:>8} {} rows: legacy {:.3f}s, parse_ticker_dataframe {:.3f}s ({:.1f}x)'.format(
+            name, args.rows, legacy, fast, legacy / fast))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
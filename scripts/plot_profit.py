@@ -17,6 +17,7 @@ def plot_parse_args(args):
     parser = misc.common_args_parser('Graph profits')
     # FIX: perhaps delete those backtesting options that are not feasible (shows up in -h)
     misc.backtesting_options(parser)
+    misc.preprocess_options(parser)
     misc.scripts_options(parser)
     return parser.parse_args(args)
 
@@ -86,7 +87,7 @@ def plot_profit(args) -> None:
                                  ticker_interval=strategy.ticker_interval,
                                  refresh_pairs=False,
                                  timerange=timerange)
-    dataframes = optimize.preprocess(tickers)
+    dataframes = optimize.preprocess(tickers, jobs=args.jobs, compact=args.compact)
 
     # NOTE: the dataframes are of unequal length,
     # 'dates' is an merged date array of them all.
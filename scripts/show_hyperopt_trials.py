@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""
+Lists the best trials of the hyperopt trials journal, also while hyperopt is running.
+Usage: python3 scripts/show_hyperopt_trials.py [--file user_data/hyperopt_trials.jsonl] [--top 10]
+"""
+import argparse
+import heapq
+import json
+import sys
+
+from hyperopt import STATUS_OK
+
+from freqtrade.optimize.journal import read_journal
+
+
+def main(argv) -> None:
+    parser = argparse.ArgumentParser(description='Show the best hyperopt trials')
+    parser.add_argument('--file', default='user_data/hyperopt_trials.jsonl',
+                        help='trials journal (default: %(default)s)')
+    parser.add_argument('--top', type=int, default=10,
+                        help='number of trials to show (default: %(default)d)')
+    args = parser.parse_args(argv)
+
+    count = 0
+    succeeded = []
+    for doc in read_journal(args.file):
+        count += 1
+        if doc['result']['status'] == STATUS_OK:
+            succeeded.append((doc['result']['loss'], doc['tid'], doc))
+    print('{} trials, {} succeeded'.format(count, len(succeeded)))
+
+    for loss, tid, doc in heapq.nsmallest(args.top, succeeded):
+        vals = {key: value[0] for key, value in doc['misc']['vals'].items() if value}
+        print('#{} loss {:.5f}: {}'.format(tid, loss, doc['result'].get('result', '')))
+        print('    ' + json.dumps(vals, sort_keys=True))
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -47,6 +47,10 @@ class TestStrategy(IStrategy):
     # Optimal ticker interval for the strategy
     ticker_interval = 5
 
+    # Number of candles the indicators need before their values are stable.
+    # When set, the bot only analyzes new candles and this warm-up window on each loop.
+    # warmup_candles = 400
+
     def populate_indicators(self, dataframe: DataFrame) -> DataFrame:
         """
         Adds several different TA indicators to the given DataFrame